@@ -7,24 +7,45 @@ __version__ = "3.0.0"
 __author__ = "Orange"
 __description__ = "Advanced security scanner with AST analysis, secret detection, and dependency scanning"
 
-from .types import (
-    Severity,
-    AnalysisMode,
-    SecurityIssue,
-    ScanResult
-)
-from .scanner import SkillScanner
-from .analyzers.regex_analyzer import RegexAnalyzer
-from .analyzers.ast_analyzer import ASTAnalyzer
-from .analyzers.secret_analyzer import SecretAnalyzer
-from .analyzers.dependency_analyzer import DependencyAnalyzer
-from .analyzers.taint_analyzer import TaintAnalyzer
-from .formatters.text_formatter import TextFormatter, ProgressTracker
-from .formatters.json_formatter import JsonFormatter
-from .formatters.markdown_formatter import MarkdownFormatter
-
-# v3.0: Config system
-from .config import ConfigLoader, Config, ConfigValidator
+# Public names are imported lazily (PEP 562) so that importing one
+# submodule, e.g. for the CLI, does not load every analyzer and formatter.
+_LAZY_ATTRS = {
+    'Severity': '.types',
+    'AnalysisMode': '.types',
+    'SecurityIssue': '.types',
+    'ScanResult': '.types',
+    'SkillScanner': '.scanner',
+    'RegexAnalyzer': '.analyzers.regex_analyzer',
+    'ASTAnalyzer': '.analyzers.ast_analyzer',
+    'SecretAnalyzer': '.analyzers.secret_analyzer',
+    'DependencyAnalyzer': '.analyzers.dependency_analyzer',
+    'TaintAnalyzer': '.analyzers.taint_analyzer',
+    'TextFormatter': '.formatters.text_formatter',
+    'ProgressTracker': '.formatters.text_formatter',
+    'JsonFormatter': '.formatters.json_formatter',
+    'MarkdownFormatter': '.formatters.markdown_formatter',
+    # v3.0: Config system
+    'ConfigLoader': '.config',
+    'Config': '.config',
+    'ConfigValidator': '.config',
+}
+
+
+def __getattr__(name):
+    """Import the scanner, analyzers, formatters and config classes on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache for subsequent lookups
+    return value
+
+
+def __dir__():
+    """List loaded names plus the lazily imported ones in _LAZY_ATTRS."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     '__version__',
@@ -4,7 +4,8 @@ AST Analyzer - Python Abstract Syntax Tree analysis.
 
 import ast
 import re
-from typing import List, Optional, Dict, Any
+import sys
+from typing import Iterator, List, Optional, Dict, Any
 from pathlib import Path
 
 from .base import BaseAnalyzer
@@ -12,59 +13,128 @@ from ..types import SecurityIssue, Severity, AnalysisMode
 from ..rules import TESTING_UTILITY_FILES, DOCUMENTATION_FILES
 
 
+# Generic dangerous builtins: function name -> (category, description)
+_DANGEROUS_FUNCS = {
+    "eval": ("command_injection", "eval() execution"),
+    "exec": ("command_injection", "exec() execution"),
+    "__import__": ("dynamic_import", "Dynamic import"),
+    "compile": ("command_injection", "compile() execution"),
+}
+
+# Sensitive paths for open(), in priority order: (group name, pattern, description)
+_SENSITIVE_OPEN_PATTERNS = [
+    ("ssh", r"\.ssh[/\\]", "SSH key access"),
+    ("pw", r"password", "Password file access"),
+    ("tok", r"token", "Token file access"),
+    ("sec", r"secret", "Secret file access"),
+    ("oc", r"\.openclaw[/\\]config", "OpenClaw config access"),
+    ("mem", r"MEMORY\.md|SOUL\.md|USER\.md", "Memory file access"),
+]
+_SENSITIVE_OPEN_DESCRIPTIONS = {
+    name: description for name, _, description in _SENSITIVE_OPEN_PATTERNS
+}
+# One anchored alternation of lookaheads: alternatives are tried in list
+# order, so the first rule matching anywhere in the path wins, as with a
+# loop of separate searches (a plain alternation would pick the leftmost).
+_SENSITIVE_OPEN_RE = re.compile(
+    "|".join(
+        f"(?=.*?(?P<{name}>{pattern}))" for name, pattern, _ in _SENSITIVE_OPEN_PATTERNS
+    ),
+    re.IGNORECASE | re.DOTALL,
+)
+
+
 class ASTAnalyzer(BaseAnalyzer):
     """AST Analyzer - Performs deep code structure analysis for Python files."""
 
+    uses_python_ast = True
+    trigger_literals = (
+        "eval", "exec", "compile", "__import__", "system", "popen",
+        "subprocess", "open", "pickle", "marshal", "shelve",
+    )
+
     def get_name(self) -> str:
         return "ASTAnalyzer"
 
-    def analyze(self, file_path: Path, content: str) -> List[SecurityIssue]:
-        """Analyze Python code using its Abstract Syntax Tree."""
-        issues = []
-
-        # Only analyze Python files
-        if file_path.suffix != ".py":
-            return issues
-
+    def analyze(
+        self, file_path: Path, content: str, tree: Optional[ast.AST] = None
+    ) -> List[SecurityIssue]:
+        """
+        Analyze Python code using its Abstract Syntax Tree.
+
+        Args:
+            file_path: Path to file being analyzed
+            content: File content
+            tree: Optional pre-parsed AST of content (parsed here if omitted)
+        """
         try:
-            tree = ast.parse(content)
-            analyzer = PythonASTVisitor(content, str(file_path.name), file_path)
-            analyzer.visit(tree)
-            issues.extend(analyzer.issues)
+            return list(self.analyze_iter(file_path, content, tree))
         except SyntaxError:
             # Skip AST analysis if there's a syntax error
-            pass
+            return []
         except Exception:
             # Skip on any other processing error
-            pass
+            return []
 
-        return issues
+    def analyze_iter(
+        self, file_path: Path, content: str, tree: Optional[ast.AST] = None
+    ) -> Iterator[SecurityIssue]:
+        """
+        Yield issues in analyze() order as the tree walk finds them.
 
-        try:
-            tree = ast.parse(content)
-            analyzer = PythonASTVisitor(content, str(file_path.name))
-            analyzer.visit(tree)
-            issues.extend(analyzer.issues)
-        except SyntaxError:
-            # Skip AST analysis if there's a syntax error
-            pass
-        except Exception:
-            # Skip on any other processing error
-            pass
+        Unlike analyze(), parse and processing errors propagate to the caller.
+        """
+        # Only analyze Python files
+        if file_path.suffix != ".py":
+            return
 
-        return issues
+        if tree is None:
+            tree = ast.parse(content)
+        visitor = PythonASTVisitor(content, str(file_path.name), file_path)
+        yield from visitor.iter_visit(tree)
 
 
-class PythonASTVisitor(ast.NodeVisitor):
+class PythonASTVisitor:
     """Custom AST visitor for identifying security patterns in Python code."""
 
     def __init__(self, content: str, filename: str, filepath: Optional[Path] = None):
         self.content = content
-        self.filename = filename
+        self.filename = sys.intern(filename)
         self.filepath = filepath or Path(filename)
         self.issues: List[SecurityIssue] = []
         self.lines = content.split("\n")
 
+    def visit(self, tree: ast.AST):
+        """Walk the tree, collecting every issue found in self.issues."""
+        self.issues.extend(list(self.iter_visit(tree)))
+
+    def iter_visit(self, tree: ast.AST) -> Iterator[SecurityIssue]:
+        """
+        Walk the tree depth-first in source order, dispatching on node type.
+
+        Issues are yielded as each node's handler reports them, and are not
+        kept in self.issues. An explicit stack replaces ast.NodeVisitor's
+        recursive generic_visit and its per-node getattr("visit_" + class
+        name) lookup.
+        """
+        dispatch = self._NODE_HANDLERS
+        iter_child_nodes = ast.iter_child_nodes
+        # Handlers append to self.issues; pass on and drop what each adds
+        issues = self.issues
+        reported = len(issues)
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            handler = dispatch.get(type(node))
+            if handler:
+                handler(self, node)
+                if len(issues) > reported:
+                    yield from issues[reported:]
+                    del issues[reported:]
+            children = list(iter_child_nodes(node))
+            children.reverse()
+            stack.extend(children)
+
     def _get_line(self, node: ast.AST) -> int:
         """Extract the line number from an AST node."""
         return getattr(node, "lineno", 1)
@@ -79,79 +149,73 @@ class PythonASTVisitor(ast.NodeVisitor):
 
     def _is_dangerous_call(self, func_name: str) -> tuple:
         """Check if a function name matches a known dangerous function."""
-        dangerous_funcs = {
-            "eval": ("command_injection", "eval() execution"),
-            "exec": ("command_injection", "exec() execution"),
-            "__import__": ("dynamic_import", "Dynamic import"),
-            "compile": ("command_injection", "compile() execution"),
-        }
-        return dangerous_funcs.get(func_name, None)
+        return _DANGEROUS_FUNCS.get(func_name)
 
     def visit_Call(self, node: ast.Call):
         """Analyze function calls for security risks."""
         func_name = self._get_func_name(node.func)
 
         if func_name:
-            # Check for generic dangerous functions
-            danger = self._is_dangerous_call(func_name)
-            if danger:
-                category, description = danger
-                # Check for variable arguments (suggests dynamic execution)
-                has_variable = any(
-                    not isinstance(arg, (ast.Constant, ast.Str)) for arg in node.args
+            handler = self._CALL_HANDLERS.get(func_name)
+            if handler:
+                handler(self, node, func_name)
+
+    def _handle_dangerous_call(self, node: ast.Call, func_name: str):
+        """Flag generic dangerous functions called with variable arguments."""
+        category, description = self._is_dangerous_call(func_name)
+        # Check for variable arguments (suggests dynamic execution)
+        has_variable = any(
+            not isinstance(arg, (ast.Constant, ast.Str)) for arg in node.args
+        )
+
+        if has_variable:
+            self.issues.append(
+                SecurityIssue(
+                    level=Severity.HIGH,
+                    category=category,
+                    description=sys.intern(f"{description} with variable"),
+                    file=self.filename,
+                    line=self._get_line(node),
+                    snippet=self._get_snippet(node),
+                    confidence=0.9,
                 )
+            )
 
-                if has_variable:
-                    self.issues.append(
-                        SecurityIssue(
-                            level=Severity.HIGH,
-                            category=category,
-                            description=f"{description} with variable",
-                            file=self.filename,
-                            line=self._get_line(node),
-                            snippet=self._get_snippet(node),
-                            confidence=0.9,
-                        )
-                    )
+    def _handle_os_call(self, node: ast.Call, func_name: str):
+        """Flag os.system and os.popen calls."""
+        if self._is_os_call(node.func):
+            self.issues.append(
+                SecurityIssue(
+                    level=Severity.HIGH,
+                    category="command_injection",
+                    description=sys.intern(f"os.{func_name}() call"),
+                    file=self.filename,
+                    line=self._get_line(node),
+                    snippet=self._get_snippet(node),
+                    confidence=0.85,
+                )
+            )
 
-            # Check for os.system and os.popen calls
-            if func_name in ["system", "popen"] and self._is_os_call(node.func):
+    def _handle_subprocess_call(self, node: ast.Call, func_name: str):
+        """Flag subprocess calls with shell=True."""
+        if self._is_subprocess_call(node.func) and self._has_shell_true(node):
+            # Skip if file is whitelisted (testing utilities)
+            if self.filepath.name not in TESTING_UTILITY_FILES:
                 self.issues.append(
                     SecurityIssue(
                         level=Severity.HIGH,
                         category="command_injection",
-                        description=f"os.{func_name}() call",
+                        description="subprocess with shell=True",
                         file=self.filename,
                         line=self._get_line(node),
                         snippet=self._get_snippet(node),
-                        confidence=0.85,
+                        confidence=0.95,
                     )
                 )
 
-            # Check for subprocess calls with shell=True
-            if func_name in ["call", "run", "Popen"] and self._is_subprocess_call(
-                node.func
-            ):
-                if self._has_shell_true(node):
-                    # Skip if file is whitelisted (testing utilities)
-                    if self.filepath.name not in TESTING_UTILITY_FILES:
-                        self.issues.append(
-                            SecurityIssue(
-                                level=Severity.HIGH,
-                                category="command_injection",
-                                description="subprocess with shell=True",
-                                file=self.filename,
-                                line=self._get_line(node),
-                                snippet=self._get_snippet(node),
-                                confidence=0.95,
-                            )
-                        )
-
-            # Check for open() calls on sensitive files
-            if func_name == "open":
-                self._check_open_call(node)
-
-        self.generic_visit(node)
+    def _handle_open_call(self, node: ast.Call, func_name: str):
+        """Check open() calls on sensitive files."""
+        self._check_open_call(node)
 
     def visit_Import(self, node: ast.Import):
         """Identify imports of modules known for unsafe deserialization."""
@@ -161,14 +225,15 @@ class PythonASTVisitor(ast.NodeVisitor):
                     SecurityIssue(
                         level=Severity.MEDIUM,
                         category="deserialization",
-                        description=f"{alias.name} import (unsafe deserialization)",
+                        description=sys.intern(
+                            f"{alias.name} import (unsafe deserialization)"
+                        ),
                         file=self.filename,
                         line=self._get_line(node),
                         snippet=self._get_snippet(node),
                         confidence=0.7,
                     )
                 )
-        self.generic_visit(node)
 
     def visit_ImportFrom(self, node: ast.ImportFrom):
         """Identify 'from ... import' statements for unsafe modules."""
@@ -183,7 +248,9 @@ class PythonASTVisitor(ast.NodeVisitor):
                 SecurityIssue(
                     level=Severity.MEDIUM,
                     category="deserialization",
-                    description=f"{node.module} import (unsafe deserialization)",
+                    description=sys.intern(
+                        f"{node.module} import (unsafe deserialization)"
+                    ),
                     file=self.filename,
                     line=self._get_line(node),
                     snippet=self._get_snippet(node),
@@ -191,8 +258,6 @@ class PythonASTVisitor(ast.NodeVisitor):
                 )
             )
 
-        self.generic_visit(node)
-
     def _get_func_name(self, node: ast.expr) -> Optional[str]:
         """Extract the function name from a Call node."""
         if isinstance(node, ast.Name):
@@ -219,10 +284,11 @@ class PythonASTVisitor(ast.NodeVisitor):
         """Check if a Call node contains the 'shell=True' keyword argument."""
         for keyword in node.keywords:
             if keyword.arg == "shell":
-                if isinstance(keyword.value, ast.Constant):
-                    return keyword.value.value is True
-                elif isinstance(keyword.value, ast.NameConstant):
-                    return keyword.value.value is True
+                # ast.NameConstant is a deprecated alias of ast.Constant (3.8+)
+                return (
+                    isinstance(keyword.value, ast.Constant)
+                    and keyword.value.value is True
+                )
         return False
 
     def _check_open_call(self, node: ast.Call):
@@ -234,27 +300,37 @@ class PythonASTVisitor(ast.NodeVisitor):
 
         # Check for hardcoded paths to sensitive files
         if isinstance(first_arg, ast.Constant) and isinstance(first_arg.value, str):
-            filepath = first_arg.value
-            sensitive_patterns = [
-                (r"\.ssh[/\\]", "SSH key access"),
-                (r"password", "Password file access"),
-                (r"token", "Token file access"),
-                (r"secret", "Secret file access"),
-                (r"\.openclaw[/\\]config", "OpenClaw config access"),
-                (r"MEMORY\.md|SOUL\.md|USER\.md", "Memory file access"),
-            ]
-
-            for pattern, description in sensitive_patterns:
-                if re.search(pattern, filepath, re.IGNORECASE):
-                    self.issues.append(
-                        SecurityIssue(
-                            level=Severity.HIGH,
-                            category="sensitive_file_access",
-                            description=description,
-                            file=self.filename,
-                            line=self._get_line(node),
-                            snippet=self._get_snippet(node),
-                            confidence=0.85,
-                        )
+            match = _SENSITIVE_OPEN_RE.match(first_arg.value)
+            if match:
+                self.issues.append(
+                    SecurityIssue(
+                        level=Severity.HIGH,
+                        category="sensitive_file_access",
+                        description=_SENSITIVE_OPEN_DESCRIPTIONS[match.lastgroup],
+                        file=self.filename,
+                        line=self._get_line(node),
+                        snippet=self._get_snippet(node),
+                        confidence=0.85,
                     )
-                    break
+                )
+
+    # Dispatch tables are built once with the class rather than per file.
+    # Handlers are plain functions, called with the visitor explicitly.
+
+    # Node checks keyed by node type
+    _NODE_HANDLERS = {
+        ast.Call: visit_Call,
+        ast.Import: visit_Import,
+        ast.ImportFrom: visit_ImportFrom,
+    }
+
+    # Call checks keyed by the called function's (attribute) name
+    _CALL_HANDLERS = {
+        **dict.fromkeys(_DANGEROUS_FUNCS, _handle_dangerous_call),
+        "system": _handle_os_call,
+        "popen": _handle_os_call,
+        "call": _handle_subprocess_call,
+        "run": _handle_subprocess_call,
+        "Popen": _handle_subprocess_call,
+        "open": _handle_open_call,
+    }
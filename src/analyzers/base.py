@@ -3,14 +3,38 @@ Base Analyzer Module
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 from pathlib import Path
 
 from ..types import SecurityIssue, AnalysisMode
 
 
 class BaseAnalyzer(ABC):
-    """Abstract base class for all security analyzers."""
+    """
+    Abstract base class for all security analyzers.
+
+    Regex conventions: walk every match with ``pattern.finditer(content)``,
+    which resumes after each hit, rather than re-searching sliced text;
+    use ``search()`` / ``match()`` when the first hit is all that matters;
+    and bound context checks with their ``pos`` / ``endpos`` arguments
+    instead of slicing, where anchors and lookarounds allow it.
+    """
+
+    # Analyzers that work on a parsed Python AST set this flag and accept an
+    # optional ``tree`` keyword in analyze(), so the scanner can parse each
+    # Python file once and share the tree between them.
+    uses_python_ast: bool = False
+    
+    # Analyzers that look up line numbers set this flag and accept an
+    # optional ``line_index`` keyword, so the scanner can build each file's
+    # newline index once and share it between them.
+    uses_line_index: bool = False
+    
+    # Identifiers of which at least one must appear in the source for the
+    # analyzer to report anything. When none appear, the scanner skips the
+    # analyzer (and the parse, if no other AST analyzer needs it). An empty
+    # tuple means the analyzer always runs.
+    trigger_literals: Tuple[str, ...] = ()
     
     def __init__(self, mode: AnalysisMode = AnalysisMode.STANDARD, config=None):
         self.mode = mode
@@ -30,7 +54,33 @@ class BaseAnalyzer(ABC):
         """
         pass
     
+    def analyze_iter(self, file_path: Path, content: str, **kwargs) -> Iterator[SecurityIssue]:
+        """
+        Yield detected issues one at a time, in the same order as analyze().
+        
+        The default delegates to analyze(); analyzers that find issues
+        incrementally override this and build analyze() on top of it.
+        """
+        yield from self.analyze(file_path, content, **kwargs)
+    
     @abstractmethod
     def get_name(self) -> str:
         """Get the identifier name of the analyzer."""
         pass
+    
+    def can_skip(self, content: str) -> bool:
+        """Return True if a literal prescan proves the analyzer would find nothing."""
+        # Python NFKC-normalizes identifiers, so non-ASCII source may spell
+        # a trigger differently; always analyze it.
+        if not self.trigger_literals or not content.isascii():
+            return False
+        return not any(literal in content for literal in self.trigger_literals)
+    
+    def cache_key(self, file_path: Path) -> Optional[str]:
+        """
+        Extra state, beyond the file content, that this analyzer's findings depend on.
+        
+        Used by the persistent scan cache. Return None to disable caching
+        of this analyzer's results for the given file.
+        """
+        return ""
@@ -7,6 +7,9 @@ using the Open Source Vulnerabilities (OSV) database.
 
 import ast
 import re
+import sys
+from collections import deque
+from functools import lru_cache
 from typing import List, Dict, Set, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass
@@ -17,6 +20,12 @@ from .base import BaseAnalyzer
 from ..types import SecurityIssue, Severity, AnalysisMode
 
 
+# Node types that can (transitively) hold import statements
+_STATEMENT_CONTAINERS = (ast.stmt, ast.excepthandler) + (
+    (ast.match_case,) if hasattr(ast, "match_case") else ()
+)
+
+
 @dataclass
 class PackageInfo:
     """Package information."""
@@ -28,6 +37,7 @@ class PackageInfo:
 
 # Known vulnerable packages (simplified for offline operation)
 # In production, this would query the OSV API
+# Read-only: _FIXED_VERSIONS below is derived from it once at import
 KNOWN_VULNERABILITIES: Dict[str, List[Dict]] = {
     "requests": [
         {
@@ -72,6 +82,52 @@ KNOWN_VULNERABILITIES: Dict[str, List[Dict]] = {
 }
 
 
+_REQUIREMENT_RE = re.compile(r"^([a-zA-Z0-9_-]+)\s*([<>=!~]+\s*[\d\.\*]+.*)?$")
+_AFFECTED_RE = re.compile(r"^([<>=!]+)\s*(\d+\.\d+(?:\.\d+)?)")
+
+
+@lru_cache(maxsize=None)
+def _parse_version(text: str) -> Optional[Version]:
+    """Parse a PEP 440 version once; None if invalid."""
+    try:
+        return Version(text)
+    except InvalidVersion:
+        return None
+
+
+def _parse_fixed_versions(affected_versions: List[str]) -> Tuple[Version, ...]:
+    """Versions that fix a vulnerability, taken from its "<X.Y.Z" affected ranges."""
+    fixed = []
+    for affected in affected_versions:
+        match = _AFFECTED_RE.match(affected)
+        if match and match.group(1) == "<":
+            version = _parse_version(match.group(2))
+            if version is not None:
+                fixed.append(version)
+    return tuple(fixed)
+
+
+# Fixed versions per package, one entry per vulnerability in list order.
+# Parsed once at import rather than for every import checked.
+_FIXED_VERSIONS: Dict[str, Tuple[Tuple[Version, ...], ...]] = {
+    name: tuple(
+        _parse_fixed_versions(vuln.get("affected_versions", [])) for vuln in vulns
+    )
+    for name, vulns in KNOWN_VULNERABILITIES.items()
+}
+
+
+@lru_cache(maxsize=None)
+def _installed_version(package_name: str) -> Optional[str]:
+    """Installed version of a distribution, looked up once per name."""
+    try:
+        import importlib.metadata
+
+        return importlib.metadata.version(package_name)
+    except Exception:
+        return None
+
+
 class DependencyAnalyzer(BaseAnalyzer):
     """
     Dependency vulnerability analyzer.
@@ -79,6 +135,9 @@ class DependencyAnalyzer(BaseAnalyzer):
     Scans Python imports and checks against known vulnerability databases.
     """
 
+    uses_python_ast = True
+    trigger_literals = ("import",)
+
     def __init__(self, mode: AnalysisMode = AnalysisMode.STANDARD, config=None):
         super().__init__(mode)
         self.config = config
@@ -91,6 +150,19 @@ class DependencyAnalyzer(BaseAnalyzer):
     def get_name(self) -> str:
         return "DependencyAnalyzer"
 
+    def cache_key(self, file_path: Path) -> Optional[str]:
+        """Findings also depend on the nearest requirements.txt."""
+        if file_path.suffix != ".py":
+            return ""
+        req_path = self._find_requirements_file(file_path)
+        if req_path is None:
+            return "-"
+        try:
+            stat = req_path.stat()
+        except OSError:
+            return None
+        return f"{req_path}:{stat.st_mtime_ns}:{stat.st_size}"
+
     def _find_requirements_file(self, file_path: Path) -> Optional[Path]:
         """Find requirements.txt in the skill directory."""
         current = file_path.parent
@@ -112,9 +184,7 @@ class DependencyAnalyzer(BaseAnalyzer):
                 line = line.strip()
                 if not line or line.startswith("#"):
                     continue
-                match = re.match(
-                    r"^([a-zA-Z0-9_-]+)\s*([<>=!~]+\s*[\d\.\*]+.*)?$", line
-                )
+                match = _REQUIREMENT_RE.match(line)
                 if match:
                     pkg_name = match.group(1).lower()
                     version_spec = match.group(2)
@@ -127,37 +197,32 @@ class DependencyAnalyzer(BaseAnalyzer):
             pass
         return specs
 
-    def _is_version_safe(self, vuln: Dict, specifiers: Optional[SpecifierSet]) -> bool:
+    def _is_version_safe(
+        self, fixed_versions: Tuple[Version, ...], specifiers: Optional[SpecifierSet]
+    ) -> bool:
         """Check if the version specifier satisfies safe version requirement."""
-        if not specifiers:
+        if not specifiers or not fixed_versions:
             return False
 
-        for affected in vuln.get("affected_versions", []):
-            match = re.match(r"^([<>=!]+)\s*(\d+\.\d+(?:\.\d+)?)", affected)
-            if match:
-                op, vuln_version = match.groups()
-                try:
-                    safe_version = Version(vuln_version)
-                    if op == "<":
-                        for spec in specifiers:
-                            if hasattr(spec, "version"):
-                                try:
-                                    spec_ver = Version(str(spec.version))
-                                    if spec_ver >= safe_version:
-                                        return True
-                                except InvalidVersion:
-                                    pass
-                except InvalidVersion:
-                    pass
+        for spec in specifiers:
+            if hasattr(spec, "version"):
+                spec_ver = _parse_version(str(spec.version))
+                if spec_ver is not None and any(
+                    spec_ver >= fixed for fixed in fixed_versions
+                ):
+                    return True
         return False
 
-    def analyze(self, file_path: Path, content: str) -> List[SecurityIssue]:
+    def analyze(
+        self, file_path: Path, content: str, tree: Optional[ast.AST] = None
+    ) -> List[SecurityIssue]:
         """
         Analyze Python file for vulnerable dependencies.
 
         Args:
             file_path: Path to file being analyzed
             content: File content
+            tree: Optional pre-parsed AST of content (parsed here if omitted)
 
         Returns:
             List of security issues
@@ -171,10 +236,11 @@ class DependencyAnalyzer(BaseAnalyzer):
         if file_path.suffix != ".py":
             return issues
 
-        try:
-            tree = ast.parse(content)
-        except SyntaxError:
-            return issues
+        if tree is None:
+            try:
+                tree = ast.parse(content)
+            except SyntaxError:
+                return issues
 
         # Extract imported packages
         packages = self._extract_imports(tree)
@@ -200,7 +266,18 @@ class DependencyAnalyzer(BaseAnalyzer):
         """Extract package imports from AST."""
         packages = []
 
-        for node in ast.walk(tree):
+        # Imports are statements, so only statement containers need to be
+        # visited; expression subtrees are skipped. Breadth-first order is
+        # kept so results are ordered as with ast.walk().
+        queue = deque([tree])
+        while queue:
+            node = queue.popleft()
+            queue.extend(
+                child
+                for child in ast.iter_child_nodes(node)
+                if isinstance(child, _STATEMENT_CONTAINERS)
+            )
+
             if isinstance(node, ast.Import):
                 for alias in node.names:
                     packages.append(
@@ -235,18 +312,19 @@ class DependencyAnalyzer(BaseAnalyzer):
             return issues
 
         vulns = KNOWN_VULNERABILITIES[package.name.lower()]
+        fixed = _FIXED_VERSIONS[package.name.lower()]
 
-        for vuln in vulns:
+        for vuln, fixed_versions in zip(vulns, fixed):
             # Check if version constraint satisfies safe version
-            if self._is_version_safe(vuln, specifiers):
+            if self._is_version_safe(fixed_versions, specifiers):
                 continue
 
             issues.append(
                 SecurityIssue(
                     level=vuln["severity"],
                     category="vulnerable_dependency",
-                    description=f"{vuln['id']}: {vuln['description']}",
-                    file=str(file_path.name),
+                    description=sys.intern(f"{vuln['id']}: {vuln['description']}"),
+                    file=sys.intern(file_path.name),
                     line=package.line,
                     snippet=f"import {package.name}",
                     confidence=0.8,
@@ -261,12 +339,7 @@ class DependencyAnalyzer(BaseAnalyzer):
 
         In production, this would use importlib.metadata or pkg_resources.
         """
-        try:
-            import importlib.metadata
-
-            return importlib.metadata.version(package_name)
-        except Exception:
-            return None
+        return _installed_version(package_name)
 
 
 # Legacy package names that are known to be risky
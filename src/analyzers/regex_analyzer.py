@@ -2,18 +2,31 @@
 Regex-based Security Analyzer
 """
 
+import heapq
+import io
 import re
-from typing import List
+import sys
+import tokenize
+from bisect import bisect_left, bisect_right
+from typing import Iterator, List, Match, Optional, Pattern, Tuple
 from pathlib import Path
 
+try:
+    from re import _parser as _sre_parser  # Python 3.11+
+except ImportError:  # pragma: no cover - depends on the Python version
+    import sre_parse as _sre_parser
+
 from .base import BaseAnalyzer
 from ..types import SecurityIssue, Severity, AnalysisMode
+from ..utils.line_index import LineIndex
+from ..utils.regex_backend import compile_pattern
 from ..rules import (
     HIGH_RISK_PATTERNS,
     MEDIUM_RISK_PATTERNS,
     LOW_RISK_PATTERNS,
     SUSPICIOUS_PATTERNS,
-    SAFE_SERVICES,
+    SAFE_SERVICE_HOSTS,
+    SAFE_SERVICE_SUFFIXES,
     DEFAULT_WHITELIST_PATTERNS,
     DOCUMENTATION_FILES,
     TESTING_UTILITY_FILES,
@@ -22,9 +35,267 @@ from ..rules import (
 )
 
 
+def _literal_prefix(pattern: str) -> str:
+    """
+    Lowercased literal text that every match of a pattern starts with.
+
+    Empty if the pattern starts with anything other than plain characters
+    (a class, group, repeat or top-level alternation), or if the literal
+    text is not ASCII.
+    """
+    chars = []
+    for op, av in _sre_parser.parse(pattern):
+        if op != _sre_parser.LITERAL:
+            break
+        chars.append(chr(av))
+    prefix = "".join(chars).lower()
+    return prefix if prefix.isascii() else ""
+
+
+def _required_literal(pattern: str) -> str:
+    """
+    Lowercased longest literal run that every match of a pattern contains.
+
+    Only top-level plain characters count, so text inside groups, repeats
+    or alternations never does. Empty if there is none or it is not ASCII.
+    """
+    runs = [[]]
+    for op, av in _sre_parser.parse(pattern):
+        if op == _sre_parser.LITERAL:
+            runs[-1].append(chr(av))
+        else:
+            runs.append([])
+    best = "".join(max(runs, key=len)).lower()
+    return best if best.isascii() else ""
+
+
+def _compile_rule_table(patterns: dict) -> List[Tuple[Pattern, str, str, str]]:
+    """Flatten a {category: [(pattern, description)]} table into compiled rules."""
+    return [
+        (
+            compile_pattern(pattern, re.IGNORECASE),
+            category,
+            description,
+            _literal_prefix(pattern),
+        )
+        for category, pattern_list in patterns.items()
+        for pattern, description in pattern_list
+    ]
+
+
+def _iter_rule_matches(
+    rules: List[Tuple[Pattern, str, str, str]], content: str
+) -> Iterator[Tuple[Match, str, str]]:
+    """
+    Walk the matches of every rule in a severity bucket in a single, position-ordered pass.
+
+    Each rule keeps its own finditer (so overlapping matches from different rules are
+    all reported), and the per-rule streams are merged lazily by match offset.
+    """
+    streams = [
+        _tag_matches(pattern, category, description, content)
+        for pattern, category, description, _ in rules
+    ]
+    return heapq.merge(*streams, key=lambda item: item[0].start())
+
+
+def _tag_matches(
+    pattern: Pattern, category: str, description: str, content: str
+) -> Iterator[Tuple[Match, str, str]]:
+    """Yield a rule's matches tagged with its category and description."""
+    for match in pattern.finditer(content):
+        yield match, category, description
+
+
+# Pre-compiled rule tables (avoids per-file lookups in the re module cache)
+_COMPILED_HIGH = _compile_rule_table(HIGH_RISK_PATTERNS)
+_COMPILED_MEDIUM = _compile_rule_table(MEDIUM_RISK_PATTERNS)
+_COMPILED_LOW = _compile_rule_table(LOW_RISK_PATTERNS)
+# Suspicious URL rules are mostly a host keyword after "https?://[^/\s]*";
+# the keyword lets files without it skip the rule's finditer pass
+_COMPILED_SUSPICIOUS = [
+    (compile_pattern(pattern, re.IGNORECASE), description, _required_literal(pattern))
+    for pattern, description in SUSPICIOUS_PATTERNS
+]
+# Literal substrings (casefolded) that must be present for a whitelist pattern to
+# match. Checking these first lets most context windows skip the regex entirely.
+# Patterns without an entry (e.g. pure character classes) are always searched.
+_WHITELIST_ANCHORS = {
+    r'AGENTS\.md["\']?\s*[`\n]': ("agents.md",),
+    r'MEMORY\.md["\']?\s*[`\n]': ("memory.md",),
+    r'SOUL\.md["\']?\s*[`\n]': ("soul.md",),
+    r'USER\.md["\']?\s*[`\n]': ("user.md",),
+    r'TOOLS\.md["\']?\s*[`\n]': ("tools.md",),
+    r"Configure in `AGENTS\.md`": ("configure in `agents.md`",),
+    r"registered slash commands in AGENTS\.md": ("registered slash commands",),
+    r"# .*testing.*\n.*subprocess.*shell\s*=\s*True": ("subprocess",),
+    r"# .*server.*\n.*subprocess.*shell\s*=\s*True": ("subprocess",),
+    r"with_server\.py": ("with_server.py",),
+    r"test_.*\.py": ("test_",),
+    r"_test\.py": ("_test.py",),
+    r'"integrity"\s*:\s*"sha(256|384|512)-[A-Za-z0-9+/=]+': ('"integrity"',),
+    r"sha(256|384|512)-[A-Za-z0-9+/=]{40,}": ("sha",),
+    r"your[_-]?(api[_-]?key|secret|token|password)[_-]?here": ("your",),
+    r"REPLACE[_-]?ME": ("replace",),
+    r"xxx+": ("xxx",),
+    r"sk-[a-zA-Z0-9_]*\.{3}": ("sk-",),
+    r"<[A-Z_]+>": ("<",),
+    r"\$\{[^}]+\}": ("${",),
+}
+
+_COMPILED_WHITELIST = [
+    (
+        re.compile(pattern, re.IGNORECASE | re.DOTALL),
+        _WHITELIST_ANCHORS.get(pattern),
+    )
+    for pattern in DEFAULT_WHITELIST_PATTERNS
+]
+_COMPILED_PLACEHOLDERS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in PLACEHOLDER_PATTERNS
+]
+
+# Context markers of regex/pattern definitions (case-sensitive literals)
+_PATTERN_DEFINITION_INDICATORS = [
+    "PATTERNS",
+    "patterns",
+    "regex",
+    "PATTERN",
+    "r'",
+    'r"',
+    "re.compile",
+    ".compile(",
+]
+_PATTERN_DEFINITION_RE = re.compile(
+    "|".join(map(re.escape, _PATTERN_DEFINITION_INDICATORS))
+)
+
+# Characters that change quote state in _is_in_string_literal
+_QUOTE_OR_ESCAPE_RE = re.compile(r"[\\'\"]")
+
+# Commands, paths and credentials reach their calls as string literals, so
+# high-risk matches are reported even when they sit inside a string
+_STRING_PAYLOAD_CATEGORIES = frozenset(HIGH_RISK_PATTERNS)
+
+# Shell scripts and config files quote the commands they run, so no match
+# in them is skipped for sitting inside a string
+_QUOTED_PAYLOAD_SUFFIXES = frozenset(
+    {".sh", ".bash", ".zsh", ".fish", ".json", ".yaml", ".yml"}
+)
+
+# i18n words marking documentation lines
+_I18N_DOC_RE = re.compile("配置|设置|示例|请将|填入|你的|密钥")
+
+# Context words that mark a match as example/documentation code (lowercase)
+_EXAMPLE_INDICATORS = [
+    "example",
+    "danger:",
+    "caution:",
+    "warning:",
+    "bad:",
+    "wrong:",
+    "unsafe:",
+    "risk:",
+    "pattern",
+    "todo:",
+    "note:",
+    "security notice",
+    # i18n patterns (Chinese, Japanese, Korean)
+    "示例",
+    "配置",
+    "设置",
+    "例",
+    "例如",
+    "注意",
+    "警告",
+    "请将",
+    "填入",
+    "你的",
+    "密钥",
+    "替换",
+]
+_EXAMPLE_INDICATORS_RE = re.compile("|".join(map(re.escape, _EXAMPLE_INDICATORS)))
+
+# Hostname of a "scheme://" URL, after any userinfo; stops at a port,
+# path, query, quote or any other character not valid in a hostname
+_URL_HOST_RE = re.compile(
+    r"[a-z][a-z0-9+.-]*://(?:[^/?#@\s]*@)?([a-z0-9.-]*)", re.IGNORECASE | re.ASCII
+)
+
+# Markdown code fence at the start of a line (leading whitespace allowed)
+_CODE_FENCE_RE = re.compile(r"^[^\S\n]*```", re.MULTILINE)
+
+
+# Token types that delimit string literals (f-strings are split on 3.12+)
+_FSTRING_START = getattr(tokenize, "FSTRING_START", None)
+_FSTRING_END = getattr(tokenize, "FSTRING_END", None)
+
+
+class PythonStringSpans:
+    """
+    Offsets of string literals in Python source, tokenized on demand.
+
+    Spans are kept as sorted, non-overlapping (start, end) offsets so that a
+    position can be classified with a single bisect. The tokenizer only runs
+    as far as the largest position queried so far, so files whose matches
+    all sit early never pay for tokenizing the rest.
+    """
+
+    def __init__(self, content: str, line_index: LineIndex):
+        self.content = content
+        self.line_index = line_index
+        self._spans = self._iter_spans()
+        self._exhausted = False
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+
+    def _iter_spans(self) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) offsets of string literals in source order."""
+        line_offsets = [0] + [offset + 1 for offset in self.line_index.newlines]
+        fstring_depth = 0
+        fstring_start = 0
+
+        try:
+            for token in tokenize.generate_tokens(io.StringIO(self.content).readline):
+                if token.type == tokenize.STRING and not fstring_depth:
+                    yield (
+                        line_offsets[token.start[0] - 1] + token.start[1],
+                        line_offsets[token.end[0] - 1] + token.end[1],
+                    )
+                elif token.type == _FSTRING_START:
+                    if not fstring_depth:
+                        fstring_start = line_offsets[token.start[0] - 1] + token.start[1]
+                    fstring_depth += 1
+                elif token.type == _FSTRING_END:
+                    fstring_depth -= 1
+                    if not fstring_depth:
+                        yield fstring_start, line_offsets[token.end[0] - 1] + token.end[1]
+        except (tokenize.TokenError, SyntaxError):
+            # Keep the spans found before the tokenizer gave up
+            pass
+
+    def _extend(self, position: int) -> None:
+        """Tokenize until every span starting at or before position is known."""
+        for start, end in self._spans:
+            self._starts.append(start)
+            self._ends.append(end)
+            if start > position:
+                return
+        self._exhausted = True
+
+    def contains(self, position: int) -> bool:
+        """Return True if position lies inside a string literal."""
+        starts = self._starts
+        if not self._exhausted and (not starts or starts[-1] <= position):
+            self._extend(position)
+        index = bisect_right(starts, position) - 1
+        return index >= 0 and position < self._ends[index]
+
+
 class RegexAnalyzer(BaseAnalyzer):
     """Regex Analyzer - Performs rapid pattern matching for known security risks."""
 
+    uses_line_index = True
+
     def get_name(self) -> str:
         return "RegexAnalyzer"
 
@@ -32,94 +303,90 @@ class RegexAnalyzer(BaseAnalyzer):
         """Check if file is a lock file that should have special handling."""
         return file_path.name in LOCK_FILES
 
-    def _is_in_string_literal(self, content: str, position: int) -> bool:
+    def _is_in_string_literal(
+        self,
+        content: str,
+        position: int,
+        line_index: LineIndex,
+        string_spans: Optional[PythonStringSpans] = None,
+    ) -> bool:
         """Determine if a given position is inside a string literal."""
-        lines_before = content[:position].split("\n")
-        current_line = lines_before[-1] if lines_before else ""
-
-        single_quotes = current_line.count("'") - current_line.count("'")
-        double_quotes = current_line.count('"') - current_line.count('"')
-
-        return single_quotes % 2 == 1 or double_quotes % 2 == 1
+        # Python sources are classified exactly from their tokens
+        if string_spans is not None:
+            return string_spans.contains(position)
+
+        # Track quote state over the current line up to the match, honouring
+        # backslash escapes; a quote of the other kind is literal text
+        line_start = line_index.line_start(position)
+        quote = None
+        index = line_start
+        while True:
+            found = _QUOTE_OR_ESCAPE_RE.search(content, index, position)
+            if found is None:
+                return quote is not None
+            char = found.group()
+            index = found.end()
+            if char == "\\":
+                index += 1
+            elif quote is None:
+                quote = char
+            elif char == quote:
+                quote = None
 
     def _is_pattern_definition(self, content: str, position: int) -> bool:
         """Check if the context suggests the match is part of a pattern definition."""
-        context = content[max(0, position - 100) : position + 100]
-        indicators = [
-            "PATTERNS",
-            "patterns",
-            "regex",
-            "PATTERN",
-            "r'",
-            'r"',
-            "re.compile",
-            ".compile(",
-        ]
-        return any(ind in context for ind in indicators)
-
-    def _is_example_code(self, content: str, position: int) -> bool:
+        start = max(0, position - 100)
+        return _PATTERN_DEFINITION_RE.search(content, start, position + 100) is not None
+
+    def _is_example_code(
+        self, content: str, position: int, content_lower: Optional[str] = None
+    ) -> bool:
         """Identify if the match is likely inside example or documentation code."""
         start = max(0, position - 200)
         end = min(len(content), position + 200)
-        context = content[start:end].lower()
-
-        indicators = [
-            "example",
-            "danger:",
-            "caution:",
-            "warning:",
-            "bad:",
-            "wrong:",
-            "unsafe:",
-            "risk:",
-            "pattern",
-            "todo:",
-            "note:",
-            "security notice",
-            # i18n patterns (Chinese, Japanese, Korean)
-            "示例",
-            "配置",
-            "设置",
-            "例",
-            "例如",
-            "注意",
-            "警告",
-            "请将",
-            "填入",
-            "你的",
-            "密钥",
-            "替换",
-        ]
-
-        if any(ind in context for ind in indicators):
+
+        # Search the window in place within the file's lowercased text; lower
+        # just the window when no offset-aligned lowercase copy is available
+        if content_lower is None:
+            context = content[start:end].lower()
+            start, end = 0, len(context)
+        else:
+            context = content_lower
+
+        if _EXAMPLE_INDICATORS_RE.search(context, start, end):
             return True
 
         # Check for placeholder patterns
-        for pattern in PLACEHOLDER_PATTERNS:
-            if __import__("re").search(pattern, context, __import__("re").IGNORECASE):
+        for pattern in _COMPILED_PLACEHOLDERS:
+            if pattern.search(context, start, end):
                 return True
 
         return False
 
-    def _is_safe_service(self, url: str) -> bool:
-        """Verify if a URL belongs to a whitelisted safe service."""
-        return any(service in url for service in SAFE_SERVICES)
+    def _is_safe_service(self, content: str, position: int = 0) -> bool:
+        """Verify if the URL at position is hosted by a whitelisted safe service."""
+        # Rule matches may end mid-host, so read the full host from content;
+        # substrings elsewhere in the URL (api.openai.com.evil.io) don't count
+        found = _URL_HOST_RE.match(content, position)
+        if found is None:
+            return False
+        host = found.group(1).lower().rstrip(".")
+        return host in SAFE_SERVICE_HOSTS or host.endswith(SAFE_SERVICE_SUFFIXES)
 
     def _is_whitelisted_pattern(
-        self, content: str, position: int, file_path: Path
+        self, content: str, position: int, file_path: Path, line_index: LineIndex
     ) -> bool:
         """Check if the match is whitelisted based on context and file type."""
         context_start = max(0, position - 150)
         context_end = min(len(content), position + 150)
         context = content[context_start:context_end]
 
-        # Check default whitelist patterns
-        for whitelist_pattern in DEFAULT_WHITELIST_PATTERNS:
-            if __import__("re").search(
-                whitelist_pattern,
-                context,
-                __import__("re").IGNORECASE | __import__("re").DOTALL,
-            ):
+        # Check default whitelist patterns (cheap literal anchor test first)
+        folded = context.casefold()
+        for whitelist_pattern, anchors in _COMPILED_WHITELIST:
+            if anchors is not None and not any(a in folded for a in anchors):
+                continue
+            if whitelist_pattern.search(context):
                 return True
 
         # Lock files: Skip most security checks for package-lock.json, yarn.lock, etc.
@@ -130,7 +397,7 @@ class RegexAnalyzer(BaseAnalyzer):
         # Documentation files: Allow references to memory files
         if file_path.name in DOCUMENTATION_FILES:
             # Check if this is just a documentation reference (not code)
-            if self._is_documentation_reference(content, position):
+            if self._is_documentation_reference(content, position, line_index):
                 return True
 
         # Testing utility files: Allow shell=True for subprocess
@@ -140,15 +407,17 @@ class RegexAnalyzer(BaseAnalyzer):
 
         return False
 
-    def _is_documentation_reference(self, content: str, position: int) -> bool:
+    def _is_documentation_reference(
+        self, content: str, position: int, line_index: LineIndex
+    ) -> bool:
         """Determine if the match is a documentation reference vs actual code."""
-        lines_before = content[:position].split("\n")
+        line_start = line_index.line_start(position)
 
-        # Check if we're inside a code block
-        code_block_count = 0
-        for line in lines_before:
-            if line.strip().startswith("```"):
-                code_block_count += 1
+        # Check if we're inside a code block; a fence opening the current
+        # line counts only if it ends before the match position
+        code_block_count = bisect_left(line_index.offsets_of(_CODE_FENCE_RE), line_start)
+        if _CODE_FENCE_RE.match(content, line_start, position):
+            code_block_count += 1
 
         # If even number of code blocks before position, we're outside code block
         # This means it's just documentation text
@@ -156,8 +425,7 @@ class RegexAnalyzer(BaseAnalyzer):
             return True
 
         # Check if the line contains just a reference (not an actual file operation)
-        current_line = lines_before[-1] if lines_before else ""
-
+        current_line = content[line_start:position]
         # It's a reference if it's in backticks or quotes (documentation style)
         if "`" in current_line or '"' in current_line or "'" in current_line:
             # But not if it's an open() call
@@ -165,120 +433,151 @@ class RegexAnalyzer(BaseAnalyzer):
                 return True
 
         # Check for placeholder patterns that indicate documentation examples
-        for pattern in PLACEHOLDER_PATTERNS:
-            if __import__("re").search(
-                pattern, current_line, __import__("re").IGNORECASE
-            ):
+        for pattern in _COMPILED_PLACEHOLDERS:
+            if pattern.search(current_line):
                 return True
 
         # Check for i18n documentation patterns
-        i18n_indicators = ["配置", "设置", "示例", "请将", "填入", "你的", "密钥"]
-        if any(ind in current_line for ind in i18n_indicators):
-            return True
-
-        return False
-
-    def _get_snippet(self, content: str, position: int, context: int = 50) -> str:
-        """Extract a short code snippet around the identified position."""
-        start = max(0, position - context)
-        end = min(len(content), position + context)
-        snippet = content[start:end].replace("\n", " ").strip()
-        return snippet[:100] + "..." if len(snippet) > 100 else snippet
+        return _I18N_DOC_RE.search(current_line) is not None
+
+    def _get_snippet(
+        self,
+        content: str,
+        line_start: int,
+        line_end: int,
+        position: int,
+        context: int = 50,
+    ) -> str:
+        """Extract a short snippet around the identified position, within its line."""
+        start = max(line_start, position - context)
+        end = min(line_end, position + context)
+        return content[start:end].strip()
+
+    def _iter_pattern_issues(
+        self,
+        content: str,
+        patterns: list,
+        severity: Severity,
+        file_path: Path,
+        line_index: LineIndex,
+        string_spans: Optional[PythonStringSpans] = None,
+        content_lower: Optional[str] = None,
+        skip_strings: bool = True,
+    ) -> Iterator[SecurityIssue]:
+        """Walk all matches of a severity bucket in order and yield security issues."""
+        relative_path = sys.intern(file_path.name)
+
+        # Skip lock files for most patterns; in testing utility files every
+        # rule match is whitelisted, so don't walk (or classify) any of them
+        if self._is_lock_file(file_path) or file_path.name in TESTING_UTILITY_FILES:
+            return
+
+        # In ASCII content a rule can only match where its literal prefix
+        # occurs (case-insensitively); skip rules whose prefix is absent.
+        # Non-ASCII text can case-fold onto ASCII (e.g. "\u017f" matches
+        # "s"), so it always runs every rule.
+        if content_lower is not None and content.isascii():
+            patterns = [rule for rule in patterns if rule[3] in content_lower]
+
+        for match, category, description in _iter_rule_matches(patterns, content):
+            pos = match.start()
+
+            # Skip matches in string literals (likely false positives),
+            # unless a quoted string is how the risk is expressed
+            if (
+                skip_strings
+                and category not in _STRING_PAYLOAD_CATEGORIES
+                and self._is_in_string_literal(content, pos, line_index, string_spans)
+            ):
+                continue
+
+            # Skip matches in pattern definitions
+            if self._is_pattern_definition(content, pos):
+                continue
+
+            # Skip matches in example or documentation code
+            if self._is_example_code(content, pos, content_lower):
+                continue
+
+            # Skip whitelisted patterns (v3.0+)
+            if self._is_whitelisted_pattern(content, pos, file_path, line_index):
+                continue
+
+            line_num, line_start, line_end = line_index.locate(pos)
+
+            yield SecurityIssue(
+                level=severity,
+                category=category,
+                description=description,
+                file=relative_path,
+                line=line_num,
+                snippet=self._get_snippet(content, line_start, line_end, pos),
+                confidence=0.8,
+            )
 
-    def _check_patterns(
-        self, content: str, patterns: dict, severity: Severity, file_path: Path
+    def analyze(
+        self, file_path: Path, content: str, line_index: Optional[LineIndex] = None
     ) -> List[SecurityIssue]:
-        """Iterate through patterns and identify security issues."""
-        issues = []
-        relative_path = file_path.name
-
-        for category, pattern_list in patterns.items():
-            for pattern, description in pattern_list:
-                for match in re.finditer(pattern, content, re.IGNORECASE):
-                    pos = match.start()
-
-                    # Skip lock files for most patterns
-                    if self._is_lock_file(file_path):
-                        continue
-
-                    # Skip matches in string literals (likely false positives)
-                    if self._is_in_string_literal(content, pos):
-                        continue
-
-                    # Skip matches in pattern definitions
-                    if self._is_pattern_definition(content, pos):
-                        continue
-
-                    # Skip matches in example or documentation code
-                    if self._is_example_code(content, pos):
-                        continue
-
-                    # Skip whitelisted patterns (v3.0+)
-                    if self._is_whitelisted_pattern(content, pos, file_path):
-                        continue
-
-                    line_num = content[:pos].count("\n") + 1
-
-                    issues.append(
-                        SecurityIssue(
-                            level=severity,
-                            category=category,
-                            description=description,
-                            file=str(relative_path),
-                            line=line_num,
-                            snippet=self._get_snippet(content, pos),
-                            confidence=0.8,
-                        )
-                    )
-
-        return issues
-
-    def analyze(self, file_path: Path, content: str) -> List[SecurityIssue]:
         """Analyze file content using regular expressions."""
-        issues = []
+        return list(self.analyze_iter(file_path, content, line_index))
+
+    def analyze_iter(
+        self, file_path: Path, content: str, line_index: Optional[LineIndex] = None
+    ) -> Iterator[SecurityIssue]:
+        """Yield issues in report order as they are found."""
+        if line_index is None:
+            line_index = LineIndex(content)
+        string_spans = None
+        if file_path.suffix == ".py":
+            string_spans = PythonStringSpans(content, line_index)
+        skip_strings = file_path.suffix not in _QUOTED_PAYLOAD_SUFFIXES
+
+        # Lowercase once per file; only usable while offsets stay aligned
+        content_lower = content.lower()
+        if len(content_lower) != len(content):
+            content_lower = None
 
         # High Risk Patterns
-        issues.extend(
-            self._check_patterns(content, HIGH_RISK_PATTERNS, Severity.HIGH, file_path)
+        yield from self._iter_pattern_issues(
+            content, _COMPILED_HIGH, Severity.HIGH, file_path, line_index,
+            string_spans, content_lower, skip_strings,
         )
 
         # Medium Risk Patterns (Standard/Deep mode)
         if self.mode in [AnalysisMode.STANDARD, AnalysisMode.DEEP]:
-            issues.extend(
-                self._check_patterns(
-                    content, MEDIUM_RISK_PATTERNS, Severity.MEDIUM, file_path
-                )
+            yield from self._iter_pattern_issues(
+                content, _COMPILED_MEDIUM, Severity.MEDIUM, file_path, line_index,
+                string_spans, content_lower, skip_strings,
             )
 
         # Low Risk Patterns (Deep mode only)
         if self.mode == AnalysisMode.DEEP:
-            issues.extend(
-                self._check_patterns(
-                    content, LOW_RISK_PATTERNS, Severity.LOW, file_path
-                )
+            yield from self._iter_pattern_issues(
+                content, _COMPILED_LOW, Severity.LOW, file_path, line_index,
+                string_spans, content_lower, skip_strings,
             )
 
-        # Suspicious URL Detection
-        if self.mode in [AnalysisMode.STANDARD, AnalysisMode.DEEP]:
-            for pattern, description in SUSPICIOUS_PATTERNS:
-                for match in re.finditer(pattern, content, re.IGNORECASE):
-                    url = match.group(0)
-                    if self._is_safe_service(url):
+        # Suspicious URL Detection (every pattern matches a "scheme://" URL)
+        if self.mode in [AnalysisMode.STANDARD, AnalysisMode.DEEP] and "://" in content:
+            file_name = sys.intern(file_path.name)
+            rules = _COMPILED_SUSPICIOUS
+            # Same case-folding caveat as the rule tables: ASCII text only
+            if content_lower is not None and content.isascii():
+                rules = [rule for rule in rules if rule[2] in content_lower]
+            for pattern, description, _ in rules:
+                for match in pattern.finditer(content):
+                    pos = match.start()
+                    if self._is_safe_service(content, pos):
                         continue
 
-                    pos = match.start()
-                    line_num = content[:pos].count("\n") + 1
-
-                    issues.append(
-                        SecurityIssue(
-                            level=Severity.MEDIUM,
-                            category="suspicious_url",
-                            description=description,
-                            file=str(file_path.name),
-                            line=line_num,
-                            snippet=self._get_snippet(content, pos),
-                            confidence=0.7,
-                        )
-                    )
+                    line_num, line_start, line_end = line_index.locate(pos)
 
-        return issues
+                    yield SecurityIssue(
+                        level=Severity.MEDIUM,
+                        category="suspicious_url",
+                        description=description,
+                        file=file_name,
+                        line=line_num,
+                        snippet=self._get_snippet(content, line_start, line_end, pos),
+                        confidence=0.7,
+                    )
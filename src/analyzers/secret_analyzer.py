@@ -8,12 +8,20 @@ Detects hardcoded secrets, API keys, passwords, and tokens using:
 """
 
 import re
-from typing import List, Dict, Tuple, Optional
+import sys
+from typing import List, Dict, Tuple, Optional, Set
 from pathlib import Path
 
 from .base import BaseAnalyzer
 from ..types import SecurityIssue, Severity, AnalysisMode
 from ..utils.entropy import EntropyCalculator
+from ..utils.line_index import LineIndex
+from ..utils.regex_backend import compile_pattern
+
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional accelerator
+    hyperscan = None
 
 
 # Secret detection patterns
@@ -117,6 +125,118 @@ PLACEHOLDER_PATTERNS = [
 ]
 
 
+# Compiled forms of the tables above, built once at import
+_COMPILED_SECRET_PATTERNS = [
+    (compile_pattern(pattern, re.IGNORECASE), description, severity)
+    for patterns in SECRET_PATTERNS.values()
+    for pattern, description, severity in patterns
+]
+# Union of all secret patterns. It finds a match exactly when at least one
+# pattern matches, so lines it rejects can skip the per-pattern scans; the
+# individual patterns still run on hits to keep every (overlapping) match.
+_ANY_SECRET_RE = compile_pattern(
+    "|".join(
+        f"(?:{pattern})"
+        for patterns in SECRET_PATTERNS.values()
+        for pattern, _, _ in patterns
+    ),
+    re.IGNORECASE,
+)
+
+# Hyperscan database of all secret patterns, compiled on first use
+_hs_database = None
+_hs_unavailable = hyperscan is None
+# Characters where Python's and Hyperscan's \s disagree on ASCII input
+_HS_WHITESPACE_MISMATCH_RE = re.compile(r"[\x1c-\x1f]")
+
+
+def _hyperscan_candidate_lines(
+    content: str, line_index: LineIndex
+) -> Optional[Set[int]]:
+    """
+    Find the lines that may contain a secret pattern match in one pass.
+
+    Hyperscan scans the whole file for all patterns at once and reports the
+    end of every match. A match confined to one line ends on that line, so
+    the returned set contains every line the per-line scan would match
+    (plus, harmlessly, lines where a multi-line match ends).
+
+    Returns:
+        Set of 1-based line numbers, or None if Hyperscan is unavailable or
+        cannot be trusted for this content (non-ASCII text, where \\w and
+        case folding differ from Python's re)
+    """
+    global _hs_database, _hs_unavailable
+
+    if _hs_unavailable or not content.isascii():
+        return None
+    if _HS_WHITESPACE_MISMATCH_RE.search(content):
+        return None
+
+    if _hs_database is None:
+        expressions = [
+            pattern.encode("ascii")
+            for patterns in SECRET_PATTERNS.values()
+            for pattern, _, _ in patterns
+        ]
+        try:
+            database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            database.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                elements=len(expressions),
+                flags=[hyperscan.HS_FLAG_CASELESS] * len(expressions),
+            )
+        except Exception:
+            _hs_unavailable = True
+            return None
+        _hs_database = database
+
+    lines: Set[int] = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        lines.add(line_index.line_number(end - 1))
+
+    _hs_database.scan(content.encode("ascii"), match_event_handler=on_match)
+    return lines
+
+
+def _pattern_candidate_lines(content: str, line_index: LineIndex) -> Set[int]:
+    """
+    Find the lines that may contain a secret pattern match.
+
+    Without Hyperscan the combined pattern is searched over the whole file.
+    After a hit the search resumes on the next line, so a match running
+    past the end of its line cannot hide a match starting on a later one.
+    """
+    lines = _hyperscan_candidate_lines(content, line_index)
+    if lines is not None:
+        return lines
+
+    return set(line_index.matched_lines(_ANY_SECRET_RE))
+
+
+_COMPILED_FALSE_POSITIVES = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in FALSE_POSITIVE_PATTERNS + PLACEHOLDER_PATTERNS
+]
+_INTEGRITY_HASH_RE = re.compile(INTEGRITY_HASH_PATTERN)
+_INTEGRITY_PREFIX_RE = re.compile(r"^sha(256|384|512)-")
+
+# Quoted strings made of characters typical for keys and tokens
+_CANDIDATE_STRING_RE = re.compile(r'["\']([A-Za-z0-9_/@#$%^&*+=\-]{20,})["\']')
+
+_ASSIGNMENT_RES = [
+    re.compile(r'[=:]\s*["\']'),  # key = "value" or key: "value"
+    re.compile(r"export\s+\w+"),  # export VARIABLE
+    re.compile(r'\w+:\s+["\']'),  # YAML-style key: "value"
+]
+_ASSIGNED_VALUE_RE = re.compile(r'[=:]\s*["\']?([^"\']+)["\']?')
+_SECRET_KEY_ASSIGNMENT_RE = re.compile(
+    r"(api[_-]?key|password|secret|token)\s*=", re.IGNORECASE
+)
+
+
 class SecretAnalyzer(BaseAnalyzer):
     """
     Secret detection analyzer.
@@ -125,6 +245,8 @@ class SecretAnalyzer(BaseAnalyzer):
     hardcoded secrets in code.
     """
 
+    uses_line_index = True
+
     def __init__(self, mode: AnalysisMode = AnalysisMode.STANDARD, config=None):
         super().__init__(mode)
 
@@ -140,13 +262,16 @@ class SecretAnalyzer(BaseAnalyzer):
     def get_name(self) -> str:
         return "SecretAnalyzer"
 
-    def analyze(self, file_path: Path, content: str) -> List[SecurityIssue]:
+    def analyze(
+        self, file_path: Path, content: str, line_index: Optional[LineIndex] = None
+    ) -> List[SecurityIssue]:
         """
         Analyze file for hardcoded secrets.
 
         Args:
             file_path: Path to file being analyzed
             content: File content
+            line_index: Optional newline index of content (built here if omitted)
 
         Returns:
             List of security issues
@@ -160,24 +285,28 @@ class SecretAnalyzer(BaseAnalyzer):
         if file_path.name in LOCK_FILES:
             return issues
 
-        lines = content.split("\n")
-
-        for line_num, line in enumerate(lines, 1):
-            line_issues = self._analyze_line(line, line_num, file_path)
-            issues.extend(line_issues)
-
-        return issues
-
-        lines = content.split("\n")
-
-        for line_num, line in enumerate(lines, 1):
-            line_issues = self._analyze_line(line, line_num, file_path)
+        # Every finding needs a secret pattern match or a quoted candidate
+        # string on its line; find those lines with whole-file scans and
+        # leave every other line alone
+        if line_index is None:
+            line_index = LineIndex(content)
+        pattern_lines = _pattern_candidate_lines(content, line_index)
+        entropy_lines = line_index.matched_lines(_CANDIDATE_STRING_RE)
+        file_name = sys.intern(file_path.name)
+
+        for line_num in sorted(pattern_lines.union(entropy_lines)):
+            line = line_index.line_text(line_num)
+            line_issues = self._analyze_line(line, line_num, file_name, pattern_lines)
             issues.extend(line_issues)
 
         return issues
 
     def _analyze_line(
-        self, line: str, line_num: int, file_path: Path
+        self,
+        line: str,
+        line_num: int,
+        file_name: str,
+        candidate_lines: Optional[Set[int]] = None,
     ) -> List[SecurityIssue]:
         """Analyze a single line for secrets."""
         issues = []
@@ -191,52 +320,60 @@ class SecretAnalyzer(BaseAnalyzer):
         if self._is_false_positive(stripped):
             return issues
 
-        # Pattern-based detection
-        pattern_issues = self._check_patterns(line, line_num, file_path)
-        issues.extend(pattern_issues)
+        snippet = stripped[:100]
+
+        # Pattern-based detection (lines ruled out by the file scan cannot match)
+        if candidate_lines is None or line_num in candidate_lines:
+            pattern_issues = self._check_patterns(line, line_num, file_name, snippet)
+            issues.extend(pattern_issues)
 
         # Entropy-based detection
-        entropy_issues = self._check_entropy(line, line_num, file_path)
+        entropy_issues = self._check_entropy(line, line_num, file_name, snippet)
         issues.extend(entropy_issues)
 
         return issues
 
     def _check_patterns(
-        self, line: str, line_num: int, file_path: Path
+        self, line: str, line_num: int, file_name: str, snippet: str
     ) -> List[SecurityIssue]:
         """Check line against known secret patterns."""
         issues = []
 
-        for category, patterns in SECRET_PATTERNS.items():
-            for pattern, description, severity in patterns:
-                for match in re.finditer(pattern, line, re.IGNORECASE):
-                    # Verify the match isn't a false positive
-                    matched_text = match.group(0)
-                    if self._is_false_positive(matched_text):
-                        continue
-
-                    # Extract the actual secret value
-                    secret_value = self._extract_secret_value(line, match)
-
-                    # Calculate confidence based on context
-                    confidence = self._calculate_confidence(line, secret_value)
-
-                    issues.append(
-                        SecurityIssue(
-                            level=severity,
-                            category="hardcoded_secret",
-                            description=description,
-                            file=str(file_path.name),
-                            line=line_num,
-                            snippet=line.strip()[:100],
-                            confidence=confidence,
-                        )
+        if not _ANY_SECRET_RE.search(line):
+            return issues
+
+        # _analyze_line has rejected lines containing a false positive, so no
+        # match (a part of the line) can contain one. The assigned value that
+        # drives the confidence is found on the line, not in the match, so it
+        # is scored once per line.
+        value_match = _ASSIGNED_VALUE_RE.search(line)
+        line_confidence = None
+        if value_match:
+            line_confidence = self._calculate_confidence(line, value_match.group(1))
+
+        for pattern, description, severity in _COMPILED_SECRET_PATTERNS:
+            for match in pattern.finditer(line):
+                # Without an assignment, score the matched text itself
+                confidence = line_confidence
+                if confidence is None:
+                    confidence = self._calculate_confidence(line, match.group(0))
+
+                issues.append(
+                    SecurityIssue(
+                        level=severity,
+                        category="hardcoded_secret",
+                        description=description,
+                        file=file_name,
+                        line=line_num,
+                        snippet=snippet,
+                        confidence=confidence,
                     )
+                )
 
         return issues
 
     def _check_entropy(
-        self, line: str, line_num: int, file_path: Path
+        self, line: str, line_num: int, file_name: str, snippet: str
     ) -> List[SecurityIssue]:
         """Check for high-entropy strings that may be secrets."""
         issues = []
@@ -246,43 +383,43 @@ class SecretAnalyzer(BaseAnalyzer):
             return issues
 
         # Skip lines with SRI hash patterns
-        if re.search(INTEGRITY_HASH_PATTERN, line):
+        if _INTEGRITY_HASH_RE.search(line):
             return issues
 
         # Look for string literals that might contain secrets
         # Match quoted strings with high-entropy characters
-        string_pattern = r'["\']([A-Za-z0-9_/@#$%^&*+=\-]{20,})["\']'
-
-        for match in re.finditer(string_pattern, line):
-            candidate = match.group(1)
-
-            # Skip if too short
-            if len(candidate) < self.config.min_length:
-                continue
-
-            # Skip if it's an integrity hash
-            if re.match(r"^sha(256|384|512)-", candidate):
-                continue
-
-            # Check entropy
-            entropy = EntropyCalculator.calculate(candidate)
-
-            if entropy >= self.config.min_entropy:
-                # Check for assignment context
-                if self._is_likely_secret_assignment(line):
-                    # Avoid duplicates from pattern matching
-                    if not any(i.line == line_num for i in issues):
-                        issues.append(
-                            SecurityIssue(
-                                level=Severity.HIGH,
-                                category="hardcoded_secret",
-                                description=f"High-entropy string (entropy: {entropy:.2f})",
-                                file=str(file_path.name),
-                                line=line_num,
-                                snippet=line.strip()[:100],
-                                confidence=min(0.95, entropy / 8.0),
-                            )
-                        )
+        min_entropy = self.config.min_entropy
+        candidates = [
+            candidate
+            for candidate in (m.group(1) for m in _CANDIDATE_STRING_RE.finditer(line))
+            # Skip if too short, if it's an integrity hash, or if it has too
+            # few distinct characters to reach the entropy threshold
+            if len(candidate) >= self.config.min_length
+            and not _INTEGRITY_PREFIX_RE.match(candidate)
+            and EntropyCalculator.may_reach(candidate, min_entropy)
+        ]
+
+        # Only lines that look like assignments are reported
+        if not candidates or not self._is_likely_secret_assignment(line):
+            return issues
+
+        # Report the first high-entropy candidate; one finding per line
+        for entropy in EntropyCalculator.calculate_batch(candidates):
+            if entropy >= min_entropy:
+                issues.append(
+                    SecurityIssue(
+                        level=Severity.HIGH,
+                        category="hardcoded_secret",
+                        description=sys.intern(
+                            f"High-entropy string (entropy: {entropy:.2f})"
+                        ),
+                        file=file_name,
+                        line=line_num,
+                        snippet=snippet,
+                        confidence=min(0.95, entropy / 8.0),
+                    )
+                )
+                break
 
         return issues
 
@@ -290,17 +427,13 @@ class SecretAnalyzer(BaseAnalyzer):
         """Check if text is a known false positive."""
         text_lower = text.lower()
 
-        for pattern in FALSE_POSITIVE_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                return True
-
-        # Check for placeholder patterns
-        for pattern in PLACEHOLDER_PATTERNS:
-            if re.search(pattern, text_lower, re.IGNORECASE):
+        # False positive and placeholder patterns
+        for pattern in _COMPILED_FALSE_POSITIVES:
+            if pattern.search(text_lower):
                 return True
 
         # Check for integrity hash pattern (SRI hashes)
-        if re.search(INTEGRITY_HASH_PATTERN, text):
+        if _INTEGRITY_HASH_RE.search(text):
             return True
 
         # Check for "integrity": context (npm lock files)
@@ -312,35 +445,18 @@ class SecretAnalyzer(BaseAnalyzer):
     def _is_likely_secret_assignment(self, line: str) -> bool:
         """Check if line looks like a secret assignment."""
         # Look for assignment patterns
-        assignment_patterns = [
-            r'[=:]\s*["\']',  # key = "value" or key: "value"
-            r"export\s+\w+",  # export VARIABLE
-            r'\w+:\s+["\']',  # YAML-style key: "value"
-        ]
-
-        for pattern in assignment_patterns:
-            if re.search(pattern, line):
+        for pattern in _ASSIGNMENT_RES:
+            if pattern.search(line):
                 return True
 
         return False
 
-    def _extract_secret_value(self, line: str, match) -> str:
-        """Extract the secret value from a match."""
-        matched_text = match.group(0)
-
-        # Try to extract just the value part after = or :
-        value_match = re.search(r'[=:]\s*["\']?([^"\']+)["\']?', line)
-        if value_match:
-            return value_match.group(1)
-
-        return matched_text
-
     def _calculate_confidence(self, line: str, secret_value: str) -> float:
         """Calculate confidence score for a secret detection."""
         confidence = 0.7  # Base confidence
 
         # Increase confidence for clear assignment patterns
-        if re.search(r"(api[_-]?key|password|secret|token)\s*=", line, re.IGNORECASE):
+        if _SECRET_KEY_ASSIGNMENT_RE.search(line):
             confidence += 0.15
 
         # Increase confidence for long, random-looking values
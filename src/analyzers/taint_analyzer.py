@@ -6,6 +6,7 @@ to sinks (dangerous operations).
 """
 
 import ast
+import sys
 from typing import List, Set, Dict, Optional
 from pathlib import Path
 
@@ -25,17 +26,21 @@ TAINT_SOURCES = {
     'open': 'file_content',
 }
 
-# Sinks where tainted data is dangerous
+# Sinks where tainted data is dangerous (called names are matched exactly)
 TAINT_SINKS = {
     'eval': 'code_execution',
+    'builtins.eval': 'code_execution',
     'exec': 'code_execution',
+    'builtins.exec': 'code_execution',
     'os.system': 'command_execution',
     'os.popen': 'command_execution',
     'subprocess.call': 'command_execution',
     'subprocess.run': 'command_execution',
     'subprocess.Popen': 'command_execution',
     'compile': 'code_execution',
+    'builtins.compile': 'code_execution',
     '__import__': 'dynamic_import',
+    'builtins.__import__': 'dynamic_import',
 }
 
 
@@ -48,6 +53,12 @@ class TaintAnalyzer(BaseAnalyzer):
     requires more sophisticated control flow analysis.
     """
     
+    uses_python_ast = True
+    # Every sink in TAINT_SINKS contains one of these identifiers
+    trigger_literals = (
+        'eval', 'exec', 'compile', '__import__', 'system', 'popen', 'subprocess',
+    )
+    
     def __init__(self, mode: AnalysisMode = AnalysisMode.STANDARD, config=None):
         super().__init__(mode)
         self.config = config
@@ -55,13 +66,19 @@ class TaintAnalyzer(BaseAnalyzer):
     def get_name(self) -> str:
         return "TaintAnalyzer"
     
-    def analyze(self, file_path: Path, content: str) -> List[SecurityIssue]:
+    def analyze(
+        self,
+        file_path: Path,
+        content: str,
+        tree: Optional[ast.AST] = None
+    ) -> List[SecurityIssue]:
         """
         Analyze Python file for taint flow issues.
         
         Args:
             file_path: Path to file being analyzed
             content: File content
+            tree: Optional pre-parsed AST of content (parsed here if omitted)
             
         Returns:
             List of security issues
@@ -75,24 +92,44 @@ class TaintAnalyzer(BaseAnalyzer):
         if self.mode == AnalysisMode.FAST:
             return issues
         
-        try:
-            tree = ast.parse(content)
-        except SyntaxError:
-            return issues
+        if tree is None:
+            try:
+                tree = ast.parse(content)
+            except SyntaxError:
+                return issues
         
         # Track tainted variables
         tainted_vars: Dict[str, int] = {}  # var_name -> line_number
         
-        # Walk the AST
-        for node in ast.walk(tree):
-            # Track assignments from taint sources
-            if isinstance(node, ast.Assign):
-                self._track_assignment(node, tainted_vars)
+        # Split once for snippet lookups rather than once per tainted sink
+        lines = content.split('\n')
+        
+        # Walk the AST once, depth-first in source order, collecting
+        # assignments and calls
+        assignments: List[ast.Assign] = []
+        calls: List[ast.Call] = []
+        iter_child_nodes = ast.iter_child_nodes
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
+            if node_type is ast.Assign:
+                assignments.append(node)
+            elif node_type is ast.Call:
+                calls.append(node)
             
-            # Check for tainted data reaching sinks
-            elif isinstance(node, ast.Call):
-                sink_issues = self._check_sink(node, tainted_vars, file_path, content)
-                issues.extend(sink_issues)
+            children = list(iter_child_nodes(node))
+            children.reverse()
+            stack.extend(children)
+        
+        # Track assignments from taint sources before checking any sink, so
+        # a function using a name assigned later in the file is still checked
+        for node in assignments:
+            self._track_assignment(node, tainted_vars)
+        
+        # Check for tainted data reaching sinks, in source order
+        for node in calls:
+            issues.extend(self._check_sink(node, tainted_vars, file_path, lines))
         
         return issues
     
@@ -116,7 +153,7 @@ class TaintAnalyzer(BaseAnalyzer):
         node: ast.Call,
         tainted_vars: Dict[str, int],
         file_path: Path,
-        content: str
+        lines: List[str]
     ) -> List[SecurityIssue]:
         """Check if a function call is a sink with tainted data."""
         issues = []
@@ -135,14 +172,15 @@ class TaintAnalyzer(BaseAnalyzer):
         for arg in node.args:
             if self._is_tainted(arg, tainted_vars):
                 # Get the line content
-                lines = content.split('\n')
                 line_content = lines[node.lineno - 1] if node.lineno <= len(lines) else ""
                 
                 issues.append(SecurityIssue(
                     level=Severity.HIGH,
-                    category=f'tainted_{sink_category}',
-                    description=f'{func_name}() called with tainted user input',
-                    file=str(file_path.name),
+                    category=sys.intern(f'tainted_{sink_category}'),
+                    description=sys.intern(
+                        f'{func_name}() called with tainted user input'
+                    ),
+                    file=sys.intern(file_path.name),
                     line=node.lineno,
                     snippet=line_content.strip()[:100],
                     confidence=0.85
@@ -155,11 +193,9 @@ class TaintAnalyzer(BaseAnalyzer):
         """Check if a node is a taint source."""
         if isinstance(node, ast.Call):
             func_name = self._get_func_name(node.func)
-            if func_name:
-                # Check if it's a known source
-                for source_pattern in TAINT_SOURCES:
-                    if source_pattern in func_name:
-                        return True
+            # Check if it's a known source
+            if func_name in TAINT_SOURCES:
+                return True
         
         elif isinstance(node, ast.Name):
             if node.id in ['input']:
@@ -179,45 +215,52 @@ class TaintAnalyzer(BaseAnalyzer):
         tainted_vars: Dict[str, int]
     ) -> bool:
         """Check if a node represents tainted data."""
-        # Direct variable reference
-        if isinstance(node, ast.Name):
-            return node.id in tainted_vars
-        
-        # Direct taint source
-        if self._is_taint_source(node):
-            return True
-        
-        # Binary operations with tainted data
-        if isinstance(node, ast.BinOp):
-            return self._is_tainted(node.left, tainted_vars) or \
-                   self._is_tainted(node.right, tainted_vars)
-        
-        # Formatted values
-        if isinstance(node, ast.JoinedStr):
-            for value in node.values:
-                if isinstance(value, ast.FormattedValue):
-                    if self._is_tainted(value.value, tainted_vars):
-                        return True
-        
-        # Calls that return tainted data
-        if isinstance(node, ast.Call):
-            return self._is_taint_source(node)
+        # Iterative walk over the operands that can carry taint
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            
+            # Direct variable reference
+            if isinstance(node, ast.Name):
+                if node.id in tainted_vars:
+                    return True
+                continue
+            
+            # Direct taint source (including calls that return tainted data)
+            if self._is_taint_source(node):
+                return True
+            
+            # Binary operations with tainted data
+            if isinstance(node, ast.BinOp):
+                stack.append(node.right)
+                stack.append(node.left)
+            
+            # Formatted values
+            elif isinstance(node, ast.JoinedStr):
+                stack.extend(
+                    value.value
+                    for value in reversed(node.values)
+                    if isinstance(value, ast.FormattedValue)
+                )
         
         return False
     
     def _get_func_name(self, node: ast.expr) -> Optional[str]:
-        """Get function name from AST node."""
+        """Get function name from AST node (dotted, e.g. os.environ.get)."""
         if isinstance(node, ast.Name):
             return node.id
         elif isinstance(node, ast.Attribute):
-            if isinstance(node.value, ast.Name):
-                return f"{node.value.id}.{node.attr}"
+            parts = [node.attr]
+            value = node.value
+            while isinstance(value, ast.Attribute):
+                parts.append(value.attr)
+                value = value.value
+            if isinstance(value, ast.Name):
+                parts.append(value.id)
+                return '.'.join(reversed(parts))
             return node.attr
         return None
     
     def _get_sink_category(self, func_name: str) -> Optional[str]:
         """Get sink category if function is a known sink."""
-        for sink_pattern, category in TAINT_SINKS.items():
-            if sink_pattern in func_name:
-                return category
-        return None
+        return TAINT_SINKS.get(func_name)
@@ -0,0 +1,144 @@
+"""
+Persistent Scan Cache for Orange TrustSkill
+
+Stores per-file analyzer findings in a small SQLite database so that repeat
+scans only re-analyze files whose content changed. Two tiers are used:
+
+1. (mtime_ns, size) of a path -> content digest, to skip reading unchanged files
+2. (digest, analyzer, context) -> serialized findings
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from .types import SecurityIssue, Severity
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "orange-trustskill" / "cache.db"
+
+
+def _compute_code_fingerprint() -> str:
+    """Hash the scanner's own sources so that rule or analyzer changes invalidate the cache."""
+    digest = hashlib.blake2b(digest_size=16)
+    package_dir = Path(__file__).parent
+    for source in sorted(package_dir.rglob("*.py")):
+        digest.update(str(source.relative_to(package_dir)).encode("utf-8"))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+class ScanCache:
+    """SQLite-backed cache of analyzer findings keyed by file content digest."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS file_stats (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                digest TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS results (
+                digest TEXT NOT NULL,
+                analyzer TEXT NOT NULL,
+                context TEXT NOT NULL,
+                issues TEXT NOT NULL,
+                PRIMARY KEY (digest, analyzer, context)
+            );
+            """
+        )
+        self.fingerprint = _compute_code_fingerprint()
+
+    @staticmethod
+    def digest(content: str) -> str:
+        """Compute the content digest used as the cache key."""
+        return hashlib.blake2b(
+            content.encode("utf-8", errors="surrogatepass"), digest_size=20
+        ).hexdigest()
+
+    def make_context(self, file_path: Path, mode_value: str, config=None) -> str:
+        """
+        Build the non-content part of a cache key.
+
+        Findings depend on the file path (suffix dispatch, whitelists, the
+        reported file name), the analysis mode, the scanner code itself and
+        the active configuration.
+        """
+        config_key = ""
+        if config is not None and hasattr(config, "to_dict"):
+            config_key = json.dumps(config.to_dict(), sort_keys=True, default=str)
+        elif config is not None:
+            config_key = repr(config)
+        return "|".join((str(file_path), mode_value, self.fingerprint, config_key))
+
+    def lookup_digest(self, file_path: Path, stat: os.stat_result) -> Optional[str]:
+        """Return the known digest for a path if its mtime and size are unchanged."""
+        row = self._conn.execute(
+            "SELECT mtime_ns, size, digest FROM file_stats WHERE path = ?",
+            (str(file_path),),
+        ).fetchone()
+        if row and row[0] == stat.st_mtime_ns and row[1] == stat.st_size:
+            return row[2]
+        return None
+
+    def store_digest(self, file_path: Path, stat: os.stat_result, digest: str) -> None:
+        """Remember the digest of a path for its current mtime and size."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO file_stats (path, mtime_ns, size, digest) "
+            "VALUES (?, ?, ?, ?)",
+            (str(file_path), stat.st_mtime_ns, stat.st_size, digest),
+        )
+
+    def get(self, digest: str, analyzer: str, context: str) -> Optional[List[SecurityIssue]]:
+        """Return cached findings, or None on a cache miss."""
+        row = self._conn.execute(
+            "SELECT issues FROM results WHERE digest = ? AND analyzer = ? AND context = ?",
+            (digest, analyzer, context),
+        ).fetchone()
+        if row is None:
+            return None
+        return [
+            SecurityIssue(
+                level=Severity(item["level"]),
+                category=sys.intern(item["category"]),
+                description=sys.intern(item["description"]),
+                file=sys.intern(item["file"]),
+                line=item["line"],
+                snippet=item["snippet"],
+                confidence=item["confidence"],
+            )
+            for item in json.loads(row[0])
+        ]
+
+    def put(
+        self, digest: str, analyzer: str, context: str, issues: List[SecurityIssue]
+    ) -> None:
+        """Store the findings of one analyzer for one file content."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO results (digest, analyzer, context, issues) "
+            "VALUES (?, ?, ?, ?)",
+            (
+                digest,
+                analyzer,
+                context,
+                json.dumps([issue.to_dict() for issue in issues], ensure_ascii=False),
+            ),
+        )
+
+    def commit(self) -> None:
+        """Flush pending writes to disk."""
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Commit and close the underlying database."""
+        self._conn.commit()
+        self._conn.close()
@@ -4,8 +4,10 @@ Orange TrustSkill v3.0 - Main Entry Script
 Advanced Security Scanner for OpenClaw Skills
 """
 
+import codecs
 import sys
 import argparse
+from functools import lru_cache
 from pathlib import Path
 
 # Add src and its parent to the Python path
@@ -13,22 +15,20 @@ script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 sys.path.insert(0, str(script_dir.parent))
 
-try:
-    from src.types import AnalysisMode
-    from src.scanner import SkillScanner
-    from src.formatters.text_formatter import TextFormatter, ProgressTracker
-    from src.formatters.json_formatter import JsonFormatter
-    from src.formatters.markdown_formatter import MarkdownFormatter
-except ImportError:
-    # Attempt direct import if src-prefixed import fails
-    from types import AnalysisMode
-    from scanner import SkillScanner
-    from formatters.text_formatter import TextFormatter, ProgressTracker
-    from formatters.json_formatter import JsonFormatter
-    from formatters.markdown_formatter import MarkdownFormatter
 
+def _is_utf8_stream(stream) -> bool:
+    """Check if a text stream encodes as UTF-8 onto a binary buffer."""
+    if not hasattr(stream, 'buffer'):
+        return False
+    try:
+        return codecs.lookup(stream.encoding).name == 'utf-8'
+    except (LookupError, TypeError):
+        return False
 
-def main():
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; parse_args() leaves it unchanged."""
     parser = argparse.ArgumentParser(
         description='🍊 Orange TrustSkill v3.0 - Security Scanner for OpenClaw Skills',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -39,6 +39,7 @@ Examples:
   %(prog)s /path/to/skill --format json
   %(prog)s /path/to/skill --export-for-llm
   %(prog)s /path/to/skill --config trustskill.yaml
+  %(prog)s /path/to/skill --jobs 0
         """
     )
     
@@ -90,13 +91,48 @@ Examples:
         help='Path to configuration file (YAML or JSON)'
     )
     
+    parser.add_argument(
+        '--cache',
+        nargs='?',
+        const='',
+        metavar='PATH',
+        help='Reuse findings for unchanged files between runs '
+             '(default location: ~/.cache/orange-trustskill/cache.db)'
+    )
+    
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Scan files in N worker processes (0 = one per CPU, default: 1; '
+             'ignored with --cache)'
+    )
+    
     parser.add_argument(
         '-v', '--version',
         action='version',
         version='%(prog)s 3.0.0'
     )
     
+    return parser
+
+
+def main():
+    parser = _build_parser()
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error('--jobs must be 0 or a positive number')
+    
+    # Import the scanner only once the arguments are known to be valid, so
+    # --help, --version and usage errors return without loading it
+    try:
+        from src.types import AnalysisMode
+        from src.scanner import SkillScanner
+    except ImportError:
+        # Attempt direct import if src-prefixed import fails
+        from types import AnalysisMode
+        from scanner import SkillScanner
     
     # Load configuration if provided
     config = None
@@ -119,50 +155,61 @@ Examples:
     }
     mode = mode_map[args.mode]
     
+    # Open the persistent result cache if requested
+    cache = None
+    if args.cache is not None:
+        try:
+            from src.cache import ScanCache
+        except ImportError:
+            from cache import ScanCache
+        try:
+            cache = ScanCache(args.cache or None)
+        except Exception as e:
+            print(f"Warning: Failed to open cache: {e}", file=sys.stderr)
+    
     # Initialize scanner
-    scanner = SkillScanner(mode=mode, config=config)
+    scanner = SkillScanner(mode=mode, config=config, cache=cache, workers=args.jobs)
     
-    # Initialize progress tracker if requested
+    # Progress is set up from the scanner's own file count on the first
+    # update, so the skill directory is only walked once
+    show_progress = not args.no_progress and args.format == 'text' and not args.quiet
     progress = None
-    if not args.no_progress and args.format == 'text' and not args.quiet:
-        from src.rules import SCAN_EXTENSIONS, IGNORE_PATTERNS
-        import re
-        
-        skill_path = Path(args.skill_path)
-        total_files = 0
-        if skill_path.exists():
-            for item in skill_path.rglob('*'):
-                if item.is_file():
-                    path_str = str(item)
-                    should_ignore = any(re.search(p, path_str) for p in IGNORE_PATTERNS)
-                    if not should_ignore and item.suffix in SCAN_EXTENSIONS:
-                        total_files += 1
-        
-        if total_files > 0:
-            progress = ProgressTracker(total_files, use_color=not args.no_color)
     
     # Progress callback function
     def progress_callback(filename: str, current: int, total: int, findings: int):
-        if progress:
-            progress.update(filename, 0)
+        nonlocal progress
+        if progress is None:
+            try:
+                from src.formatters.text_formatter import ProgressTracker
+            except ImportError:
+                from formatters.text_formatter import ProgressTracker
+            progress = ProgressTracker(total, use_color=not args.no_color)
+        progress.update(filename, 0)
     
     # Execute scan
-    result = scanner.scan(args.skill_path, progress_callback if progress else None)
+    result = scanner.scan(args.skill_path, progress_callback if show_progress else None)
     
     if progress:
         progress.finish()
     
-    # Initialize appropriate formatter
-    if args.format == 'json':
-        formatter = JsonFormatter()
-    elif args.format == 'markdown':
-        formatter = MarkdownFormatter()
+    if cache is not None:
+        cache.close()
+    
+    # Get the formatter, importing only the one needed
+    try:
+        from src.formatters import get_formatter
+    except ImportError:
+        from formatters import get_formatter
+    formatter = get_formatter(args.format, use_color=not args.no_color)
+    
+    # Write the results straight to stdout rather than building the report
+    # first; text reports go to the binary buffer when it takes UTF-8
+    if hasattr(formatter, 'format_bytes') and _is_utf8_stream(sys.stdout):
+        sys.stdout.flush()
+        sys.stdout.buffer.write(formatter.format_bytes(result))
     else:
-        formatter = TextFormatter(use_color=not args.no_color)
-    
-    # Format and print the results
-    output = formatter.format(result)
-    print(output)
+        formatter.format_to(result, sys.stdout)
+    print()
     
     # Exit with appropriate code
     if result.risk_summary['HIGH'] > 0:
@@ -4,12 +4,13 @@ Configuration System for Orange TrustSkill v3.0
 Provides YAML/JSON configuration loading and validation.
 """
 
-from .loader import ConfigLoader, Config
+from .loader import ConfigLoader, Config, LazyConfig
 from .validator import ConfigValidator, ConfigValidationError
 
 __all__ = [
     'ConfigLoader',
     'Config',
+    'LazyConfig',
     'ConfigValidator',
     'ConfigValidationError',
 ]
@@ -4,22 +4,48 @@ Configuration Loader for Orange TrustSkill v3.0
 Supports YAML and JSON configuration files with default values.
 """
 
+import hashlib
 import yaml
 import json
+import os
+import sys
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Union
+from dataclasses import dataclass, field, fields
+from typing import List, Dict, Any, Optional, Set, Tuple, Union
 
+# Prefer the libyaml-backed loader and dumper; pure-Python PyYAML builds
+# only provide the slower SafeLoader/SafeDumper
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# Slotted dataclasses (smaller, faster attribute access) need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class ScanningConfig:
     """Scanning configuration."""
     mode: str = "standard"
     max_file_size: str = "10MB"
     follow_symlinks: bool = False
+    # Opt-in: skip files over max_file_size instead of scanning them whole
+    skip_large_files: bool = False
 
+    @property
+    def max_file_size_bytes(self) -> int:
+        """max_file_size in bytes; larger files are skipped if skip_large_files."""
+        from .validator import parse_file_size
+        return parse_file_size(self.max_file_size)
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class CustomPattern:
     """Custom security pattern definition."""
     name: str = ""
@@ -28,14 +54,14 @@ class CustomPattern:
     description: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WhitelistConfig:
     """Whitelist configuration."""
     files: List[str] = field(default_factory=list)
     patterns: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RulesConfig:
     """Rules configuration."""
     custom_patterns: List[CustomPattern] = field(default_factory=list)
@@ -43,7 +69,7 @@ class RulesConfig:
     whitelist: WhitelistConfig = field(default_factory=WhitelistConfig)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SecretDetectionConfig:
     """Secret detection configuration."""
     enabled: bool = True
@@ -52,14 +78,14 @@ class SecretDetectionConfig:
     check_common_passwords: bool = True
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DependencyCheckConfig:
     """Dependency vulnerability check configuration."""
     enabled: bool = True
     cache_duration: int = 3600
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OutputConfig:
     """Output configuration."""
     format: str = "text"
@@ -67,7 +93,19 @@ class OutputConfig:
     show_confidence: bool = True
 
 
-@dataclass
+# Flat config sections: key in the config file -> (dataclass, field names)
+_SECTION_MAP = {
+    key: (section_cls, tuple(f.name for f in fields(section_cls)))
+    for key, section_cls in (
+        ('scanning', ScanningConfig),
+        ('secret_detection', SecretDetectionConfig),
+        ('dependency_check', DependencyCheckConfig),
+        ('output', OutputConfig),
+    )
+}
+
+
+@dataclass(**_SLOTS)
 class Config:
     """Main configuration class."""
     version: str = "3.0"
@@ -82,70 +120,45 @@ class Config:
         """Create Config from dictionary."""
         config = cls(version=data.get('version', '3.0'))
         
-        # Parse scanning config
-        if 'scanning' in data:
-            scanning_data = data['scanning']
-            config.scanning = ScanningConfig(
-                mode=scanning_data.get('mode', 'standard'),
-                max_file_size=scanning_data.get('max_file_size', '10MB'),
-                follow_symlinks=scanning_data.get('follow_symlinks', False)
-            )
+        # Parse flat sections; keys missing from the file keep their defaults
+        for key, (section_cls, names) in _SECTION_MAP.items():
+            if key in data:
+                section_data = data[key]
+                setattr(config, key, section_cls(
+                    **{name: section_data[name] for name in names if name in section_data}
+                ))
         
         # Parse rules config
         if 'rules' in data:
-            rules_data = data['rules']
-            
-            # Parse custom patterns
-            custom_patterns = []
-            for pattern_data in rules_data.get('custom_patterns', []):
-                custom_patterns.append(CustomPattern(
-                    name=pattern_data.get('name', ''),
-                    pattern=pattern_data.get('pattern', ''),
-                    severity=pattern_data.get('severity', 'MEDIUM'),
-                    description=pattern_data.get('description', '')
-                ))
-            
-            # Parse whitelist
-            whitelist_data = rules_data.get('whitelist', {})
-            whitelist = WhitelistConfig(
-                files=whitelist_data.get('files', []),
-                patterns=whitelist_data.get('patterns', [])
-            )
-            
-            config.rules = RulesConfig(
-                custom_patterns=custom_patterns,
-                severity_overrides=rules_data.get('severity_overrides', {}),
-                whitelist=whitelist
-            )
+            config.rules = cls._rules_from_dict(data['rules'])
         
-        # Parse secret detection config
-        if 'secret_detection' in data:
-            sd_data = data['secret_detection']
-            config.secret_detection = SecretDetectionConfig(
-                enabled=sd_data.get('enabled', True),
-                min_entropy=sd_data.get('min_entropy', 4.5),
-                min_length=sd_data.get('min_length', 20),
-                check_common_passwords=sd_data.get('check_common_passwords', True)
-            )
-        
-        # Parse dependency check config
-        if 'dependency_check' in data:
-            dc_data = data['dependency_check']
-            config.dependency_check = DependencyCheckConfig(
-                enabled=dc_data.get('enabled', True),
-                cache_duration=dc_data.get('cache_duration', 3600)
-            )
+        return config
+    
+    @staticmethod
+    def _rules_from_dict(rules_data: Dict[str, Any]) -> RulesConfig:
+        """Create RulesConfig from the 'rules' section of a config dictionary."""
+        # Parse custom patterns
+        custom_patterns = []
+        for pattern_data in rules_data.get('custom_patterns', []):
+            custom_patterns.append(CustomPattern(
+                name=pattern_data.get('name', ''),
+                pattern=pattern_data.get('pattern', ''),
+                severity=pattern_data.get('severity', 'MEDIUM'),
+                description=pattern_data.get('description', '')
+            ))
         
-        # Parse output config
-        if 'output' in data:
-            output_data = data['output']
-            config.output = OutputConfig(
-                format=output_data.get('format', 'text'),
-                color=output_data.get('color', True),
-                show_confidence=output_data.get('show_confidence', True)
-            )
+        # Parse whitelist
+        whitelist_data = rules_data.get('whitelist', {})
+        whitelist = WhitelistConfig(
+            files=whitelist_data.get('files', []),
+            patterns=whitelist_data.get('patterns', [])
+        )
         
-        return config
+        return RulesConfig(
+            custom_patterns=custom_patterns,
+            severity_overrides=rules_data.get('severity_overrides', {}),
+            whitelist=whitelist
+        )
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert Config to dictionary."""
@@ -154,7 +167,8 @@ class Config:
             'scanning': {
                 'mode': self.scanning.mode,
                 'max_file_size': self.scanning.max_file_size,
-                'follow_symlinks': self.scanning.follow_symlinks
+                'follow_symlinks': self.scanning.follow_symlinks,
+                'skip_large_files': self.scanning.skip_large_files
             },
             'rules': {
                 'custom_patterns': [
@@ -190,6 +204,75 @@ class Config:
         }
 
 
+class LazyConfig(Config):
+    """
+    Config whose rules section is built on first access.
+    
+    Custom patterns and the whitelist are kept as the raw (validated)
+    dictionary until something reads config.rules, so callers that only
+    need e.g. the output settings never construct them.
+    """
+    
+    __slots__ = ('_rules', '_raw_rules')
+    
+    @property
+    def rules(self) -> RulesConfig:
+        if self._rules is None:
+            self._rules = self._rules_from_dict(self._raw_rules)
+        return self._rules
+    
+    @rules.setter
+    def rules(self, value: RulesConfig) -> None:
+        self._rules = value
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LazyConfig':
+        """Create LazyConfig from dictionary, deferring the rules section."""
+        config = super().from_dict({k: v for k, v in data.items() if k != 'rules'})
+        if 'rules' in data:
+            config._raw_rules = data['rules']
+            config._rules = None
+        return config
+    
+    def force(self) -> 'LazyConfig':
+        """Materialize all deferred sections and return self."""
+        self.rules
+        return self
+
+
+class _ConfigDumper(_YamlDumper):
+    """YAML dumper that writes config dataclasses directly."""
+
+
+def _represent_config_section(dumper: _ConfigDumper, section) -> Any:
+    """Represent a config dataclass as a mapping of its fields."""
+    return dumper.represent_dict({f.name: getattr(section, f.name) for f in fields(section)})
+
+
+for _section_cls in (
+    Config, LazyConfig, ScanningConfig, CustomPattern, WhitelistConfig, RulesConfig,
+    SecretDetectionConfig, DependencyCheckConfig, OutputConfig,
+):
+    _ConfigDumper.add_representer(_section_cls, _represent_config_section)
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse a JSON config file's bytes, with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals; the stdlib parser decides and reports
+    return json.loads(raw.decode('utf-8'))
+
+
+# Validated configs by (path, mtime_ns, size) of the file they were loaded from
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Config] = {}
+
+# (suffix, sha1) of file contents that passed validation
+_VALIDATED: Set[Tuple[str, str]] = set()
+
+
 class ConfigLoader:
     """Configuration file loader."""
     
@@ -211,7 +294,8 @@ class ConfigLoader:
             config_path: Path to config file. If None, searches default paths.
             
         Returns:
-            Config object
+            Config object. Configs loaded from an unchanged file are shared
+            between calls and must be treated as read-only.
         """
         if config_path is None:
             config_path = cls._find_config_file()
@@ -222,28 +306,54 @@ class ConfigLoader:
         
         config_path = Path(config_path)
         
+        # Reuse the parsed and validated config while the file is unchanged
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                if config_path.suffix in ['.yaml', '.yml']:
-                    data = yaml.safe_load(f) or {}
-                elif config_path.suffix == '.json':
-                    data = json.load(f)
-                else:
-                    # Try YAML first, then JSON
-                    try:
-                        data = yaml.safe_load(f) or {}
-                    except yaml.YAMLError:
-                        f.seek(0)
-                        data = json.load(f)
+            stat = os.stat(config_path)
+        except OSError:
+            cache_key = None
+        else:
+            cache_key = (str(config_path), stat.st_mtime_ns, stat.st_size)
+            cached = _CONFIG_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        try:
+            raw = config_path.read_bytes()
+            if config_path.suffix == '.json':
+                data = _load_json(raw)
+            elif config_path.suffix in ['.yaml', '.yml']:
+                data = yaml.load(raw.decode('utf-8'), Loader=_YamlLoader) or {}
+            elif raw.lstrip()[:1] in (b'{', b'['):
+                # Unknown suffix that looks like JSON; YAML flow mappings
+                # such as "{mode: fast}" are not, so fall back to YAML
+                try:
+                    data = _load_json(raw)
+                except ValueError:
+                    data = yaml.load(raw.decode('utf-8'), Loader=_YamlLoader) or {}
+            else:
+                data = yaml.load(raw.decode('utf-8'), Loader=_YamlLoader) or {}
         except Exception as e:
             from .validator import ConfigValidationError
             raise ConfigValidationError(f"Failed to load config file: {e}")
         
-        # Validate configuration
-        from .validator import ConfigValidator
-        ConfigValidator.validate(data)
+        # Validate configuration, unless identical content (e.g. a file that
+        # was only touched or rewritten) already passed validation
+        validated_key = (config_path.suffix, hashlib.sha1(raw).hexdigest())
+        if validated_key not in _VALIDATED:
+            from .validator import ConfigValidator
+            ConfigValidator.validate(data)
+            _VALIDATED.add(validated_key)
         
-        return Config.from_dict(data)
+        config = LazyConfig.from_dict(data)
+        if cache_key is not None:
+            _CONFIG_CACHE[cache_key] = config
+        return config
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all previously loaded and validated configuration files."""
+        _CONFIG_CACHE.clear()
+        _VALIDATED.clear()
     
     @classmethod
     def _find_config_file(cls) -> Optional[str]:
@@ -263,13 +373,13 @@ class ConfigLoader:
             config_path: Path to save to
         """
         config_path = Path(config_path)
-        data = config.to_dict()
         
         with open(config_path, 'w', encoding='utf-8') as f:
-            if config_path.suffix in ['.yaml', '.yml']:
-                yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
-            elif config_path.suffix == '.json':
-                json.dump(data, f, indent=2)
+            if config_path.suffix == '.json':
+                json.dump(config.to_dict(), f, indent=2)
             else:
-                # Default to YAML
-                yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+                # YAML (also the default); the dumper walks the dataclasses
+                # itself, so no intermediate dictionary is built
+                yaml.dump(
+                    config, f, Dumper=_ConfigDumper, default_flow_style=False, allow_unicode=True
+                )
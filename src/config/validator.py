@@ -5,7 +5,33 @@ Validates configuration files against schema requirements.
 """
 
 import re
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
+
+
+# Size strings: number followed by optional unit (B, KB, MB, GB)
+_SIZE_RE = re.compile(r'^(\d+)\s*(B|KB|MB|GB|K|M|G)?$', re.IGNORECASE)
+
+# Bytes per size unit (binary multiples)
+_SIZE_UNITS = {'B': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+
+def parse_file_size(size: str) -> int:
+    """
+    Convert a size string such as "10MB" or "512K" to bytes.
+
+    Raises:
+        ValueError: If the string is not a valid size
+    """
+    match = _SIZE_RE.match(size) if isinstance(size, str) else None
+    if match is None:
+        raise ValueError(f"Invalid file size: {size!r}")
+    number, unit = match.groups()
+    return int(number) * _SIZE_UNITS[(unit or 'B')[0].upper()]
+
+
+# Custom pattern strings that already compiled successfully; reloaded
+# configs and shared rule sets repeat the same patterns
+_VALID_PATTERNS: Set[str] = set()
 
 
 class ConfigValidationError(Exception):
@@ -16,9 +42,14 @@ class ConfigValidationError(Exception):
 class ConfigValidator:
     """Configuration validator."""
     
-    VALID_MODES = ['fast', 'standard', 'deep']
-    VALID_SEVERITIES = ['HIGH', 'MEDIUM', 'LOW', 'INFO']
-    VALID_FORMATS = ['text', 'json', 'markdown']
+    # Ordered names for error messages; the frozensets are for lookups
+    _VALID_MODES_DISPLAY = ('fast', 'standard', 'deep')
+    _VALID_SEVERITIES_DISPLAY = ('HIGH', 'MEDIUM', 'LOW', 'INFO')
+    _VALID_FORMATS_DISPLAY = ('text', 'json', 'markdown')
+    
+    VALID_MODES = frozenset(_VALID_MODES_DISPLAY)
+    VALID_SEVERITIES = frozenset(_VALID_SEVERITIES_DISPLAY)
+    VALID_FORMATS = frozenset(_VALID_FORMATS_DISPLAY)
     
     @classmethod
     def validate(cls, data: Dict[str, Any]) -> None:
@@ -68,10 +99,10 @@ class ConfigValidator:
         
         if 'mode' in scanning:
             mode = scanning['mode']
-            if mode not in cls.VALID_MODES:
+            if not isinstance(mode, str) or mode not in cls.VALID_MODES:
                 raise ConfigValidationError(
                     f"Invalid scanning mode: '{mode}'. "
-                    f"Must be one of: {', '.join(cls.VALID_MODES)}"
+                    f"Must be one of: {', '.join(cls._VALID_MODES_DISPLAY)}"
                 )
         
         if 'max_file_size' in scanning:
@@ -104,10 +135,10 @@ class ConfigValidator:
                 raise ConfigValidationError("'severity_overrides' must be a dictionary")
             
             for category, severity in overrides.items():
-                if severity not in cls.VALID_SEVERITIES:
+                if not isinstance(severity, str) or severity not in cls.VALID_SEVERITIES:
                     raise ConfigValidationError(
                         f"Invalid severity override for '{category}': '{severity}'. "
-                        f"Must be one of: {', '.join(cls.VALID_SEVERITIES)}"
+                        f"Must be one of: {', '.join(cls._VALID_SEVERITIES_DISPLAY)}"
                     )
         
         # Validate whitelist
@@ -137,19 +168,23 @@ class ConfigValidator:
         # Validate severity if provided
         if 'severity' in pattern:
             severity = pattern['severity']
-            if severity not in cls.VALID_SEVERITIES:
+            if not isinstance(severity, str) or severity not in cls.VALID_SEVERITIES:
                 raise ConfigValidationError(
                     f"Invalid severity in custom pattern '{pattern.get('name', index)}': "
-                    f"'{severity}'. Must be one of: {', '.join(cls.VALID_SEVERITIES)}"
+                    f"'{severity}'. Must be one of: {', '.join(cls._VALID_SEVERITIES_DISPLAY)}"
                 )
         
         # Validate regex pattern
+        regex = pattern['pattern']
+        if regex in _VALID_PATTERNS:
+            return
         try:
-            re.compile(pattern['pattern'])
+            re.compile(regex)
         except re.error as e:
             raise ConfigValidationError(
                 f"Invalid regex pattern in '{pattern.get('name', index)}': {e}"
             )
+        _VALID_PATTERNS.add(regex)
     
     @classmethod
     def _validate_secret_detection(cls, config: Dict[str, Any]) -> None:
@@ -204,10 +239,10 @@ class ConfigValidator:
         
         if 'format' in output:
             fmt = output['format']
-            if fmt not in cls.VALID_FORMATS:
+            if not isinstance(fmt, str) or fmt not in cls.VALID_FORMATS:
                 raise ConfigValidationError(
                     f"Invalid output format: '{fmt}'. "
-                    f"Must be one of: {', '.join(cls.VALID_FORMATS)}"
+                    f"Must be one of: {', '.join(cls._VALID_FORMATS_DISPLAY)}"
                 )
         
         if 'color' in output and not isinstance(output['color'], bool):
@@ -223,6 +258,4 @@ class ConfigValidator:
         if not isinstance(size, str):
             return False
         
-        # Pattern: number followed by optional unit (B, KB, MB, GB)
-        pattern = r'^\d+\s*(B|KB|MB|GB|K|M|G)?$'
-        return bool(re.match(pattern, size, re.IGNORECASE))
+        return bool(_SIZE_RE.match(size))
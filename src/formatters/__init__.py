@@ -0,0 +1,53 @@
+"""
+Output Formatters for Orange TrustSkill v3.0
+
+Formatters hold no per-report state, so get_formatter() hands out one
+shared instance per configuration. Formatter modules are imported only
+when first requested.
+"""
+
+import sys
+from functools import lru_cache
+
+from .base import BaseFormatter
+
+FORMATS = ('text', 'json', 'markdown')
+
+
+@lru_cache(maxsize=8)
+def _cached_formatter(format_name: str, use_color: bool) -> BaseFormatter:
+    """Build the formatter for a resolved configuration."""
+    if format_name == 'json':
+        from .json_formatter import JsonFormatter
+        return JsonFormatter()
+    if format_name == 'markdown':
+        from .markdown_formatter import MarkdownFormatter
+        return MarkdownFormatter()
+    if format_name == 'text':
+        from .text_formatter import TextFormatter
+        return TextFormatter(use_color=use_color)
+    raise ValueError(
+        f"Unknown output format: '{format_name}'. Must be one of: {', '.join(FORMATS)}"
+    )
+
+
+def get_formatter(format_name: str = 'text', use_color: bool = True) -> BaseFormatter:
+    """
+    Get the shared formatter for an output format.
+
+    Args:
+        format_name: One of FORMATS
+        use_color: Colorize text output (only when stdout is a terminal)
+
+    Returns:
+        Formatter instance, shared between calls with the same settings
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    # Resolve the terminal check per call; only text output is colored
+    use_color = format_name == 'text' and use_color and sys.stdout.isatty()
+    return _cached_formatter(format_name, use_color)
+
+
+__all__ = ['BaseFormatter', 'FORMATS', 'get_formatter']
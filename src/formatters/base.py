@@ -3,7 +3,7 @@ Base Output Formatter Class
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, TextIO
 
 from ..types import ScanResult
 
@@ -24,6 +24,20 @@ class BaseFormatter(ABC):
         """
         pass
     
+    def format_to(self, result: ScanResult, out: TextIO) -> None:
+        """
+        Write the formatted scan results to a text stream.
+        
+        Produces the same text as format(); formatters that can emit
+        their output piecewise override this to avoid building the whole
+        report in memory first.
+        
+        Args:
+            result: The scan results object.
+            out: Writable text stream, e.g. sys.stdout.
+        """
+        out.write(self.format(result))
+    
     @abstractmethod
     def get_name(self) -> str:
         """Get the name of the formatter."""
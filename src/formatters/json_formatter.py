@@ -1,9 +1,19 @@
 """
 JSON Output Formatter
+
+Uses orjson when it is installed. Its 2-space indented output has the
+layout of json.dumps(indent=2, ensure_ascii=False), but floats are
+spelled its own way (0.00005 where json writes 5e-05), so the text is
+not always identical.
 """
 
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional, TextIO
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
 from .base import BaseFormatter
 from ..types import ScanResult
@@ -20,4 +30,51 @@ class JsonFormatter(BaseFormatter):
     
     def format(self, result: ScanResult) -> str:
         """Format the scan result as a JSON string."""
-        return json.dumps(result.to_dict(), indent=self.indent, ensure_ascii=False)
+        data = result.to_dict()
+        text = self._orjson_text(data)
+        if text is not None:
+            return text
+        return json.dumps(data, indent=self.indent, ensure_ascii=False)
+    
+    def format_to(self, result: ScanResult, out: TextIO) -> None:
+        """
+        Write the scan result as JSON to a text stream.
+        
+        Without orjson the report is written chunk by chunk by json.dump.
+        orjson serializes the whole report at once, so that path holds it
+        in memory; use format_bytes() to skip decoding it for a binary stream.
+        """
+        data = result.to_dict()
+        text = self._orjson_text(data)
+        if text is not None:
+            out.write(text)
+        else:
+            json.dump(data, out, indent=self.indent, ensure_ascii=False)
+    
+    def format_bytes(self, result: ScanResult) -> bytes:
+        """
+        Format the scan result as UTF-8 encoded JSON.
+        
+        Equal to format(result).encode('utf-8'); orjson's output is
+        returned as is, without a decode and re-encode.
+        """
+        data = result.to_dict()
+        raw = self._orjson_bytes(data)
+        if raw is not None:
+            return raw
+        return json.dumps(data, indent=self.indent, ensure_ascii=False).encode('utf-8')
+    
+    def _orjson_text(self, data: Dict[str, Any]) -> Optional[str]:
+        """Serialize with orjson if possible, else None."""
+        raw = self._orjson_bytes(data)
+        return raw.decode('utf-8') if raw is not None else None
+    
+    def _orjson_bytes(self, data: Dict[str, Any]) -> Optional[bytes]:
+        """Serialize to UTF-8 bytes with orjson if possible, else None."""
+        # orjson only supports 2-space indentation
+        if orjson is None or self.indent != 2:
+            return None
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            return None  # e.g. lone surrogates, which the json module still accepts
@@ -2,90 +2,112 @@
 Markdown Formatter - Optimized for LLM-assisted review.
 """
 
+import io
+from typing import TextIO
+
 from .base import BaseFormatter
 from ..types import ScanResult, Severity
 
 
+# Static report header; only the scan details and counts vary per report
+_HEADER_TMPL = (
+    "# 🔒 Orange TrustSkill - Security Scan Report\n"
+    "\n"
+    "---\n"
+    "\n"
+    "## 📋 Scan Information\n"
+    "\n"
+    "- **Skill Path**: `{skill_path}`\n"
+    "- **Files Scanned**: {files_scanned}\n"
+    "- **Scan Time**: {scan_time:.2f}s\n"
+    "- **Timestamp**: {timestamp}\n"
+    "\n"
+    "---\n"
+    "\n"
+    "## 📊 Risk Summary\n"
+    "\n"
+    "| Level | Count |\n"
+    "|-------|-------|\n"
+    "| 🔴 HIGH | {HIGH} |\n"
+    "| 🟡 MEDIUM | {MEDIUM} |\n"
+    "| 🟢 LOW | {LOW} |\n"
+    "\n"
+    "---\n"
+    "\n"
+)
+
 class MarkdownFormatter(BaseFormatter):
     """Markdown Formatter for security report generation."""
     
+    # Risk Level Icons
+    _SEVERITY_ICON = {
+        Severity.HIGH: '🔴',
+        Severity.MEDIUM: '🟡',
+        Severity.LOW: '🟢',
+        Severity.INFO: '🔵'
+    }
+    
     def get_name(self) -> str:
         return "MarkdownFormatter"
     
     def format(self, result: ScanResult) -> str:
         """Format the scan result as a Markdown report."""
-        lines = [
-            "# 🔒 Orange TrustSkill - Security Scan Report",
-            "",
-            "---",
-            "",
-            "## 📋 Scan Information",
-            "",
-            f"- **Skill Path**: `{result.skill_path}`",
-            f"- **Files Scanned**: {result.files_scanned}",
-            f"- **Scan Time**: {result.scan_time:.2f}s",
-            f"- **Timestamp**: {result.timestamp}",
-            "",
-            "---",
-            "",
-            "## 📊 Risk Summary",
-            "",
-            "| Level | Count |",
-            "|-------|-------|",
-            f"| 🔴 HIGH | {result.risk_summary['HIGH']} |",
-            f"| 🟡 MEDIUM | {result.risk_summary['MEDIUM']} |",
-            f"| 🟢 LOW | {result.risk_summary['LOW']} |",
-            "",
-            "---",
-            "",
-        ]
+        buffer = io.StringIO()
+        self.format_to(result, buffer)
+        return buffer.getvalue()
+    
+    def format_to(self, result: ScanResult, out: TextIO) -> None:
+        """Write the scan result as a Markdown report to a text stream."""
+        write = out.write
+        summary = result.risk_summary
+        write(_HEADER_TMPL.format(
+            skill_path=result.skill_path,
+            files_scanned=result.files_scanned,
+            scan_time=result.scan_time,
+            timestamp=result.timestamp,
+            HIGH=summary['HIGH'],
+            MEDIUM=summary['MEDIUM'],
+            LOW=summary['LOW'],
+        ))
         
         if result.findings:
-            lines.extend([
-                "## 🚨 Detailed Findings",
-                "",
-            ])
+            write(
+                "## 🚨 Detailed Findings\n"
+                "\n"
+            )
             
             for finding in result.findings:
-                icon = {
-                    Severity.HIGH: '🔴',
-                    Severity.MEDIUM: '🟡',
-                    Severity.LOW: '🟢',
-                    Severity.INFO: '🔵'
-                }.get(finding.level, '⚪')
+                icon = self._SEVERITY_ICON.get(finding.level, '⚪')
                 
-                lines.extend([
-                    f"### {icon} [{finding.level.value}] {finding.category}",
-                    "",
-                    f"- **File**: `{finding.file}:{finding.line}`",
-                    f"- **Issue**: {finding.description}",
-                    f"- **Confidence**: {finding.confidence:.0%}",
-                    "",
-                    "**Code Snippet**:",
-                    "```",
-                    finding.snippet,
-                    "```",
-                    "",
-                    "---",
-                    "",
-                ])
+                write(
+                    f"### {icon} [{finding.level.value}] {finding.category}\n"
+                    "\n"
+                    f"- **File**: `{finding.file}:{finding.line}`\n"
+                    f"- **Issue**: {finding.description}\n"
+                    f"- **Confidence**: {finding.confidence:.0%}\n"
+                    "\n"
+                    "**Code Snippet**:\n"
+                    "```\n"
+                    f"{finding.snippet}\n"
+                    "```\n"
+                    "\n"
+                    "---\n"
+                    "\n"
+                )
         else:
-            lines.extend([
-                "## ✅ Result",
-                "",
-                "No security issues found.",
-                "",
-                "---",
-                "",
-            ])
-        
-        lines.extend([
-            "## 📝 Assessment",
-            "",
-            result.security_assessment,
-            "",
-            "---",
-            "",
-        ])
+            write(
+                "## ✅ Result\n"
+                "\n"
+                "No security issues found.\n"
+                "\n"
+                "---\n"
+                "\n"
+            )
         
-        return '\n'.join(lines)
+        write(
+            "## 📝 Assessment\n"
+            "\n"
+            f"{result.security_assessment}\n"
+            "\n"
+            "---\n"
+        )
@@ -2,13 +2,23 @@
 Text Formatter - Provides colorized output and progress visualization.
 """
 
+import io
 import sys
-from typing import Optional
+import time
+from typing import Optional, TextIO
 
 from .base import BaseFormatter
 from ..types import ScanResult, SecurityIssue, Severity
 
 
+_UNKNOWN_ICON = '⚪'.encode('utf-8')
+
+
+def _plain(text: str, color: str) -> str:
+    """Color function used when color is disabled."""
+    return text
+
+
 class TextFormatter(BaseFormatter):
     """Text Formatter with ANSI color support."""
     
@@ -23,6 +33,7 @@ class TextFormatter(BaseFormatter):
         'BOLD': '\033[1m',
         'RESET': '\033[0m'
     }
+    _RESET = COLORS['RESET']
     
     # Risk Level Icons
     ICONS = {
@@ -32,72 +43,149 @@ class TextFormatter(BaseFormatter):
         Severity.INFO: '🔵'
     }
     
+    # Risk Level Colors
+    LEVEL_COLOR = {
+        Severity.HIGH: 'RED',
+        Severity.MEDIUM: 'YELLOW',
+        Severity.LOW: 'GREEN',
+        Severity.INFO: 'BLUE'
+    }
+    
+    # Icons for format_bytes()
+    _ICON_BYTES = {level: icon.encode('utf-8') for level, icon in ICONS.items()}
+    
     def __init__(self, use_color: bool = True):
         self.use_color = use_color and sys.stdout.isatty()
+        if not self.use_color:
+            # Decide once rather than on every call
+            self._color = _plain
     
     def _color(self, text: str, color: str) -> str:
-        """Apply color to text if color is enabled."""
-        if not self.use_color:
-            return text
-        return f"{self.COLORS.get(color, '')}{text}{self.COLORS['RESET']}"
+        """Apply color to text (replaced by _plain when color is disabled)."""
+        return f"{self.COLORS.get(color, '')}{text}{self._RESET}"
     
     def get_name(self) -> str:
         return "TextFormatter"
     
     def format(self, result: ScanResult) -> str:
         """Format the scan results into a human-readable text report."""
-        lines = []
+        buffer = io.StringIO()
+        self.format_to(result, buffer)
+        return buffer.getvalue()
+    
+    def format_to(self, result: ScanResult, out: TextIO) -> None:
+        """Write the human-readable text report to a text stream."""
+        write = out.write
+        rule = self._color("=" * 60, 'BOLD')
+        
+        self._write_header(result, write, rule)
+        for i, finding in enumerate(result.findings, 1):
+            write(self._format_finding(finding, i))
+            write("\n")
+        self._write_footer(result, write, rule)
+    
+    def format_bytes(self, result: ScanResult) -> bytes:
+        """
+        Format the text report as UTF-8 bytes.
+        
+        Equal to format(result).encode('utf-8'), but findings, the bulk of
+        large reports, are laid out as bytes directly, so the report can be
+        written to a binary stream without an encoding pass over it.
+        """
+        rule = self._color("=" * 60, 'BOLD')
+        parts = []
         
+        text = io.StringIO()
+        self._write_header(result, text.write, rule)
+        parts.append(text.getvalue().encode('utf-8'))
+        
+        # One bytes template per report, laid out and colored like
+        # _format_finding() plus its trailing newline
+        template = (
+            "\n%s [%s] %s\n"
+            f"   📄 File: {self._color('%s', 'CYAN')}:%s\n"
+            "   📝 Issue: %s\n"
+            "%s"
+            f"   💻 Code: {self._color('%s', 'MAGENTA')}\n"
+            "   " + "-" * 50 + "\n"
+        ).encode('utf-8')
+        levels = {
+            level: self._color(level.value, color).encode('utf-8')
+            for level, color in self.LEVEL_COLOR.items()
+        }
+        icons = self._ICON_BYTES
+        confidence_lines = {}
+        
+        append = parts.append
+        for finding in result.findings:
+            confidence = finding.confidence
+            if confidence < 1.0:
+                confidence_line = confidence_lines.get(confidence)
+                if confidence_line is None:
+                    confidence_line = f"   🎯 Confidence: {confidence:.0%}\n".encode('utf-8')
+                    confidence_lines[confidence] = confidence_line
+            else:
+                confidence_line = b''
+            
+            append(template % (
+                icons.get(finding.level, _UNKNOWN_ICON),
+                levels[finding.level],
+                finding.category.encode('utf-8'),
+                finding.file.encode('utf-8'),
+                str(finding.line).encode('ascii'),
+                finding.description.encode('utf-8'),
+                confidence_line,
+                finding.snippet.encode('utf-8'),
+            ))
+        
+        text = io.StringIO()
+        self._write_footer(result, text.write, rule)
+        parts.append(text.getvalue().encode('utf-8'))
+        
+        return b''.join(parts)
+    
+    def _write_header(self, result: ScanResult, write, rule: str) -> None:
+        """Write everything that precedes the individual findings."""
         # Header
-        lines.append(self._color("=" * 60, 'BOLD'))
-        lines.append(self._color("🍊 ORANGE TRUSTSKILL - SECURITY SCAN REPORT", 'BOLD'))
-        lines.append(self._color("=" * 60, 'BOLD'))
+        write(f"{rule}\n")
+        write(f"{self._color('🍊 ORANGE TRUSTSKILL - SECURITY SCAN REPORT', 'BOLD')}\n")
+        write(f"{rule}\n")
         
         # Scan Information
-        lines.append(f"\n📁 Skill: {result.skill_path}")
-        lines.append(f"📄 Files Scanned: {result.files_scanned}")
-        lines.append(f"⏱️  Scan Time: {result.scan_time:.2f}s")
-        lines.append(f"🕐 Timestamp: {result.timestamp}")
+        write(f"\n📁 Skill: {result.skill_path}\n")
+        write(f"📄 Files Scanned: {result.files_scanned}\n")
+        write(f"⏱️  Scan Time: {result.scan_time:.2f}s\n")
+        write(f"🕐 Timestamp: {result.timestamp}\n")
         
         # Risk Summary
         summary = result.risk_summary
-        lines.append(f"\n{self._color('📊 Risk Summary:', 'BOLD')}")
-        lines.append(f"  {self.ICONS[Severity.HIGH]} {self._color('HIGH:', 'RED')}   {summary['HIGH']}")
-        lines.append(f"  {self.ICONS[Severity.MEDIUM]} {self._color('MEDIUM:', 'YELLOW')} {summary['MEDIUM']}")
-        lines.append(f"  {self.ICONS[Severity.LOW]} {self._color('LOW:', 'GREEN')}    {summary['LOW']}")
+        write(f"\n{self._color('📊 Risk Summary:', 'BOLD')}\n")
+        write(f"  {self.ICONS[Severity.HIGH]} {self._color('HIGH:', 'RED')}   {summary['HIGH']}\n")
+        write(f"  {self.ICONS[Severity.MEDIUM]} {self._color('MEDIUM:', 'YELLOW')} {summary['MEDIUM']}\n")
+        write(f"  {self.ICONS[Severity.LOW]} {self._color('LOW:', 'GREEN')}    {summary['LOW']}\n")
         if summary['INFO'] > 0:
-            lines.append(f"  {self.ICONS[Severity.INFO]} INFO:   {summary['INFO']}")
+            write(f"  {self.ICONS[Severity.INFO]} INFO:   {summary['INFO']}\n")
         
         # Detailed Findings
         if result.findings:
-            lines.append(f"\n{self._color('=' * 60, 'BOLD')}")
-            lines.append(self._color("DETAILED FINDINGS", 'BOLD'))
-            lines.append(self._color('=' * 60, 'BOLD'))
-            
-            for i, finding in enumerate(result.findings, 1):
-                lines.append(self._format_finding(finding, i))
+            write(f"\n{rule}\n")
+            write(f"{self._color('DETAILED FINDINGS', 'BOLD')}\n")
+            write(f"{rule}\n")
         else:
-            lines.append(f"\n{self._color('✅ No security issues found!', 'GREEN')}")
-        
+            write(f"\n{self._color('✅ No security issues found!', 'GREEN')}\n")
+    
+    def _write_footer(self, result: ScanResult, write, rule: str) -> None:
+        """Write everything that follows the individual findings."""
         # Assessment
-        lines.append(f"\n{self._color('=' * 60, 'BOLD')}")
-        lines.append(f"{self._color('Assessment:', 'BOLD')} {result.security_assessment}")
-        lines.append(self._color('=' * 60, 'BOLD'))
-        
-        return '\n'.join(lines)
+        write(f"\n{rule}\n")
+        write(f"{self._color('Assessment:', 'BOLD')} {result.security_assessment}\n")
+        write(rule)
     
     def _format_finding(self, finding: SecurityIssue, index: int) -> str:
         """Format a single security finding."""
         lines = []
         icon = self.ICONS.get(finding.level, '⚪')
-        
-        # Level color mapping
-        level_color = {
-            Severity.HIGH: 'RED',
-            Severity.MEDIUM: 'YELLOW',
-            Severity.LOW: 'GREEN',
-            Severity.INFO: 'BLUE'
-        }.get(finding.level, 'RESET')
+        level_color = self.LEVEL_COLOR.get(finding.level, 'RESET')
         
         lines.append(f"\n{icon} [{self._color(finding.level.value, level_color)}] {finding.category}")
         lines.append(f"   📄 File: {self._color(finding.file, 'CYAN')}:{finding.line}")
@@ -113,17 +201,32 @@ class TextFormatter(BaseFormatter):
 class ProgressTracker:
     """Real-time Progress Tracker for CLI."""
     
+    # Minimum seconds between redraws; intermediate updates are only counted
+    MIN_INTERVAL = 0.05
+    
     def __init__(self, total: int, use_color: bool = True):
         self.total = total
         self.current = 0
         self.findings = 0
         self.use_color = use_color and sys.stdout.isatty()
+        self._last_draw = float('-inf')
+        self._drawn = 0  # Value of current when the bar was last drawn
     
     def update(self, filename: str, new_findings: int = 0):
         """Update the progress bar."""
         self.current += 1
         self.findings += new_findings
         
+        # Throttle redraws, but always show the final file
+        now = time.monotonic()
+        if self.current != self.total and now - self._last_draw < self.MIN_INTERVAL:
+            return
+        self._last_draw = now
+        self._draw()
+    
+    def _draw(self):
+        """Render the progress bar for the current state."""
+        self._drawn = self.current
         progress = (self.current / self.total) * 100
         bar_length = 30
         filled = int(bar_length * self.current / self.total)
@@ -137,4 +240,7 @@ class ProgressTracker:
     
     def finish(self):
         """Finalize the progress tracker."""
+        # Show the last state if its update was throttled
+        if self.current != self._drawn:
+            self._draw()
         print()  # New line
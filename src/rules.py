@@ -4,6 +4,13 @@ Scanning Rules and Configurations
 
 from typing import List, Tuple, Dict, Any
 
+# Every entry below costs one regex pass per scanned file, so a pattern
+# string belongs to exactly one severity table and category.
+#
+# All pattern tables in this module (risk, suspicious URL, whitelist and
+# placeholder patterns) are compiled once with re.IGNORECASE: write them
+# in lowercase and without case variants such as [Pp]assword.
+
 # High Risk Patterns - Malicious Code Detection
 HIGH_RISK_PATTERNS = {
     "command_injection": [
@@ -60,7 +67,7 @@ MEDIUM_RISK_PATTERNS = {
         (r"urllib\.request\.urlretrieve", "File download via urllib"),
         (r"requests\.get\s*\([^)]*stream\s*=\s*True", "Streaming download"),
         (r"wget\s+", "wget download command"),
-        (r"curl\s+-[Oo]", "curl download"),
+        (r"curl\s+-o", "curl download"),
     ],
     "file_access_outside_workspace": [
         (r'open\s*\([^)]*[\'"]\s*/etc/', "System file access (/etc)"),
@@ -142,6 +149,10 @@ SAFE_SERVICES = [
     "files.pythonhosted.org",
 ]
 
+# Safe service lookups by URL hostname: exact hosts, plus their subdomains
+SAFE_SERVICE_HOSTS = frozenset(SAFE_SERVICES)
+SAFE_SERVICE_SUFFIXES = tuple("." + host for host in SAFE_SERVICES)
+
 # File Extensions to Scan
 SCAN_EXTENSIONS = {
     ".py",
@@ -168,22 +179,31 @@ SCAN_EXTENSIONS = {
 }
 
 # Ignored Files and Directories
-IGNORE_PATTERNS = [
-    r"\.git",
-    r"\.svn",
-    r"\.hg",
-    r"node_modules",
-    r"__pycache__",
-    r"\.pytest_cache",
-    r"\.venv",
-    r"venv",
-    r"\.env",
-    r"dist",
-    r"build",
-    r"\.egg-info",
-    r"\.tox",
-    r"\.coverage",
-]
+_IGNORE_NAMES = (
+    ".git",
+    ".svn",
+    ".hg",
+    "node_modules",
+    "__pycache__",
+    ".pytest_cache",
+    ".venv",
+    "venv",
+    ".env",
+    "dist",
+    "build",
+    ".egg-info",
+    ".tox",
+    ".coverage",
+)
+
+# Directory and file names that exclude a path from scanning when they are
+# any segment of it (below the skill root), and name suffixes that do the same
+IGNORE_SUFFIXES = (".egg-info",)
+IGNORE_LITERALS = frozenset(_IGNORE_NAMES) - frozenset(IGNORE_SUFFIXES)
+
+# Deprecated: regex form of the names above, no longer used by the scanner.
+# Derived so it cannot drift; "." is the only metacharacter in the names.
+IGNORE_PATTERNS = [name.replace(".", r"\.") for name in _IGNORE_NAMES]
 
 # Default Whitelist Patterns for Known False Positives
 # These patterns are safe by design and should not trigger security warnings
@@ -198,8 +218,8 @@ DEFAULT_WHITELIST_PATTERNS = [
     r"Configure in `AGENTS\.md`",  # Configuration documentation
     r"registered slash commands in AGENTS\.md",  # Documentation reference
     # Testing utilities with shell=True (legitimate use cases)
-    r"# .*[Tt]esting.*\n.*subprocess.*shell\s*=\s*True",  # Testing context
-    r"# .*[Ss]erver.*\n.*subprocess.*shell\s*=\s*True",  # Server management
+    r"# .*testing.*\n.*subprocess.*shell\s*=\s*True",  # Testing context
+    r"# .*server.*\n.*subprocess.*shell\s*=\s*True",  # Server management
     r"with_server\.py",  # Server orchestration utilities
     r"test_.*\.py",  # Test files
     r"_test\.py",  # Test files (alternative naming)
@@ -2,34 +2,147 @@
 Main Scanner Engine - Orchestrates all analyzers.
 """
 
+import ast
+import importlib
+import os
 import time
 from pathlib import Path
-from typing import List, Optional, Type
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
-from .types import ScanResult, SecurityIssue, AnalysisMode
+from .types import ScanResult, SecurityIssue, Severity, AnalysisMode
+from .utils.line_index import LineIndex
 from .analyzers.base import BaseAnalyzer
 from .analyzers.regex_analyzer import RegexAnalyzer
-from .analyzers.ast_analyzer import ASTAnalyzer
-from .analyzers.secret_analyzer import SecretAnalyzer
-from .analyzers.dependency_analyzer import DependencyAnalyzer
-from .analyzers.taint_analyzer import TaintAnalyzer
-from .rules import SCAN_EXTENSIONS, IGNORE_PATTERNS, LOCK_FILES
-import re
+from .rules import (
+    SCAN_EXTENSIONS,
+    IGNORE_LITERALS,
+    IGNORE_SUFFIXES,
+    LOCK_FILES,
+)
+
+if TYPE_CHECKING:
+    from .cache import ScanCache
+
+# Analyzers imported only by the modes that run them (see _init_analyzers);
+# still reachable as attributes of this module for existing imports
+_LAZY_ANALYZERS = {
+    "ASTAnalyzer": ".analyzers.ast_analyzer",
+    "SecretAnalyzer": ".analyzers.secret_analyzer",
+    "DependencyAnalyzer": ".analyzers.dependency_analyzer",
+    "TaintAnalyzer": ".analyzers.taint_analyzer",
+}
+
+
+def __getattr__(name: str):
+    """Resolve lazily imported analyzer classes (PEP 562)."""
+    module = _LAZY_ANALYZERS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __package__), name)
+
+
+# Per-process scanner used by worker processes in parallel scans
+_worker_scanner: Optional["SkillScanner"] = None
+
+# Below this many files, starting worker processes costs more than it saves
+_MIN_PARALLEL_FILES = 4
+
+
+def _init_worker(mode: AnalysisMode, config) -> None:
+    """Build the analyzers once per worker process."""
+    global _worker_scanner
+    _worker_scanner = SkillScanner(mode=mode, config=config)
+
+
+def _scan_one(file_path: Path) -> Optional[List[SecurityIssue]]:
+    """Scan a single file in a worker process."""
+    return _worker_scanner._scan_file(file_path)
+
+
+def _read_source(file_path: Path, max_size: Optional[int] = None) -> Optional[str]:
+    """
+    Read a file as UTF-8 text, dropping undecodable bytes.
+
+    Returns None, without reading, if the file is larger than max_size bytes.
+    """
+    # One binary read and decode skips the text-mode incremental decoder;
+    # newlines are normalized afterwards just as universal newlines would
+    with open(file_path, "rb") as source:
+        if max_size is not None and os.fstat(source.fileno()).st_size > max_size:
+            return None
+        data = source.read()
+    content = data.decode("utf-8", "ignore")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+# File listings kept per scanner, evicted oldest first
+_FILES_CACHE_SIZE = 16
+
+# A directory modified this close to a walk may change again within the
+# same timestamp tick without its mtime moving, so its listing is not reused
+_RACY_MTIME_NS = 2_000_000_000
+
+
+def _dir_mtime(path: str) -> int:
+    """Return a directory's mtime in nanoseconds, or -1 if it cannot be read."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _oversized_file_issue(file_path: Path, max_size: int) -> SecurityIssue:
+    """Report a file that was skipped for exceeding the size limit."""
+    # An unanalysed file may hide anything, so it counts as high risk
+    return SecurityIssue(
+        level=Severity.HIGH,
+        category="file_too_large",
+        description=f"File larger than {max_size} bytes was not scanned",
+        file=file_path.name,
+        line=0,
+        snippet="",
+    )
+
+
+def _is_ignored_name(name: str) -> bool:
+    """Check if a file or directory name excludes it from scanning."""
+    return name in IGNORE_LITERALS or name.endswith(IGNORE_SUFFIXES)
 
 
 class SkillScanner:
     """Skill Security Scanner - Main Entry Point"""
 
-    def __init__(self, mode: AnalysisMode = AnalysisMode.STANDARD, config=None):
+    def __init__(
+        self,
+        mode: AnalysisMode = AnalysisMode.STANDARD,
+        config=None,
+        cache: Optional["ScanCache"] = None,
+        workers: int = 1,
+    ):
         """
         Initialize the scanner.
 
         Args:
             mode: Analysis mode (FAST, STANDARD, DEEP)
             config: Optional configuration object (v3.0+)
+            cache: Optional persistent cache of per-file findings
+            workers: Number of worker processes (0 = one per CPU, 1 = serial)
         """
         self.mode = mode
         self.config = config
+        self.cache = cache
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        scanning = getattr(config, "scanning", None)
+        # Size limit for skipped files; None scans every file whole
+        self.max_file_size: Optional[int] = (
+            scanning.max_file_size_bytes
+            if scanning is not None and scanning.skip_large_files
+            else None
+        )
+        # skill path -> (mtime of every walked directory, sorted file list)
+        self._files_cache: Dict[str, Tuple[Dict[str, int], List[Path]]] = {}
         self.analyzers = self._init_analyzers()
 
     def _init_analyzers(self) -> List[BaseAnalyzer]:
@@ -41,62 +154,266 @@ class SkillScanner:
 
         # AST analysis is included in STANDARD and DEEP modes
         if self.mode in [AnalysisMode.STANDARD, AnalysisMode.DEEP]:
+            from .analyzers.ast_analyzer import ASTAnalyzer
             analyzers.append(ASTAnalyzer(self.mode, self.config))
 
         # v3.0: Add secret detection analyzer
         try:
+            from .analyzers.secret_analyzer import SecretAnalyzer
             analyzers.append(SecretAnalyzer(self.mode, self.config))
         except Exception:
             pass  # Secret analyzer is optional
 
         # v3.0: Add dependency vulnerability analyzer
         try:
+            from .analyzers.dependency_analyzer import DependencyAnalyzer
             analyzers.append(DependencyAnalyzer(self.mode, self.config))
         except Exception:
-            pass  # Dependency analyzer is optional
+            pass  # Dependency analyzer is optional (needs 'packaging')
 
         # v3.0: Add taint analysis for DEEP mode
         if self.mode == AnalysisMode.DEEP:
             try:
+                from .analyzers.taint_analyzer import TaintAnalyzer
                 analyzers.append(TaintAnalyzer(self.mode, self.config))
             except Exception:
                 pass  # Taint analyzer is optional
 
         return analyzers
 
+    def _parse_python(self, file_path: Path, content: str) -> Optional[ast.AST]:
+        """Parse a Python file once so AST-based analyzers can share the tree."""
+        if file_path.suffix != ".py":
+            return None
+        try:
+            return ast.parse(content)
+        except (SyntaxError, ValueError):
+            return None
+
+    def _run_analyzers(
+        self, file_path: Path, content: str, analyzers: List[BaseAnalyzer]
+    ) -> Dict[str, List[SecurityIssue]]:
+        """Run the given analyzers on one file, keyed by analyzer name."""
+        results: Dict[str, List[SecurityIssue]] = {}
+
+        # Drop analyzers that cannot apply to this file or whose trigger
+        # literals are all absent from it
+        python_source = file_path.suffix == ".py"
+        runnable = []
+        for analyzer in analyzers:
+            if (analyzer.uses_python_ast and not python_source) or analyzer.can_skip(
+                content
+            ):
+                results[analyzer.get_name()] = []
+            else:
+                runnable.append(analyzer)
+
+        # Parse Python sources and index newlines once per file, and share
+        # them between the analyzers; both are dropped with the file
+        tree = None
+        if any(a.uses_python_ast for a in runnable):
+            tree = self._parse_python(file_path, content)
+        line_index = None
+        if any(a.uses_line_index for a in runnable):
+            line_index = LineIndex(content)
+
+        for analyzer in runnable:
+            try:
+                if analyzer.uses_python_ast:
+                    if tree is None:
+                        # Not Python, or unparseable: nothing for AST analyzers
+                        results[analyzer.get_name()] = []
+                        continue
+                    findings = analyzer.analyze_iter(file_path, content, tree=tree)
+                elif analyzer.uses_line_index:
+                    findings = analyzer.analyze_iter(file_path, content, line_index=line_index)
+                else:
+                    findings = analyzer.analyze_iter(file_path, content)
+                # Drain inside the try so a failing analyzer contributes nothing
+                results[analyzer.get_name()] = list(findings)
+            except Exception:
+                # Continue if an analyzer fails
+                continue
+
+        return results
+
+    def _scan_file_cached(self, file_path: Path) -> Optional[List[SecurityIssue]]:
+        """
+        Scan one file through the persistent cache.
+
+        The file is only read when at least one analyzer has no cached
+        result for its current content; an unchanged mtime and size are
+        trusted to mean unchanged content.
+
+        Returns:
+            Findings for the file, or None if it could not be read
+        """
+        cache = self.cache
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        if self.max_file_size is not None and stat.st_size > self.max_file_size:
+            return [_oversized_file_issue(file_path, self.max_file_size)]
+
+        context = cache.make_context(file_path, self.mode.value, self.config)
+        keys = {}
+        for analyzer in self.analyzers:
+            extra = analyzer.cache_key(file_path)
+            if extra is not None:
+                keys[analyzer.get_name()] = f"{context}|{extra}"
+
+        def lookup(digest: str) -> Dict[str, List[SecurityIssue]]:
+            hits = {}
+            for name, key in keys.items():
+                cached = cache.get(digest, name, key)
+                if cached is not None:
+                    hits[name] = cached
+            return hits
+
+        digest = cache.lookup_digest(file_path, stat)
+        results = lookup(digest) if digest is not None else {}
+        pending = [a for a in self.analyzers if a.get_name() not in results]
+
+        if pending:
+            try:
+                content = _read_source(file_path)
+            except Exception:
+                return None
+
+            if digest is None:
+                # Content may still be known, e.g. after a touch or checkout
+                digest = cache.digest(content)
+                cache.store_digest(file_path, stat, digest)
+                results = lookup(digest)
+                pending = [a for a in pending if a.get_name() not in results]
+
+            fresh = self._run_analyzers(file_path, content, pending)
+            for name, findings in fresh.items():
+                if name in keys:
+                    cache.put(digest, name, keys[name], findings)
+            results.update(fresh)
+
+        file_findings = []
+        for analyzer in self.analyzers:
+            file_findings.extend(results.get(analyzer.get_name(), []))
+        return file_findings
+
+    def _scan_file(self, file_path: Path) -> Optional[List[SecurityIssue]]:
+        """
+        Scan one file with all active analyzers.
+
+        Returns:
+            Findings for the file, or None if it could not be read
+        """
+        if self.cache is not None:
+            return self._scan_file_cached(file_path)
+
+        try:
+            content = _read_source(file_path, self.max_file_size)
+        except Exception:
+            return None
+        if content is None:
+            return [_oversized_file_issue(file_path, self.max_file_size)]
+
+        file_findings = []
+        for findings in self._run_analyzers(file_path, content, self.analyzers).values():
+            file_findings.extend(findings)
+        return file_findings
+
+    def _scan_files_parallel(
+        self, files: List[Path]
+    ) -> Iterator[Optional[List[SecurityIssue]]]:
+        """Scan files in worker processes, yielding results in file order."""
+        # Only parallel scans need the process pool machinery
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(files)),
+            initializer=_init_worker,
+            initargs=(self.mode, self.config),
+        ) as executor:
+            yield from executor.map(_scan_one, files, chunksize=8)
+
     def _should_ignore(self, path: Path) -> bool:
-        """Check if the given path should be ignored based on ignore patterns."""
-        path_str = str(path)
-        for pattern in IGNORE_PATTERNS:
-            if re.search(pattern, path_str):
-                return True
-        return False
+        """Check if any segment of the given (skill-relative) path is ignored."""
+        return any(_is_ignored_name(part) for part in path.parts)
 
     def _is_lock_file(self, path: Path) -> bool:
         """Check if file is a lock file that should have minimal scanning."""
         return path.name in LOCK_FILES
 
-    def _get_files_to_scan(self, skill_path: Path) -> List[Path]:
-        """Retrieve the list of files to be scanned."""
-        files = []
+    def _walk(
+        self, directory: str, dir_mtimes: Optional[Dict[str, int]] = None
+    ) -> Iterator[str]:
+        """
+        Yield paths of scannable files below a directory.
 
-        # Recursively traverse the directory
-        for item in skill_path.rglob("*"):
-            if item.is_file():
-                # Check if file is in ignore list
-                if self._should_ignore(item):
-                    continue
+        Ignored directories are pruned rather than walked, and only files
+        with a scanned extension are yielded. Like Path.rglob(), symlinked
+        directories are not followed but symlinked files are included.
+        If given, dir_mtimes receives the mtime of every directory listed,
+        taken before listing it.
+        """
+        if dir_mtimes is not None:
+            dir_mtimes[directory] = _dir_mtime(directory)
+        try:
+            with os.scandir(directory) as entries:
+                entries = list(entries)
+        except OSError:
+            return
+
+        for entry in entries:
+            name = entry.name
+            if _is_ignored_name(name):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._walk(entry.path, dir_mtimes)
+                elif os.path.splitext(name)[1] in SCAN_EXTENSIONS and entry.is_file():
+                    yield entry.path
+            except OSError:
+                continue
+
+    def _get_files_to_scan(self, skill_path: Path) -> List[Path]:
+        """
+        Retrieve the list of files to be scanned.
 
-                # Check file extension
-                if item.suffix in SCAN_EXTENSIONS:
-                    files.append(item)
+        Listings are reused while no walked directory has changed: adding,
+        removing or renaming an entry updates its directory's mtime, so a
+        stat per directory replaces listing all of them again.
+        """
+        key = str(skill_path)
+        cached = self._files_cache.get(key)
+        if cached is not None:
+            dir_mtimes, files = cached
+            if all(_dir_mtime(path) == mtime for path, mtime in dir_mtimes.items()):
+                return list(files)
+            del self._files_cache[key]
+
+        walked_at = time.time_ns()
+        dir_mtimes: Dict[str, int] = {}
+        files = [Path(path) for path in self._walk(key, dir_mtimes)]
 
         # Ensure SKILL.md is included
         skill_md = skill_path / "SKILL.md"
         if skill_md.exists() and skill_md not in files:
             files.append(skill_md)
 
-        return sorted(set(files))  # Deduplicate and sort
+        files.sort()  # The walk yields each file once
+
+        # Only listings of directories that have settled are safe to reuse
+        horizon = walked_at - _RACY_MTIME_NS
+        if all(0 <= mtime < horizon for mtime in dir_mtimes.values()):
+            if len(self._files_cache) >= _FILES_CACHE_SIZE:
+                del self._files_cache[next(iter(self._files_cache))]
+            self._files_cache[key] = (dir_mtimes, files)
+            return list(files)
+        return files
+
+    def clear_files_cache(self) -> None:
+        """Forget cached file listings, forcing the next scan to walk again."""
+        self._files_cache.clear()
 
     def scan(
         self, skill_path: str, progress_callback: Optional[callable] = None
@@ -130,24 +447,20 @@ class SkillScanner:
         all_findings: List[SecurityIssue] = []
         files_scanned = 0
 
-        # Scan each file
-        for file_path in files:
-            try:
-                content = file_path.read_text(encoding="utf-8", errors="ignore")
-            except Exception:
+        # Scan each file; the persistent cache is only used in-process
+        if (
+            self.workers > 1
+            and self.cache is None
+            and total_files >= _MIN_PARALLEL_FILES
+        ):
+            file_results = self._scan_files_parallel(files)
+        else:
+            file_results = map(self._scan_file, files)
+
+        for file_path, file_findings in zip(files, file_results):
+            if file_findings is None:
                 continue
 
-            file_findings = []
-
-            # Execute each active analyzer
-            for analyzer in self.analyzers:
-                try:
-                    findings = analyzer.analyze(file_path, content)
-                    file_findings.extend(findings)
-                except Exception:
-                    # Continue if an analyzer fails
-                    continue
-
             all_findings.extend(file_findings)
             files_scanned += 1
 
@@ -157,6 +470,9 @@ class SkillScanner:
                     file_path.name, files_scanned, total_files, len(all_findings)
                 )
 
+        if self.cache is not None:
+            self.cache.commit()
+
         scan_time = time.time() - start_time
 
         return ScanResult(
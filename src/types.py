@@ -3,13 +3,30 @@ Core Data Types for Orange TrustSkill
 Defines Severity, AnalysisMode, SecurityIssue, and ScanResult.
 """
 
+import sys
 from enum import Enum, auto
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Dict, Any
 from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime
 
 
+# Slotted dataclasses (smaller, faster attribute access) need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _assess_risk(summary: Dict[str, int]) -> str:
+    """Map a risk_summary to its human-readable assessment."""
+    if summary["HIGH"] > 0:
+        return "🔴 CRITICAL: High-risk issues detected. Manual review required."
+    elif summary["MEDIUM"] > 5:
+        return "🟡 WARNING: Multiple medium-risk issues found. Review recommended."
+    elif summary["MEDIUM"] > 0:
+        return "🟢 CAUTION: Some medium-risk issues found. Review suggested."
+    else:
+        return "✅ SAFE: No significant security issues found."
+
+
 class Severity(Enum):
     """Security Risk Severity Levels."""
     HIGH = "HIGH"
@@ -25,7 +42,7 @@ class AnalysisMode(Enum):
     DEEP = "deep"           # Regex + AST + Enhanced inspection
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SecurityIssue:
     """Represents a single detected security vulnerability."""
     level: Severity
@@ -49,7 +66,7 @@ class SecurityIssue:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScanResult:
     """Container for the complete scan operation results."""
     skill_path: str
@@ -61,32 +78,26 @@ class ScanResult:
     @property
     def risk_summary(self) -> Dict[str, int]:
         """Generate a summary count of issues by severity."""
-        summary = {"HIGH": 0, "MEDIUM": 0, "LOW": 0, "INFO": 0}
-        for finding in self.findings:
-            summary[finding.level.value] += 1
-        return summary
+        # list.count compares by identity in C, which beats a Python-level
+        # dict update per finding; keys keep the Severity declaration order
+        levels = [finding.level for finding in self.findings]
+        return {severity.value: levels.count(severity) for severity in Severity}
     
     @property
     def security_assessment(self) -> str:
         """Provide a human-readable assessment of the overall risk."""
-        summary = self.risk_summary
-        if summary["HIGH"] > 0:
-            return "🔴 CRITICAL: High-risk issues detected. Manual review required."
-        elif summary["MEDIUM"] > 5:
-            return "🟡 WARNING: Multiple medium-risk issues found. Review recommended."
-        elif summary["MEDIUM"] > 0:
-            return "🟢 CAUTION: Some medium-risk issues found. Review suggested."
-        else:
-            return "✅ SAFE: No significant security issues found."
+        return _assess_risk(self.risk_summary)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert the full scan result to a serializable dictionary."""
+        # Count severities once for both the summary and the assessment
+        summary = self.risk_summary
         return {
             "skill_path": self.skill_path,
             "files_scanned": self.files_scanned,
             "findings": [f.to_dict() for f in self.findings],
-            "risk_summary": self.risk_summary,
-            "security_assessment": self.security_assessment,
+            "risk_summary": summary,
+            "security_assessment": _assess_risk(summary),
             "scan_time": self.scan_time,
             "timestamp": self.timestamp
         }
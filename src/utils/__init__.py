@@ -3,5 +3,6 @@ Utility modules for Orange TrustSkill v3.0
 """
 
 from .entropy import EntropyCalculator
+from .line_index import LineIndex
 
-__all__ = ['EntropyCalculator']
+__all__ = ['EntropyCalculator', 'LineIndex']
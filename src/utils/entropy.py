@@ -6,7 +6,68 @@ Calculates Shannon entropy to identify high-entropy strings that may be secrets.
 
 import math
 import string
-from typing import Dict
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+
+# Candidate tokens (config keys, shared credentials, boilerplate) recur
+# across the files of a skill; only short strings are cached to bound memory
+_CACHE_MAX_LENGTH = 512
+
+# Strings up to this length look their per-character terms up in a table
+_TERM_TABLE_MAX_LENGTH = 256
+
+
+@lru_cache(maxsize=64)
+def _term_table(length: int) -> List[float]:
+    """
+    Entropy terms p * log2(p), with p = count / length, indexed by count.
+    
+    Each term is computed exactly as the direct loop would, so sums built
+    from the table are bit-identical to it.
+    """
+    log2 = math.log2
+    terms = [0.0]
+    for count in range(1, length + 1):
+        probability = count / length
+        terms.append(probability * log2(probability))
+    return terms
+
+
+def _entropy(data: str) -> float:
+    """Shannon entropy of a string, in bits per character."""
+    if not data:
+        return 0.0
+    
+    if len(data) == 1:
+        return 0.0
+    
+    # Count character frequencies (in C; first-occurrence order, so the
+    # sum below is accumulated in the same order as a manual count)
+    freq = Counter(data)
+    
+    # Calculate entropy
+    entropy = 0.0
+    length = len(data)
+    
+    # Candidate tokens are short and lengths repeat, so most strings index
+    # a precomputed table instead of dividing and taking a log per character
+    if length <= _TERM_TABLE_MAX_LENGTH:
+        terms = _term_table(length)
+        for count in freq.values():
+            entropy -= terms[count]
+        return entropy
+    
+    log2 = math.log2
+    for count in freq.values():
+        probability = count / length
+        entropy -= probability * log2(probability)
+    
+    return entropy
+
+
+_cached_entropy = lru_cache(maxsize=16384)(_entropy)
 
 
 class EntropyCalculator:
@@ -28,27 +89,51 @@ class EntropyCalculator:
         Returns:
             Entropy value (0-8 for typical character sets)
         """
-        if not data:
-            return 0.0
-        
-        if len(data) == 1:
-            return 0.0
+        if len(data) < _CACHE_MAX_LENGTH:
+            return _cached_entropy(data)
+        return _entropy(data)
+    
+    @classmethod
+    def calculate_batch(cls, data: Iterable[str]) -> List[float]:
+        """
+        Calculate Shannon entropy for several strings.
         
-        # Count character frequencies
-        freq: Dict[str, int] = {}
-        for char in data:
-            freq[char] = freq.get(char, 0) + 1
+        Repeated strings (common for keys reused across a file) are
+        scored once.
         
-        # Calculate entropy
-        entropy = 0.0
-        length = len(data)
+        Args:
+            data: Input strings
+            
+        Returns:
+            Entropy values in input order
+        """
+        scores: Dict[str, float] = {}
+        results = []
+        for item in data:
+            entropy = scores.get(item)
+            if entropy is None:
+                entropy = scores[item] = cls.calculate(item)
+            results.append(entropy)
+        return results
+    
+    @classmethod
+    def may_reach(cls, data: str, threshold: float) -> bool:
+        """
+        Cheap necessary condition for calculate(data) >= threshold.
         
-        for count in freq.values():
-            if count > 0:
-                probability = count / length
-                entropy -= probability * math.log2(probability)
+        Entropy is at most log2 of the number of distinct characters, so
+        strings with fewer than 2 ** threshold of them cannot reach it.
         
-        return entropy
+        Args:
+            data: Input string
+            threshold: Entropy threshold
+            
+        Returns:
+            False if the string's entropy is certainly below threshold
+        """
+        if threshold <= 0:
+            return True
+        return len(set(data)) >= 2 ** threshold
     
     @classmethod
     def is_high_entropy(
@@ -71,6 +156,9 @@ class EntropyCalculator:
         if len(data) < min_length:
             return False
         
+        if not cls.may_reach(data, threshold):
+            return False
+        
         entropy = cls.calculate(data)
         return entropy >= threshold
     
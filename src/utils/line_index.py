@@ -0,0 +1,95 @@
+"""
+Line Index for Offset-based Analyzers
+
+Maps character offsets to line numbers and line bounds in O(log n)
+using a precomputed, sorted list of newline offsets.
+"""
+
+import re
+from bisect import bisect_left
+from typing import Dict, List, Pattern, Tuple
+
+
+_NEWLINE_RE = re.compile("\n")
+
+
+class LineIndex:
+    """
+    Newline offset index for a single file's content.
+
+    Built once per file so that per-match line lookups do not need to
+    slice or count over the whole content prefix.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+        self.newlines: List[int] = [m.start() for m in _NEWLINE_RE.finditer(content)]
+        self._offsets_cache: Dict[Pattern, List[int]] = {}
+
+    def line_number(self, position: int) -> int:
+        """Return the 1-based line number containing the given offset."""
+        return bisect_left(self.newlines, position) + 1
+
+    def line_start(self, position: int) -> int:
+        """Return the offset of the first character of the line containing position."""
+        index = bisect_left(self.newlines, position)
+        return self.newlines[index - 1] + 1 if index else 0
+
+    def line_end(self, position: int) -> int:
+        """Return the offset of the newline (or end of content) ending the line."""
+        index = bisect_left(self.newlines, position)
+        return self.newlines[index] if index < len(self.newlines) else len(self.content)
+
+    def line_bounds(self, position: int) -> Tuple[int, int]:
+        """Return (start, end) offsets of the line containing position."""
+        newlines = self.newlines
+        index = bisect_left(newlines, position)
+        start = newlines[index - 1] + 1 if index else 0
+        end = newlines[index] if index < len(newlines) else len(self.content)
+        return start, end
+
+    def locate(self, position: int) -> Tuple[int, int, int]:
+        """Return (line number, start, end) of the line containing position in one search."""
+        newlines = self.newlines
+        index = bisect_left(newlines, position)
+        start = newlines[index - 1] + 1 if index else 0
+        end = newlines[index] if index < len(newlines) else len(self.content)
+        return index + 1, start, end
+
+    def line_text(self, line_number: int) -> str:
+        """Return the text of a 1-based line, without its newline."""
+        start = self.newlines[line_number - 2] + 1 if line_number > 1 else 0
+        if line_number <= len(self.newlines):
+            return self.content[start : self.newlines[line_number - 1]]
+        return self.content[start:]
+
+    def matched_lines(self, pattern: Pattern) -> List[int]:
+        """
+        Return the ascending 1-based numbers of lines where a match of pattern starts.
+
+        Matches are visited in order, so the line search only moves forward,
+        and scanning resumes at the next line after a hit: later matches on
+        the same line are never produced.
+        """
+        content = self.content
+        newlines = self.newlines
+        search = pattern.search
+        lines: List[int] = []
+        index = 0
+        match = search(content)
+        while match:
+            index = bisect_left(newlines, match.start(), index)
+            lines.append(index + 1)
+            if index == len(newlines):
+                break
+            match = search(content, newlines[index] + 1)
+            index += 1
+        return lines
+
+    def offsets_of(self, pattern: Pattern) -> List[int]:
+        """Return (and cache) the sorted start offsets of all matches of a compiled pattern."""
+        offsets = self._offsets_cache.get(pattern)
+        if offsets is None:
+            offsets = [m.start() for m in pattern.finditer(self.content)]
+            self._offsets_cache[pattern] = offsets
+        return offsets
@@ -0,0 +1,52 @@
+"""
+Regex Engine Selection for Rule Tables
+
+Rule patterns can be compiled with Google's RE2 (linear-time matching, no
+catastrophic backtracking) instead of Python's backtracking re engine.
+
+RE2 is opt-in via TRUSTSKILL_REGEX_ENGINE=re2 and only used when the
+google-re2 package is importable: its semantics differ from re in places
+(e.g. \\w and \\b are ASCII-only), so enabling it can change findings.
+Patterns RE2 cannot compile (lookaround, backreferences) always fall back
+to re individually.
+"""
+
+import os
+import re
+
+try:
+    import re2
+except ImportError:  # pragma: no cover - depends on the environment
+    re2 = None
+
+
+ENGINE_ENV_VAR = "TRUSTSKILL_REGEX_ENGINE"
+
+# Flags that can be expressed as RE2 inline modifiers
+_INLINE_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+_SUPPORTED_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL
+
+
+def use_re2() -> bool:
+    """Return True if rule patterns should be compiled with RE2."""
+    return re2 is not None and os.environ.get(ENGINE_ENV_VAR, "").lower() == "re2"
+
+
+def compile_pattern(pattern: str, flags: int = 0):
+    """
+    Compile a rule pattern with the selected engine.
+
+    Args:
+        pattern: Regular expression source
+        flags: re module flags (IGNORECASE, MULTILINE and DOTALL map to RE2)
+
+    Returns:
+        A compiled pattern supporting search/finditer and Match.start/group
+    """
+    if use_re2() and not flags & ~_SUPPORTED_FLAGS:
+        inline = "".join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+        try:
+            return re2.compile(f"(?{inline}){pattern}" if inline else pattern)
+        except Exception:
+            pass  # Unsupported syntax: keep Python's engine for this pattern
+    return re.compile(pattern, flags)
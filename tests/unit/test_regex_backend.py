@@ -0,0 +1,39 @@
+"""
+Unit Tests for Regex Engine Selection (src/utils/regex_backend.py)
+
+TDD Approach:
+1. Test the default engine is Python's re
+2. Test fallback when RE2 is requested but unavailable
+"""
+
+import re
+import pytest
+
+from src.utils import regex_backend
+from src.utils.regex_backend import ENGINE_ENV_VAR, compile_pattern
+
+
+# =============================================================================
+# compile_pattern Tests
+# =============================================================================
+
+class TestCompilePattern:
+    """Tests for rule pattern compilation."""
+
+    @pytest.mark.unit
+    def test_defaults_to_re(self, monkeypatch):
+        """Test patterns compile with re unless RE2 is requested."""
+        monkeypatch.delenv(ENGINE_ENV_VAR, raising=False)
+        pattern = compile_pattern(r"api[_-]?key", re.IGNORECASE)
+
+        assert isinstance(pattern, re.Pattern)
+        assert pattern.search("API_KEY = 1")
+
+    @pytest.mark.unit
+    def test_falls_back_when_re2_missing(self, monkeypatch):
+        """Test requesting RE2 without the package still compiles with re."""
+        monkeypatch.setenv(ENGINE_ENV_VAR, "re2")
+        monkeypatch.setattr(regex_backend, "re2", None)
+
+        assert not regex_backend.use_re2()
+        assert isinstance(compile_pattern(r"(?<=x)y"), re.Pattern)
@@ -72,6 +72,35 @@ class TestPatternCompilation:
             except re.error as e:
                 pytest.fail(f"Pattern '{pattern}' failed to compile: {e}")
 
+    @pytest.mark.unit
+    def test_risk_patterns_are_unique(self):
+        """Test that no pattern is listed twice across the risk tables."""
+        seen = {}
+        for table in (rules.HIGH_RISK_PATTERNS, rules.MEDIUM_RISK_PATTERNS, rules.LOW_RISK_PATTERNS):
+            for category, patterns in table.items():
+                for pattern, description in patterns:
+                    assert pattern not in seen, (
+                        f"Pattern '{pattern}' in '{category}' duplicates '{seen[pattern]}'"
+                    )
+                    seen[pattern] = category
+
+    @pytest.mark.unit
+    def test_patterns_do_not_hedge_case(self):
+        """Test that patterns rely on IGNORECASE instead of [Xx] case variants."""
+        hedge = re.compile(r"\[([a-zA-Z])([a-zA-Z])\]")
+        patterns = [
+            pattern
+            for table in (rules.HIGH_RISK_PATTERNS, rules.MEDIUM_RISK_PATTERNS, rules.LOW_RISK_PATTERNS)
+            for pattern_list in table.values()
+            for pattern, _ in pattern_list
+        ]
+        patterns += [pattern for pattern, _ in rules.SUSPICIOUS_PATTERNS]
+        patterns += rules.DEFAULT_WHITELIST_PATTERNS
+
+        for pattern in patterns:
+            for first, second in hedge.findall(pattern):
+                assert first.lower() != second.lower(), f"Pattern '{pattern}' hedges case"
+
 
 # =============================================================================
 # High Risk Pattern Matching Tests
@@ -330,6 +359,18 @@ class TestConfiguration:
         node_pattern = next(p for p in rules.IGNORE_PATTERNS if 'node_modules' in p)
         assert node_pattern is not None
     
+    @pytest.mark.unit
+    def test_ignore_patterns_agree_with_literals(self):
+        """Test that the deprecated IGNORE_PATTERNS match the names the scanner ignores."""
+        import re
+        names = rules.IGNORE_LITERALS | set(rules.IGNORE_SUFFIXES)
+        
+        assert len(rules.IGNORE_PATTERNS) == len(names)
+        for pattern in rules.IGNORE_PATTERNS:
+            assert [name for name in names if re.fullmatch(pattern, name)] == [
+                pattern.replace("\\", "")
+            ]
+    
     @pytest.mark.unit
     def test_safe_services_is_list(self):
         """Test that SAFE_SERVICES is a list."""
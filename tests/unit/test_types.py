@@ -225,7 +225,59 @@ class TestScanResult:
         assert summary["MEDIUM"] == 1
         assert summary["LOW"] == 1
         assert summary["INFO"] == 1
-    
+
+    @pytest.mark.unit
+    def test_risk_summary_tracks_findings_changes(self, get_mock_scan_result, get_mock_security_issue):
+        """Test risk_summary follows appended, replaced and edited findings."""
+        result = get_mock_scan_result(findings=[get_mock_security_issue(level=Severity.HIGH)])
+        summary = result.risk_summary
+        summary["HIGH"] = 99
+        assert result.risk_summary["HIGH"] == 1
+
+        result.findings.append(get_mock_security_issue(level=Severity.LOW))
+        assert result.risk_summary["LOW"] == 1
+
+        result.findings[1] = get_mock_security_issue(level=Severity.INFO)
+        assert result.risk_summary == {"HIGH": 1, "MEDIUM": 0, "LOW": 0, "INFO": 1}
+
+        result.findings[0].level = Severity.MEDIUM
+        assert result.risk_summary == {"HIGH": 0, "MEDIUM": 1, "LOW": 0, "INFO": 1}
+        assert result.security_assessment.startswith("🟢 CAUTION")
+
+        result.findings = [get_mock_security_issue(level=Severity.MEDIUM)]
+        assert result.risk_summary == {"HIGH": 0, "MEDIUM": 1, "LOW": 0, "INFO": 0}
+
+    @pytest.mark.unit
+    def test_to_dict_counts_severities_once(self, get_mock_scan_result, get_mock_security_issue, monkeypatch):
+        """Test to_dict derives the assessment from a single risk_summary count."""
+        result = get_mock_scan_result(findings=[get_mock_security_issue(level=Severity.HIGH)])
+        counted = []
+        real_summary = ScanResult.risk_summary.fget
+
+        def counting(self):
+            counted.append(self)
+            return real_summary(self)
+
+        monkeypatch.setattr(ScanResult, "risk_summary", property(counting))
+        data = result.to_dict()
+
+        assert len(counted) == 1
+        assert data["risk_summary"]["HIGH"] == 1
+        assert data["security_assessment"] == result.security_assessment
+
+    @pytest.mark.unit
+    def test_results_reject_unknown_attributes(self, get_mock_scan_result, get_mock_security_issue):
+        """Test that slotted results and issues carry no per-instance dict."""
+        import sys
+
+        if sys.version_info < (3, 10):
+            pytest.skip("slotted dataclasses need Python 3.10+")
+
+        for obj in (get_mock_scan_result(), get_mock_security_issue()):
+            assert not hasattr(obj, "__dict__")
+            with pytest.raises(AttributeError):
+                obj.not_a_field = True
+
     @pytest.mark.unit
     def test_security_assessment_critical(self, get_mock_scan_result, get_mock_security_issue):
         """Test security_assessment with HIGH severity findings."""